@@ -42,6 +42,11 @@ type csvFile struct {
 	path        string
 }
 
+// sheet 는 CSV 가 기록될 시트명("{증권사}_{계좌유형}")과 해외 계좌 여부를 반환한다.
+func (f csvFile) sheet() (name string, isForeign bool) {
+	return fmt.Sprintf("%s_%s", f.broker, f.accountType), strings.Contains(f.accountType, "해외")
+}
+
 // enrichDomesticCodes 는 국내 거래 중 종목코드가 비어있는 항목을 KRX 마스터로
 // 보강한다(in-place). 해외 거래와 이미 코드가 있는 거래는 건드리지 않는다.
 // (Python enrich_domestic_codes)
@@ -207,9 +212,8 @@ func newProcessor(ctx context.Context, dryRun bool, cfg *config.Config) (*proces
 // processFile 은 CSV 파일 하나를 처리해 시트에 삽입하고, 요약용으로 전체 Trade
 // 리스트를 반환한다. (Python process_file)
 func (p *processor) processFile(ctx context.Context, f csvFile) ([]model.Trade, error) {
-	sheetName := fmt.Sprintf("%s_%s", f.broker, f.accountType)
+	sheetName, isForeign := f.sheet()
 	account := sheetName
-	isForeign := strings.Contains(f.accountType, "해외")
 
 	// 1. 파서 감지 및 파싱
 	prs, err := parser.DetectParser(f.path)
@@ -234,8 +238,8 @@ func (p *processor) processFile(ctx context.Context, f csvFile) ([]model.Trade,
 		return trades[i].Date < trades[j].Date
 	})
 
-	// 2. 시트 존재 확인 → 없으면 생성
-	created, err := p.writer.EnsureSheetExists(ctx, sheetName, isForeign)
+	// 2. 시트 준비(없으면 생성) + 기존 키 로드 — 시트당 조회 1회
+	created, existingKeys, err := p.writer.PrepareSheet(ctx, sheetName, isForeign)
 	if err != nil {
 		return nil, err
 	}
@@ -244,10 +248,6 @@ func (p *processor) processFile(ctx context.Context, f csvFile) ([]model.Trade,
 	}
 
 	// 3. 중복 필터링
-	existingKeys, err := p.writer.GetExistingKeys(ctx, sheetName, isForeign)
-	if err != nil {
-		return nil, err
-	}
 	newTrades := make([]model.Trade, 0, len(trades))
 	for _, t := range trades {
 		if !existingKeys[t.DuplicateKey()] {
@@ -264,13 +264,13 @@ func (p *processor) processFile(ctx context.Context, f csvFile) ([]model.Trade,
 		return trades, nil // 요약용으로 전체 반환
 	}
 
-	// 4. 시트에 삽입
+	// 4. 시트 삽입 대기열에 추가 (모든 파일 처리 후 run 에서 1회 전송)
 	if !p.dryRun {
-		inserted, err := p.writer.InsertTrades(ctx, sheetName, newTrades, isForeign)
+		queued, err := p.writer.QueueTrades(ctx, sheetName, newTrades, isForeign)
 		if err != nil {
 			return nil, err
 		}
-		slog.Info(fmt.Sprintf("%s: %d건 삽입 완료", sheetName, inserted))
+		slog.Info(fmt.Sprintf("%s: %d건 삽입 대기", sheetName, queued))
 	} else {
 		slog.Info(fmt.Sprintf("[DRY-RUN] %s: %d건 삽입 예정", sheetName, len(newTrades)))
 	}
@@ -310,6 +310,16 @@ func (p *processor) run(ctx context.Context) error {
 	totalCSVTrades := 0
 
 	if len(csvFiles) > 0 {
+		// 대상 시트들의 헤더·기존 키를 1회 조회로 미리 읽는다. 실패하면 파일별 조회로 진행.
+		targets := make(map[string]bool, len(csvFiles))
+		for _, f := range csvFiles {
+			name, isForeign := f.sheet()
+			targets[name] = isForeign
+		}
+		if err := p.writer.PrefetchSheets(ctx, targets); err != nil {
+			slog.Warn(fmt.Sprintf("시트 일괄 조회 실패, 파일별로 조회합니다: %v", err))
+		}
+
 		for i, f := range csvFiles {
 			name := filepath.Base(f.path)
 			slog.Info(fmt.Sprintf("[%d/%d] %s 처리 중...", i+1, len(csvFiles), name))
@@ -325,6 +335,12 @@ func (p *processor) run(ctx context.Context) error {
 		slog.Info("처리할 CSV 파일이 없습니다")
 	}
 
+	// 모든 시트의 서식 정리·삽입 요청을 batchUpdate 1회로 전송. 대시보드가 시트를 다시 읽기 전에 끝나야 한다.
+	// 실패한 시트는 Flush 가 시트별로 걸러 내므로, 파일별 실패처럼 로그만 남기고 기록된 데이터로 계속한다.
+	if err := p.writer.Flush(ctx); err != nil {
+		slog.Error(err.Error())
+	}
+
 	// 2. 대시보드 갱신 (매매일지 시트에서 전체 데이터 읽기)
 	if !p.dryRun {
 		slog.Info("=== 대시보드 갱신 중 ===")
@@ -1,9 +1,6 @@
 package model
 
-import (
-	"strconv"
-	"strings"
-)
+import "strings"
 
 type Trade struct {
 	Date         string
@@ -30,8 +27,16 @@ type Trade struct {
 	Industry string
 }
 
-// DupKey: (date, trade_type, stock_name, quantity_str, price_str)
-type DupKey [5]string
+// DupKey: (date, trade_type, stock_name, quantity, price)
+// 수량/단가는 문자열(Python _num_str) 대신 float64 그대로 둔다. 같은 값이면 같은 키라
+// 비교 결과는 같고, 키마다 숫자→문자열 변환 할당이 없다.
+type DupKey struct {
+	Date      string
+	TradeType string
+	StockName string
+	Quantity  float64
+	Price     float64
+}
 
 func (t Trade) IsForeign() bool  { return strings.Contains(t.Account, "해외") }
 func (t Trade) IsDomestic() bool { return !t.IsForeign() }
@@ -66,14 +71,6 @@ func (t Trade) ToSheetRow() []any {
 	return t.ToDomesticRow()
 }
 
-// numStr: 정수면 소수점 제거 (Python _num_str)
-func numStr(v float64) string {
-	if v == float64(int64(v)) {
-		return strconv.FormatInt(int64(v), 10)
-	}
-	return strconv.FormatFloat(v, 'g', -1, 64)
-}
-
 func (t Trade) DuplicateKey() DupKey {
-	return DupKey{t.Date, t.TradeType, t.StockName, numStr(t.Quantity), numStr(t.Price)}
+	return DupKey{t.Date, t.TradeType, t.StockName, t.Quantity, t.Price}
 }
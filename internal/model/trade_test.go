@@ -47,7 +47,7 @@ func TestDuplicateKey_NumberNormalization(t *testing.T) {
 	tr := sampleDomestic()
 	tr.Quantity = 10
 	tr.Price = 70000
-	assert.Equal(t, DupKey{"2026-02-13", "매도", "삼성전자", "10", "70000"}, tr.DuplicateKey())
+	assert.Equal(t, DupKey{"2026-02-13", "매도", "삼성전자", 10, 70000}, tr.DuplicateKey())
 }
 
 func TestToDomesticRow_WithSectorIndustry(t *testing.T) {
@@ -20,7 +20,7 @@ func (HankookDomestic) Parse(path, account string) ([]model.Trade, error) {
 	if err != nil {
 		return nil, err
 	}
-	var out []model.Trade
+	out := make([]model.Trade, 0, len(rows))
 	for i := 1; i < len(rows); i++ {
 		row := rows[i]
 		if len(row) < 17 {
@@ -20,7 +20,8 @@ func (MiraeDomestic) Parse(path, account string) ([]model.Trade, error) {
 	if err != nil {
 		return nil, err
 	}
-	var out []model.Trade
+	// 행당 최대 2건(매수/매도)이지만 대부분 한쪽만 있어 행 수로 잡는다.
+	out := make([]model.Trade, 0, len(rows))
 	for i := 2; i < len(rows); i++ {
 		row := rows[i]
 		if len(row) < 11 {
@@ -70,7 +71,7 @@ func (MiraeForeign) Parse(path, account string) ([]model.Trade, error) {
 	if err != nil {
 		return nil, err
 	}
-	var out []model.Trade
+	out := make([]model.Trade, 0, len(rows))
 	for i := 1; i < len(rows); i++ {
 		row := rows[i]
 		if len(row) < 25 {
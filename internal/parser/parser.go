@@ -23,9 +23,15 @@ type Parser interface {
 	Parse(path string, account string) ([]model.Trade, error)
 }
 
+// utf8BOM 은 Excel 이 UTF-8 CSV 앞에 붙이는 BOM(U+FEFF).
+var utf8BOM = []byte{0xEF, 0xBB, 0xBF}
+
 // readCSVRows 는 CSV 파일을 읽어 모든 행을 반환한다. 증권사 CSV 는 CP949(EUC-KR)
 // 인코딩이 흔하므로, 내용이 유효한 UTF-8 이 아니면 CP949 로 디코딩한다.
 // (Python 은 run.sh 가 iconv 로 CP949→UTF-8 사전 변환했으나, Go 는 네이티브 처리한다.)
+//
+// UTF-8 BOM 은 파싱 전에 한 번 떼어낸다. 남겨두면 첫 셀 앞에 U+FEFF 가 붙어
+// 헤더 매칭이 빗나가고, 첫 필드가 따옴표로 시작하는 CSV 는 bare quote 에러로 읽기 자체가 실패한다.
 func readCSVRows(path string) ([][]string, error) {
 	data, err := os.ReadFile(path)
 	if err != nil {
@@ -38,6 +44,7 @@ func readCSVRows(path string) ([][]string, error) {
 			data = decoded
 		}
 	}
+	data = bytes.TrimPrefix(data, utf8BOM)
 	r := csv.NewReader(bytes.NewReader(data))
 	r.FieldsPerRecord = -1
 	return r.ReadAll()
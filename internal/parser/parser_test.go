@@ -1,9 +1,12 @@
 package parser
 
 import (
+	"os"
+	"path/filepath"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 )
 
 func TestParseFloat(t *testing.T) {
@@ -16,3 +19,23 @@ func TestConvertDate(t *testing.T) {
 	assert.Equal(t, "2026-02-13", convertDate(" 2026/02/13 "))
 	assert.Equal(t, "2026-02-13", convertDate("\"2026/02/13\""))
 }
+
+// Excel 로 저장한 UTF-8 CSV 는 BOM 이 붙는다. 첫 필드가 따옴표로 시작해도(한국투자증권)
+// 헤더 감지와 파싱이 BOM 없는 파일과 같아야 한다.
+func TestReadCSVRows_StripsUTF8BOM(t *testing.T) {
+	data, err := os.ReadFile("../../testdata/hankook_domestic.csv")
+	require.NoError(t, err)
+	path := filepath.Join(t.TempDir(), "bom.csv")
+	require.NoError(t, os.WriteFile(path, append([]byte{0xEF, 0xBB, 0xBF}, data...), 0o644))
+
+	header, err := readCSVHeader(path)
+	require.NoError(t, err)
+	assert.Equal(t, "매매일자", header[0])
+
+	p, err := DetectParser(path)
+	require.NoError(t, err)
+	assert.Equal(t, "HankookDomesticParser", p.Name())
+	trades, err := p.Parse(path, "한국투자증권_국내계좌")
+	require.NoError(t, err)
+	assert.Len(t, trades, 2)
+}
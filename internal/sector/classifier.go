@@ -6,14 +6,16 @@
 package sector
 
 import (
-	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log/slog"
+	"net/http"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	openai "github.com/sashabaranov/go-openai"
@@ -39,9 +41,42 @@ const systemPrompt = `당신은 주식 종목 섹터 분류 전문가입니다.
 규칙:
 - ETF는 주요 투자 대상 섹터로 분류
 - 분류 불가 시 "기타"
-- 반드시 JSON 형식으로만 응답: {"종목명": "섹터명", ...}
+- 반드시 JSON 형식으로만 응답: {"results": [{"name": "종목명", "sector": "섹터명"}, ...]}
 - 다른 텍스트 없이 JSON만 출력`
 
+// sectorSchema 는 응답 JSON 스키마(structured outputs, strict).
+// structured outputs 를 지원하지 않는 모델(cfg.OpenAI.Model 로 바꿀 수 있다)은 요청을 400 으로
+// 거부하므로, callOpenAI 는 그때 json_object 모드로 한 번 다시 요청한다.
+// strict 모드는 자유 키 맵(additionalProperties 스키마)을 허용하지 않아 {종목명: 섹터} 대신
+// results 배열로 받고, 섹터는 enum 으로 묶어 API 가 taxonomy 밖 값을 내지 않게 한다.
+// 시스템 프롬프트와 함께 매 호출 바이트 단위로 동일해야 OpenAI 프롬프트 캐시가 적중한다.
+var sectorSchema = func() json.RawMessage {
+	schema := map[string]any{
+		"type": "object",
+		"properties": map[string]any{
+			"results": map[string]any{
+				"type": "array",
+				"items": map[string]any{
+					"type": "object",
+					"properties": map[string]any{
+						"name":   map[string]any{"type": "string"},
+						"sector": map[string]any{"type": "string", "enum": Sectors},
+					},
+					"required":             []string{"name", "sector"},
+					"additionalProperties": false,
+				},
+			},
+		},
+		"required":             []string{"results"},
+		"additionalProperties": false,
+	}
+	b, err := json.Marshal(schema)
+	if err != nil {
+		panic(err) // 고정 리터럴이라 실패할 수 없다
+	}
+	return b
+}()
+
 // apiTimeout 은 OpenAI 호출 타임아웃. (Python timeout=30, py:122)
 const apiTimeout = 30 * time.Second
 
@@ -112,22 +147,36 @@ func (c *Classifier) saveCache() error {
 			return err
 		}
 	}
-	var buf bytes.Buffer
-	enc := json.NewEncoder(&buf)
+	// 전체 JSON 을 메모리 버퍼에 만든 뒤 한 번에 쓰지 않고 파일로 바로 인코딩한다
+	// (bizcat/fmpcat saveCache 와 같은 방식 — 캐시 크기만큼의 임시 버퍼가 생기지 않는다).
+	// os.Create(0666) 대신 기존 os.WriteFile 과 같은 0o644 권한으로 만든다.
+	f, err := os.OpenFile(c.cachePath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0o644)
+	if err != nil {
+		return err
+	}
+	enc := json.NewEncoder(f)
 	enc.SetEscapeHTML(false) // 한글 가독성 유지 (Python ensure_ascii=False)
 	enc.SetIndent("", "  ")
 	if err := enc.Encode(c.cache); err != nil {
+		f.Close()
 		return err
 	}
-	return os.WriteFile(c.cachePath, buf.Bytes(), 0o644)
+	return f.Close()
 }
 
 // Classify 는 종목 리스트를 섹터로 분류한다. (Python classify, py:63-102)
 func (c *Classifier) Classify(ctx context.Context, stocks []summary.SectorStock) (map[string]string, error) {
-	result := make(map[string]string)
+	result := make(map[string]string, len(stocks))
 	var uncached []summary.SectorStock
 
+	// 캐시·결과 키가 종목명이라 같은 이름은 한 번만 본다(첫 항목 우선).
+	// 같은 종목이 계좌/통화별로 여러 번 들어와도 캐시 조회와 OpenAI 프롬프트가 중복되지 않는다.
+	seen := make(map[string]bool, len(stocks))
 	for _, s := range stocks {
+		if seen[s.Name] {
+			continue
+		}
+		seen[s.Name] = true
 		if sec, ok := c.cache[s.Name]; ok {
 			result[s.Name] = sec
 		} else {
@@ -137,7 +186,7 @@ func (c *Classifier) Classify(ctx context.Context, stocks []summary.SectorStock)
 
 	// 전부 캐시면 네트워크 접근 없이 즉시 반환. (Python py:81-83)
 	if len(uncached) == 0 {
-		slog.Info("섹터 분류: 전체 캐시 사용", "count", len(stocks))
+		slog.Info("섹터 분류: 전체 캐시 사용", "count", len(result))
 		return result, nil
 	}
 
@@ -153,15 +202,26 @@ func (c *Classifier) Classify(ctx context.Context, stocks []summary.SectorStock)
 		}
 	}
 
+	// 두 호출은 서로 독립이라 동시에 보내 응답 대기를 겹친다. 결과 병합(캐시 갱신)은
+	// 둘 다 끝난 뒤 이 고루틴에서만 한다.
+	var domesticResult, foreignResult map[string]string
+	var wg sync.WaitGroup
 	if len(domestic) > 0 {
-		classified := c.callOpenAI(ctx, domestic, true)
-		for k, v := range classified {
-			result[k] = v
-			c.cache[k] = v
-		}
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			domesticResult = c.callOpenAI(ctx, domestic, true)
+		}()
 	}
 	if len(foreign) > 0 {
-		classified := c.callOpenAI(ctx, foreign, false)
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			foreignResult = c.callOpenAI(ctx, foreign, false)
+		}()
+	}
+	wg.Wait()
+	for _, classified := range []map[string]string{domesticResult, foreignResult} {
 		for k, v := range classified {
 			result[k] = v
 			c.cache[k] = v
@@ -199,7 +259,7 @@ func (c *Classifier) callOpenAI(ctx context.Context, stocks []summary.SectorStoc
 	callCtx, cancel := context.WithTimeout(ctx, apiTimeout)
 	defer cancel()
 
-	resp, err := c.client.CreateChatCompletion(callCtx, openai.ChatCompletionRequest{
+	req := openai.ChatCompletionRequest{
 		Model: c.model,
 		Messages: []openai.ChatCompletionMessage{
 			{Role: openai.ChatMessageRoleSystem, Content: systemPrompt},
@@ -207,16 +267,29 @@ func (c *Classifier) callOpenAI(ctx context.Context, stocks []summary.SectorStoc
 		},
 		Temperature: 0,
 		ResponseFormat: &openai.ChatCompletionResponseFormat{
-			Type: openai.ChatCompletionResponseFormatTypeJSONObject,
+			Type: openai.ChatCompletionResponseFormatTypeJSONSchema,
+			JSONSchema: &openai.ChatCompletionResponseFormatJSONSchema{
+				Name:   "sector_map",
+				Schema: sectorSchema,
+				Strict: true,
+			},
 		},
-	})
+	}
+	resp, err := c.client.CreateChatCompletion(callCtx, req)
+	var apiErr *openai.APIError
+	if errors.As(err, &apiErr) && apiErr.HTTPStatusCode == http.StatusBadRequest {
+		// 모델이 json_schema 를 지원하지 않으면 예전 json_object 모드로 한 번만 재시도한다.
+		slog.Warn("json_schema 응답 형식 거부 → json_object 로 재시도", "model", c.model, "error", err)
+		req.ResponseFormat = &openai.ChatCompletionResponseFormat{Type: openai.ChatCompletionResponseFormatTypeJSONObject}
+		resp, err = c.client.CreateChatCompletion(callCtx, req)
+	}
 	if err != nil || len(resp.Choices) == 0 {
 		slog.Error("OpenAI 섹터 분류 실패", "error", err)
 		return allOther(names)
 	}
 
-	var classified map[string]string
-	if err := json.Unmarshal([]byte(resp.Choices[0].Message.Content), &classified); err != nil {
+	classified, err := parseSectorResponse(resp.Choices[0].Message.Content)
+	if err != nil {
 		slog.Error("OpenAI 응답 파싱 실패", "error", err)
 		return allOther(names)
 	}
@@ -224,7 +297,39 @@ func (c *Classifier) callOpenAI(ctx context.Context, stocks []summary.SectorStoc
 	return validateSectors(classified, names)
 }
 
+// parseSectorResponse 는 응답을 {종목명: 섹터} 맵으로 바꾼다.
+// sectorSchema 형식({"results": [...]})이 기본이고, json_object 모드에서 모델이 예전 형식
+// {"종목명": "섹터명"} 으로 답한 경우도 그대로 받는다.
+func parseSectorResponse(content string) (map[string]string, error) {
+	var raw map[string]json.RawMessage
+	if err := json.Unmarshal([]byte(content), &raw); err != nil {
+		return nil, err
+	}
+	results, ok := raw["results"]
+	if !ok {
+		var classified map[string]string
+		if err := json.Unmarshal([]byte(content), &classified); err != nil {
+			return nil, err
+		}
+		return classified, nil
+	}
+	var out []struct {
+		Name   string `json:"name"`
+		Sector string `json:"sector"`
+	}
+	if err := json.Unmarshal(results, &out); err != nil {
+		return nil, err
+	}
+	classified := make(map[string]string, len(out))
+	for _, r := range out {
+		classified[r.Name] = r.Sector
+	}
+	return classified, nil
+}
+
 // validateSectors 는 응답을 검증한다: 알 수 없는 섹터→"기타", 누락 종목→"기타".
+// strict 스키마가 섹터 값을 enum 으로 묶지만 종목 누락은 스키마로 막을 수 없고,
+// json_object 재시도 응답에는 enum 제약이 없어 검증은 그대로 둔다.
 // (Python py:127-142)
 func validateSectors(classified map[string]string, names []string) map[string]string {
 	valid := make(map[string]string, len(names))
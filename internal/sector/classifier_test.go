@@ -3,11 +3,16 @@ package sector
 import (
 	"context"
 	"encoding/json"
+	"net/http"
+	"net/http/httptest"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync/atomic"
 	"testing"
+	"time"
 
+	openai "github.com/sashabaranov/go-openai"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 
@@ -39,6 +44,41 @@ func TestValidateSectors_AllValid(t *testing.T) {
 	assert.Equal(t, in, out)
 }
 
+func TestParseSectorResponse(t *testing.T) {
+	got, err := parseSectorResponse(`{"results":[{"name":"삼성전자","sector":"IT"},{"name":"현대차","sector":"경기소비재"}]}`)
+	require.NoError(t, err)
+	assert.Equal(t, map[string]string{"삼성전자": "IT", "현대차": "경기소비재"}, got)
+
+	_, err = parseSectorResponse("{ not json")
+	assert.Error(t, err)
+}
+
+// json_object 재시도 응답이 예전 {종목명: 섹터} 형식이어도 받아야 한다.
+func TestParseSectorResponse_FlatMap(t *testing.T) {
+	got, err := parseSectorResponse(`{"삼성전자":"IT","현대차":"경기소비재"}`)
+	require.NoError(t, err)
+	assert.Equal(t, map[string]string{"삼성전자": "IT", "현대차": "경기소비재"}, got)
+}
+
+// 스키마의 섹터 enum 이 Sectors 와 같아야 API 가 taxonomy 밖 값을 내지 않는다.
+func TestSectorSchema_EnumMatchesSectors(t *testing.T) {
+	var schema struct {
+		Properties struct {
+			Results struct {
+				Items struct {
+					Properties struct {
+						Sector struct {
+							Enum []string `json:"enum"`
+						} `json:"sector"`
+					} `json:"properties"`
+				} `json:"items"`
+			} `json:"results"`
+		} `json:"properties"`
+	}
+	require.NoError(t, json.Unmarshal(sectorSchema, &schema))
+	assert.Equal(t, Sectors, schema.Properties.Results.Items.Properties.Sector.Enum)
+}
+
 func TestCacheRoundTrip(t *testing.T) {
 	dir := t.TempDir()
 	path := filepath.Join(dir, "nested", "sector_cache.json")
@@ -99,6 +139,97 @@ func TestClassify_FullyCached(t *testing.T) {
 	assert.Equal(t, map[string]string{"삼성전자": "IT", "애플": "IT"}, got)
 }
 
+// 같은 종목명이 여러 번 들어와도(계좌/통화별) 한 번만 조회해 결과 키는 하나다.
+func TestClassify_DuplicateNames(t *testing.T) {
+	c := &Classifier{cache: map[string]string{"삼성전자": "IT"}}
+	got, err := c.Classify(context.Background(), []summary.SectorStock{
+		{Name: "삼성전자", Code: "005930", Currency: "KRW"},
+		{Name: "삼성전자", Code: "005930", Currency: "KRW"},
+		{Name: "삼성전자", Code: "", Currency: "KRW"},
+	})
+	require.NoError(t, err)
+	assert.Equal(t, map[string]string{"삼성전자": "IT"}, got)
+}
+
+// 국내·해외 미캐시 종목이 모두 있으면 두 OpenAI 호출이 동시에 나가야 한다.
+// 서버는 두 요청이 모두 도착할 때까지(최대 2초) 응답을 미뤄, 순차 호출이면 동시 요청 수가 1에 그친다.
+func TestClassify_CallsDomesticAndForeignConcurrently(t *testing.T) {
+	var inFlight, maxInFlight int32
+	arrived := make(chan struct{}, 2)
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		n := atomic.AddInt32(&inFlight, 1)
+		defer atomic.AddInt32(&inFlight, -1)
+		for {
+			m := atomic.LoadInt32(&maxInFlight)
+			if n <= m || atomic.CompareAndSwapInt32(&maxInFlight, m, n) {
+				break
+			}
+		}
+		arrived <- struct{}{}
+		deadline := time.Now().Add(2 * time.Second)
+		for len(arrived) < 2 && time.Now().Before(deadline) {
+			time.Sleep(5 * time.Millisecond)
+		}
+		content := `{"results":[{"name":"삼성전자","sector":"IT"},{"name":"애플","sector":"IT"}]}`
+		body, _ := json.Marshal(openai.ChatCompletionResponse{
+			Choices: []openai.ChatCompletionChoice{{Message: openai.ChatCompletionMessage{
+				Role: openai.ChatMessageRoleAssistant, Content: content,
+			}}},
+		})
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write(body)
+	}))
+	defer srv.Close()
+
+	cfg := openai.DefaultConfig("test-key")
+	cfg.BaseURL = srv.URL
+	c := &Classifier{client: openai.NewClientWithConfig(cfg), model: "test", cache: map[string]string{}}
+
+	got, err := c.Classify(context.Background(), []summary.SectorStock{
+		{Name: "삼성전자", Code: "005930", Currency: "KRW"},
+		{Name: "애플", Code: "AAPL", Currency: "USD"},
+	})
+	require.NoError(t, err)
+	assert.Equal(t, "IT", got["삼성전자"])
+	assert.Equal(t, "IT", got["애플"])
+	assert.Equal(t, int32(2), atomic.LoadInt32(&maxInFlight), "국내·해외 호출이 겹쳐야 한다")
+	assert.Equal(t, "IT", c.cache["애플"], "결과는 캐시에 병합")
+}
+
+// 모델이 json_schema 를 400 으로 거부하면 json_object 로 한 번 재시도해 분류 결과를 살린다.
+func TestClassify_FallsBackToJSONObjectOnSchemaRejection(t *testing.T) {
+	var formats []string
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var req openai.ChatCompletionRequest
+		require.NoError(t, json.NewDecoder(r.Body).Decode(&req))
+		formats = append(formats, string(req.ResponseFormat.Type))
+		w.Header().Set("Content-Type", "application/json")
+		if req.ResponseFormat.Type == openai.ChatCompletionResponseFormatTypeJSONSchema {
+			w.WriteHeader(http.StatusBadRequest)
+			_, _ = w.Write([]byte(`{"error":{"message":"response_format json_schema is not supported with this model","type":"invalid_request_error"}}`))
+			return
+		}
+		body, _ := json.Marshal(openai.ChatCompletionResponse{
+			Choices: []openai.ChatCompletionChoice{{Message: openai.ChatCompletionMessage{
+				Role: openai.ChatMessageRoleAssistant, Content: `{"삼성전자":"IT"}`,
+			}}},
+		})
+		_, _ = w.Write(body)
+	}))
+	defer srv.Close()
+
+	cfg := openai.DefaultConfig("test-key")
+	cfg.BaseURL = srv.URL
+	c := &Classifier{client: openai.NewClientWithConfig(cfg), model: "gpt-4", cache: map[string]string{}}
+
+	got, err := c.Classify(context.Background(), []summary.SectorStock{
+		{Name: "삼성전자", Code: "005930", Currency: "KRW"},
+	})
+	require.NoError(t, err)
+	assert.Equal(t, map[string]string{"삼성전자": "IT"}, got)
+	assert.Equal(t, []string{"json_schema", "json_object"}, formats)
+}
+
 // TestInterfaceSatisfied 는 *Classifier 가 summary.SectorClassifier 를 만족함을 확인.
 func TestInterfaceSatisfied(t *testing.T) {
 	var _ summary.SectorClassifier = (*Classifier)(nil)
@@ -25,28 +25,56 @@ func (c *Client) GetCharts(ctx context.Context, sheetName string) ([]*gsheets.Em
 	return nil, nil
 }
 
-// DeleteAllCharts 는 지정 시트의 모든 차트를 삭제한다. (Python delete_all_charts)
-// 차트가 없으면 아무 것도 하지 않는다.
-func (c *Client) DeleteAllCharts(ctx context.Context, sheetName string) error {
-	charts, err := c.GetCharts(ctx, sheetName)
-	if err != nil {
+// GetSheetChartIDs 는 메타데이터 1회 조회로 시트의 sheetId 와 차트 ID 목록을 반환한다.
+// 삭제에는 chartId 만 필요해 차트 스펙은 받지 않는다. 응답의 시트 이름 → sheetId 는 ID 캐시에도 채운다.
+// 반환값: (sheetId, 차트 ID 목록, 발견 여부, error).
+func (c *Client) GetSheetChartIDs(ctx context.Context, sheetName string) (int64, []int64, bool, error) {
+	var ss *gsheets.Spreadsheet
+	err := executeWithRetry(ctx, func() error {
+		var err error
+		ss, err = c.service.Spreadsheets.Get(c.spreadsheetID).
+			Fields("sheets(properties(sheetId,title),charts.chartId)").
+			Context(ctx).Do()
 		return err
+	})
+	if err != nil {
+		return 0, nil, false, fmt.Errorf("스프레드시트 메타데이터 조회 실패: %w", err)
 	}
-	if len(charts) == 0 {
-		return nil
+	c.cacheSheetIDs(ss)
+	for _, s := range ss.Sheets {
+		if s.Properties == nil || s.Properties.Title != sheetName {
+			continue
+		}
+		ids := make([]int64, 0, len(s.Charts))
+		for _, ch := range s.Charts {
+			ids = append(ids, ch.ChartId)
+		}
+		return s.Properties.SheetId, ids, true, nil
 	}
-	reqs := make([]*gsheets.Request, 0, len(charts))
-	for _, ch := range charts {
+	return 0, nil, false, nil
+}
+
+// buildChartDeleteRequests 는 차트 ID 마다 deleteEmbeddedObject 요청을 만든다.
+func buildChartDeleteRequests(chartIDs []int64) []*gsheets.Request {
+	reqs := make([]*gsheets.Request, 0, len(chartIDs))
+	for _, id := range chartIDs {
 		reqs = append(reqs, &gsheets.Request{
-			DeleteEmbeddedObject: &gsheets.DeleteEmbeddedObjectRequest{
-				ObjectId: ch.ChartId,
-			},
+			DeleteEmbeddedObject: &gsheets.DeleteEmbeddedObjectRequest{ObjectId: id},
 		})
 	}
-	if err := c.batchUpdate(ctx, reqs); err != nil {
-		return fmt.Errorf("차트 삭제 실패 (%s): %w", sheetName, err)
+	return reqs
+}
+
+// BuildAddChartRequests 는 차트 스펙들을 addChart 요청으로 만든다(API 호출 없음).
+// 다른 포맷 요청과 모아 ExecuteBatchRequests 로 1회 전송할 수 있다.
+func BuildAddChartRequests(chartSpecs []*gsheets.EmbeddedChart) []*gsheets.Request {
+	reqs := make([]*gsheets.Request, 0, len(chartSpecs))
+	for _, spec := range chartSpecs {
+		reqs = append(reqs, &gsheets.Request{
+			AddChart: &gsheets.AddChartRequest{Chart: spec},
+		})
 	}
-	return nil
+	return reqs
 }
 
 // AddCharts 는 여러 차트를 한 번의 batchUpdate 로 추가한다. (Python add_charts)
@@ -55,13 +83,7 @@ func (c *Client) AddCharts(ctx context.Context, chartSpecs []*gsheets.EmbeddedCh
 	if len(chartSpecs) == 0 {
 		return nil
 	}
-	reqs := make([]*gsheets.Request, 0, len(chartSpecs))
-	for _, spec := range chartSpecs {
-		reqs = append(reqs, &gsheets.Request{
-			AddChart: &gsheets.AddChartRequest{Chart: spec},
-		})
-	}
-	if err := c.batchUpdate(ctx, reqs); err != nil {
+	if err := c.batchUpdate(ctx, BuildAddChartRequests(chartSpecs)); err != nil {
 		return fmt.Errorf("차트 추가 실패: %w", err)
 	}
 	return nil
@@ -5,6 +5,7 @@ package sheets
 import (
 	"context"
 	"fmt"
+	"strings"
 
 	"google.golang.org/api/option"
 	gsheets "google.golang.org/api/sheets/v4"
@@ -20,6 +21,8 @@ type Client struct {
 
 	// sheetIDCache 는 시트 이름 → sheetId 캐시. nil 이면 미초기화.
 	sheetIDCache map[string]int64
+	// sheetNames 는 시트 이름 목록 캐시(메타데이터 순서). nil 이면 미조회.
+	sheetNames []string
 }
 
 // New 는 서비스 계정 키로 인증된 Client 를 생성한다. (Python __init__/_connect)
@@ -64,48 +67,77 @@ func (c *Client) GetSpreadsheetMetadata(ctx context.Context) (*gsheets.Spreadshe
 	return ss, nil
 }
 
+// sheetPropertiesFields 는 시트 목록·ID 조회에 필요한 필드만 받는 마스크다.
+// 전체 메타데이터(차트·조건부 서식·보호 범위 등)를 받지 않아 응답이 작다.
+const sheetPropertiesFields = "sheets.properties(sheetId,title)"
+
+// getSheetProperties 는 시트별 sheetId·title 만 담은 메타데이터를 조회한다.
+func (c *Client) getSheetProperties(ctx context.Context) (*gsheets.Spreadsheet, error) {
+	var ss *gsheets.Spreadsheet
+	err := executeWithRetry(ctx, func() error {
+		var err error
+		ss, err = c.service.Spreadsheets.Get(c.spreadsheetID).
+			Fields(sheetPropertiesFields).
+			Context(ctx).Do()
+		return err
+	})
+	if err != nil {
+		return nil, fmt.Errorf("스프레드시트 메타데이터 조회 실패: %w", err)
+	}
+	return ss, nil
+}
+
 // ListSheets 는 스프레드시트의 모든 시트 이름을 반환한다. (Python list_sheets)
+// 목록은 시트 ID 캐시와 함께 캐시되어, 한 실행 안의 시트 확인·전체 읽기·대시보드 확보가
+// 메타데이터를 한 번만 받는다(시트 생성/삭제 시 InvalidateSheetIDCache 로 무효화).
+// 반환 슬라이스는 호출측 소유의 복사본이다.
 func (c *Client) ListSheets(ctx context.Context) ([]string, error) {
-	ss, err := c.GetSpreadsheetMetadata(ctx)
-	if err != nil {
-		return nil, err
+	if c.sheetNames == nil {
+		ss, err := c.getSheetProperties(ctx)
+		if err != nil {
+			return nil, err
+		}
+		c.cacheSheetIDs(ss)
+	}
+	return append([]string(nil), c.sheetNames...), nil
+}
+
+// cacheSheetIDs 는 메타데이터의 시트 이름 → sheetId 와 시트 이름 목록을 캐시에 채운다.
+func (c *Client) cacheSheetIDs(ss *gsheets.Spreadsheet) {
+	if c.sheetIDCache == nil {
+		c.sheetIDCache = make(map[string]int64)
 	}
 	names := make([]string, 0, len(ss.Sheets))
 	for _, s := range ss.Sheets {
 		if s.Properties == nil {
 			continue
 		}
+		c.sheetIDCache[s.Properties.Title] = s.Properties.SheetId
 		names = append(names, s.Properties.Title)
 	}
-	return names, nil
+	c.sheetNames = names
 }
 
 // GetSheetID 는 시트 이름으로 sheetId 를 반환한다(내부 캐시). (Python get_sheet_id)
 // 반환값: (sheetId, 발견 여부, error).
 func (c *Client) GetSheetID(ctx context.Context, name string) (int64, bool, error) {
-	if c.sheetIDCache == nil {
-		c.sheetIDCache = make(map[string]int64)
-	}
 	if id, ok := c.sheetIDCache[name]; ok {
 		return id, true, nil
 	}
-	ss, err := c.GetSpreadsheetMetadata(ctx)
+	ss, err := c.getSheetProperties(ctx)
 	if err != nil {
 		return 0, false, err
 	}
-	for _, s := range ss.Sheets {
-		if s.Properties == nil {
-			continue
-		}
-		c.sheetIDCache[s.Properties.Title] = s.Properties.SheetId
-	}
+	c.cacheSheetIDs(ss)
 	id, ok := c.sheetIDCache[name]
 	return id, ok, nil
 }
 
-// InvalidateSheetIDCache 는 시트 ID 캐시를 초기화한다(시트 생성/삭제 후 호출). (Python invalidate_sheet_id_cache)
+// InvalidateSheetIDCache 는 시트 ID·이름 목록 캐시를 초기화한다(시트 생성/삭제 후 호출).
+// (Python invalidate_sheet_id_cache)
 func (c *Client) InvalidateSheetIDCache() {
 	c.sheetIDCache = make(map[string]int64)
+	c.sheetNames = nil
 }
 
 // InsertColumns 는 시트의 startIdx(0-based) 위치에 count 개 빈 열을 삽입한다.
@@ -131,6 +163,9 @@ func (c *Client) InsertColumns(ctx context.Context, sheetName string, startIdx,
 	}})
 }
 
+// gridFields 는 그리드 조회에서 셀의 effectiveValue·formattedValue 만 받는 마스크다.
+const gridFields = "sheets.data.rowData.values(effectiveValue,formattedValue)"
+
 // GetRawGridData 는 effectiveValue + formattedValue 를 함께 조회한다. (Python get_raw_grid_data)
 // sheetName 과 rangeA1(예: "A2:O10000")을 받아 내부에서 "sheetName!rangeA1" 로 조합한다.
 func (c *Client) GetRawGridData(ctx context.Context, sheetName, rangeA1 string) (*gsheets.GridData, error) {
@@ -140,7 +175,7 @@ func (c *Client) GetRawGridData(ctx context.Context, sheetName, rangeA1 string)
 		var err error
 		resp, err = c.service.Spreadsheets.Get(c.spreadsheetID).
 			Ranges(rangeName).
-			Fields("sheets.data.rowData.values(effectiveValue,formattedValue)").
+			Fields(gridFields).
 			Context(ctx).Do()
 		return err
 	})
@@ -155,12 +190,79 @@ func (c *Client) GetRawGridData(ctx context.Context, sheetName, rangeA1 string)
 	return &gsheets.GridData{}, nil
 }
 
+// GetRawGridDataMulti 는 여러 시트의 같은 범위(rangeA1)를 Spreadsheets.Get 1회로 읽는다.
+// 응답은 스프레드시트의 시트 순서로 오므로 제목으로 찾아 sheetNames 순서대로 담는다.
+// 데이터가 없는 시트는 빈 GridData. sheetNames 에 같은 제목이 두 번 오면 안 된다.
+func (c *Client) GetRawGridDataMulti(ctx context.Context, sheetNames []string, rangeA1 string) ([]*gsheets.GridData, error) {
+	ranges := make([]string, len(sheetNames))
+	for i, name := range sheetNames {
+		ranges[i] = fmt.Sprintf("%s!%s", name, rangeA1)
+	}
+	var resp *gsheets.Spreadsheet
+	err := executeWithRetry(ctx, func() error {
+		var err error
+		resp, err = c.service.Spreadsheets.Get(c.spreadsheetID).
+			Ranges(ranges...).
+			Fields("sheets(properties.title,data.rowData.values(effectiveValue,formattedValue))").
+			Context(ctx).Do()
+		return err
+	})
+	if err != nil {
+		return nil, fmt.Errorf("시트 GridData 일괄 조회 실패(%s): %w", strings.Join(sheetNames, ", "), err)
+	}
+	byTitle := make(map[string]*gsheets.GridData, len(resp.Sheets))
+	for _, s := range resp.Sheets {
+		if s.Properties == nil || len(s.Data) == 0 {
+			continue
+		}
+		byTitle[s.Properties.Title] = s.Data[0]
+	}
+	out := make([]*gsheets.GridData, len(sheetNames))
+	for i, name := range sheetNames {
+		if d := byTitle[name]; d != nil {
+			out[i] = d
+		} else {
+			out[i] = &gsheets.GridData{}
+		}
+	}
+	return out, nil
+}
+
+// valuesFields/batchValuesFields 는 값 조회 응답에서 셀 값 배열만 받는 마스크다.
+// range/majorDimension 등 나머지 필드를 빼 디코딩할 JSON 을 줄인다.
+const (
+	valuesFields      = "values"
+	batchValuesFields = "valueRanges(values)"
+)
+
 // GetValues 는 지정한 A1 범위(예: "SheetName!A1:Z")의 값을 반환한다. (Python get_sheet_data)
 func (c *Client) GetValues(ctx context.Context, rangeA1 string) ([][]interface{}, error) {
 	var resp *gsheets.ValueRange
 	err := executeWithRetry(ctx, func() error {
 		var err error
-		resp, err = c.service.Spreadsheets.Values.Get(c.spreadsheetID, rangeA1).Context(ctx).Do()
+		resp, err = c.service.Spreadsheets.Values.Get(c.spreadsheetID, rangeA1).
+			Fields(valuesFields).
+			Context(ctx).Do()
+		return err
+	})
+	if err != nil {
+		return nil, fmt.Errorf("시트 데이터 조회 실패: %w", err)
+	}
+	return resp.Values, nil
+}
+
+// GetUnformattedValues 는 지정한 A1 범위의 값을 표시 형식 없이 반환한다.
+// 숫자는 원본 float64(UNFORMATTED_VALUE), 날짜 서식 셀은 표시 문자열(FORMATTED_STRING)로 온다.
+// 셀마다 CellData 객체가 오는 GridData 보다 응답이 훨씬 작다.
+func (c *Client) GetUnformattedValues(ctx context.Context, rangeA1 string) ([][]interface{}, error) {
+	var resp *gsheets.ValueRange
+	err := executeWithRetry(ctx, func() error {
+		var err error
+		resp, err = c.service.Spreadsheets.Values.Get(c.spreadsheetID, rangeA1).
+			ValueRenderOption("UNFORMATTED_VALUE").
+			DateTimeRenderOption("FORMATTED_STRING").
+			Fields(valuesFields).
+			Context(ctx).Do()
 		return err
 	})
 	if err != nil {
@@ -169,6 +271,32 @@ func (c *Client) GetValues(ctx context.Context, rangeA1 string) ([][]interface{}
 	return resp.Values, nil
 }
 
+// BatchGetUnformattedValues 는 여러 A1 범위를 values.batchGet 1회로 읽는다.
+// 렌더 옵션은 GetUnformattedValues 와 같고, 결과는 ranges 순서대로 담긴다.
+func (c *Client) BatchGetUnformattedValues(ctx context.Context, ranges []string) ([][][]interface{}, error) {
+	var resp *gsheets.BatchGetValuesResponse
+	err := executeWithRetry(ctx, func() error {
+		var err error
+		resp, err = c.service.Spreadsheets.Values.BatchGet(c.spreadsheetID).
+			Ranges(ranges...).
+			ValueRenderOption("UNFORMATTED_VALUE").
+			DateTimeRenderOption("FORMATTED_STRING").
+			Fields(batchValuesFields).
+			Context(ctx).Do()
+		return err
+	})
+	if err != nil {
+		return nil, fmt.Errorf("시트 데이터 일괄 조회 실패: %w", err)
+	}
+	out := make([][][]interface{}, len(ranges))
+	for i, vr := range resp.ValueRanges {
+		if i < len(out) && vr != nil {
+			out[i] = vr.Values
+		}
+	}
+	return out, nil
+}
+
 // UpdateCells 는 지정한 A1 범위에 값을 기록한다(USER_ENTERED). (Python update_cells)
 func (c *Client) UpdateCells(ctx context.Context, rangeA1 string, data [][]interface{}) error {
 	vr := &gsheets.ValueRange{Values: data}
@@ -203,16 +331,3 @@ func (c *Client) BatchUpdateValues(ctx context.Context, ranges map[string][][]in
 	}
 	return nil
 }
-
-// ClearValues 는 지정한 A1 범위(예: "SheetName!A2:Z")의 값을 비운다. (Python clear_sheet)
-func (c *Client) ClearValues(ctx context.Context, rangeA1 string) error {
-	err := executeWithRetry(ctx, func() error {
-		_, err := c.service.Spreadsheets.Values.Clear(c.spreadsheetID, rangeA1, &gsheets.ClearValuesRequest{}).
-			Context(ctx).Do()
-		return err
-	})
-	if err != nil {
-		return fmt.Errorf("시트 데이터 삭제 실패: %w", err)
-	}
-	return nil
-}
@@ -1,6 +1,14 @@
 package sheets
 
-import "testing"
+import (
+	"context"
+	"net/http"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
 
 // TestInvalidateSheetIDCache 는 캐시 무효화가 맵을 비우고(재사용 가능한) 빈 맵으로
 // 재초기화하는지 네트워크 없이 검증한다.
@@ -32,3 +40,149 @@ func TestInvalidateSheetIDCacheZeroValue(t *testing.T) {
 		t.Fatal("zero-value Client 무효화 후 빈 맵이어야 한다")
 	}
 }
+
+// ListSheets 가 받은 메타데이터로 시트 ID 캐시를 채우므로, 이어지는 GetSheetID 는
+// 메타데이터를 다시 조회하지 않는다.
+func TestListSheetsFillsSheetIDCache(t *testing.T) {
+	var hits int32
+	var fields string
+	c := newFakeClient(t, func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&hits, 1)
+		fields = r.URL.Query().Get("fields")
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"sheets":[{"properties":{"title":"시트A","sheetId":0}},` +
+			`{"properties":{"title":"시트B","sheetId":7}}]}`))
+	})
+	ctx := context.Background()
+
+	names, err := c.ListSheets(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"시트A", "시트B"}, names)
+	assert.Equal(t, sheetPropertiesFields, fields, "시트 ID·이름만 받는다")
+
+	id, ok, err := c.GetSheetID(ctx, "시트B")
+	require.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, int64(7), id)
+	assert.Equal(t, int32(1), atomic.LoadInt32(&hits), "메타데이터 조회는 1회")
+}
+
+// 시트 목록은 캐시되어 다시 조회하지 않고, 무효화 후에만 메타데이터를 다시 받는다.
+// 반환 슬라이스를 고쳐도 캐시는 바뀌지 않는다.
+func TestListSheetsCachesNames(t *testing.T) {
+	var hits int32
+	c := newFakeClient(t, func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&hits, 1)
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"sheets":[{"properties":{"title":"시트A","sheetId":0}}]}`))
+	})
+	ctx := context.Background()
+
+	names, err := c.ListSheets(ctx)
+	require.NoError(t, err)
+	names[0] = "변경"
+	names, err = c.ListSheets(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"시트A"}, names)
+	assert.Equal(t, int32(1), atomic.LoadInt32(&hits), "메타데이터 조회는 1회")
+
+	c.InvalidateSheetIDCache()
+	_, err = c.ListSheets(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, int32(2), atomic.LoadInt32(&hits), "무효화 후 재조회")
+}
+
+// 일괄 조회는 셀 값 배열만 받도록 필드 마스크를 붙이고, 결과를 요청 범위 순서대로 돌려준다.
+func TestBatchGetUnformattedValuesUsesValuesMask(t *testing.T) {
+	var fields string
+	c := newFakeClient(t, func(w http.ResponseWriter, r *http.Request) {
+		fields = r.URL.Query().Get("fields")
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"valueRanges":[{"values":[["a"]]},{}]}`))
+	})
+
+	got, err := c.BatchGetUnformattedValues(context.Background(), []string{"시트!A1:B1", "시트!A2:B2"})
+	require.NoError(t, err)
+	assert.Equal(t, batchValuesFields, fields)
+	require.Len(t, got, 2)
+	assert.Equal(t, [][]interface{}{{"a"}}, got[0])
+	assert.Empty(t, got[1], "빈 범위는 값 없음")
+}
+
+// 여러 시트 그리드 일괄 조회는 요청 1회로 보내고, 응답이 시트 순서와 달라도 제목으로
+// 찾아 요청 순서대로 돌려준다. 데이터가 없는 시트는 빈 GridData.
+func TestGetRawGridDataMultiMapsByTitle(t *testing.T) {
+	var hits int32
+	var ranges []string
+	c := newFakeClient(t, func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&hits, 1)
+		ranges = r.URL.Query()["ranges"]
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"sheets":[` +
+			`{"properties":{"title":"B"},"data":[{"rowData":[{"values":[{"formattedValue":"b"}]}]}]},` +
+			`{"properties":{"title":"A"},"data":[{"rowData":[{"values":[{"formattedValue":"a"}]}]}]}]}`))
+	})
+
+	grids, err := c.GetRawGridDataMulti(context.Background(), []string{"A", "B", "C"}, "A1:Q10")
+	require.NoError(t, err)
+	assert.Equal(t, int32(1), atomic.LoadInt32(&hits))
+	assert.Equal(t, []string{"A!A1:Q10", "B!A1:Q10", "C!A1:Q10"}, ranges)
+	require.Len(t, grids, 3)
+	assert.Equal(t, "a", grids[0].RowData[0].Values[0].FormattedValue)
+	assert.Equal(t, "b", grids[1].RowData[0].Values[0].FormattedValue)
+	assert.Empty(t, grids[2].RowData)
+}
+
+// GetSheetChartIDs 는 메타데이터 1회로 대상 시트의 sheetId·차트 ID 를 받고, 다른 시트 ID 도 캐시에 채운다.
+func TestGetSheetChartIDsReadsOnce(t *testing.T) {
+	var gets int
+	var fields string
+	c := newFakeClient(t, func(w http.ResponseWriter, r *http.Request) {
+		gets++
+		fields = r.URL.Query().Get("fields")
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`{"sheets":[{"properties":{"title":"대시보드","sheetId":5},` +
+			`"charts":[{"chartId":11},{"chartId":12}]},{"properties":{"title":"기타","sheetId":6},` +
+			`"charts":[{"chartId":99}]}]}`))
+	})
+	ctx := context.Background()
+
+	id, charts, ok, err := c.GetSheetChartIDs(ctx, "대시보드")
+	require.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, int64(5), id)
+	assert.Equal(t, []int64{11, 12}, charts, "다른 시트 차트는 포함하지 않는다")
+	assert.Contains(t, fields, "charts.chartId")
+
+	other, ok, err := c.GetSheetID(ctx, "기타")
+	require.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, int64(6), other)
+	assert.Equal(t, 1, gets, "sheetId 는 같은 응답으로 캐시된다")
+
+	_, _, ok, err = c.GetSheetChartIDs(ctx, "없는시트")
+	require.NoError(t, err)
+	assert.False(t, ok)
+}
+
+// 초기화 요청은 값 비우기(전체 행) → 배경색·숫자 포맷 초기화 → 차트 삭제 순서다.
+func TestBuildResetSheetRequests(t *testing.T) {
+	reqs := BuildResetSheetRequests(5, []int64{11, 12}, 1000, 26)
+
+	require.Len(t, reqs, 4, "값 비우기 1 + 서식 초기화 1 + 차트 삭제 2")
+	uc := reqs[0].UpdateCells
+	require.NotNil(t, uc)
+	assert.Equal(t, "userEnteredValue", uc.Fields)
+	assert.Equal(t, int64(5), uc.Range.SheetId)
+	assert.Zero(t, uc.Range.EndRowIndex, "끝 행 생략 → 시트 전체 행")
+	assert.Equal(t, int64(26), uc.Range.EndColumnIndex)
+	rc := reqs[1].RepeatCell
+	require.NotNil(t, rc)
+	assert.Contains(t, rc.Fields, "backgroundColor")
+	assert.Contains(t, rc.Fields, "numberFormat")
+	assert.Equal(t, int64(1000), rc.Range.EndRowIndex)
+	assert.Equal(t, int64(11), reqs[2].DeleteEmbeddedObject.ObjectId)
+	assert.Equal(t, int64(12), reqs[3].DeleteEmbeddedObject.ObjectId)
+
+	assert.Len(t, BuildResetSheetRequests(5, nil, 1000, 26), 2, "차트가 없으면 삭제 요청도 없다")
+}
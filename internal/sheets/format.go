@@ -130,16 +130,24 @@ func gridRange(sheetID int64, startRow, endRow, startCol, endCol int) *gsheets.G
 // buildNumberFormatRequests 는 컬럼별 숫자 포맷 repeatCell 요청을 생성한다.
 // (Python build_number_format_requests) sheetID 는 0-based sheetId,
 // startRow/endRow 는 1-based(endRow inclusive).
+// 바로 앞 항목과 포맷이 같고 열이 이어지는 항목은 한 열 구간의 요청으로 합친다.
 func buildNumberFormatRequests(sheetID int64, columnFormats []ColumnFormat, startRow, endRow int) []*gsheets.Request {
 	reqs := make([]*gsheets.Request, 0, len(columnFormats))
-	for _, f := range columnFormats {
-		typ := f.Type
-		if typ == "" {
-			typ = "NUMBER"
+	for i := 0; i < len(columnFormats); i++ {
+		f := columnFormats[i]
+		typ := numberFormatType(f)
+		endCol := f.Col
+		for i+1 < len(columnFormats) {
+			next := columnFormats[i+1]
+			if next.Col != endCol+1 || next.Pattern != f.Pattern || numberFormatType(next) != typ {
+				break
+			}
+			endCol = next.Col
+			i++
 		}
 		reqs = append(reqs, &gsheets.Request{
 			RepeatCell: &gsheets.RepeatCellRequest{
-				Range: gridRange(sheetID, startRow-1, endRow, f.Col-1, f.Col),
+				Range: gridRange(sheetID, startRow-1, endRow, f.Col-1, endCol),
 				Cell: &gsheets.CellData{
 					UserEnteredFormat: &gsheets.CellFormat{
 						NumberFormat: &gsheets.NumberFormat{Type: typ, Pattern: f.Pattern},
@@ -152,6 +160,14 @@ func buildNumberFormatRequests(sheetID int64, columnFormats []ColumnFormat, star
 	return reqs
 }
 
+// numberFormatType 은 ColumnFormat 의 포맷 타입을 반환한다(비어 있으면 NUMBER).
+func numberFormatType(f ColumnFormat) string {
+	if f.Type == "" {
+		return "NUMBER"
+	}
+	return f.Type
+}
+
 // buildTextFormatRequests 는 지정 컬럼을 TEXT("@") 포맷으로 만드는 repeatCell 요청을
 // 생성한다. (Python build_text_format_requests) col 은 1-based; col<=0 이면 nil 반환.
 func buildTextFormatRequests(sheetID int64, col int, startRow, endRow int) []*gsheets.Request {
@@ -172,9 +188,16 @@ func buildTextFormatRequests(sheetID int64, col int, startRow, endRow int) []*gs
 }
 
 // buildColorRequests 는 배경색 repeatCell 요청을 생성한다. (Python build_color_requests)
+// 바로 앞 범위와 색·열 구간이 같고 행이 이어지는 범위는 한 요청으로 합친다
+// (연속된 그룹 행 등 → repeatCell 수와 batchUpdate 본문 축소).
 func buildColorRequests(sheetID int64, colorRanges []ColorRange) []*gsheets.Request {
 	reqs := make([]*gsheets.Request, 0, len(colorRanges))
-	for _, cr := range colorRanges {
+	for i := 0; i < len(colorRanges); i++ {
+		cr := colorRanges[i]
+		for i+1 < len(colorRanges) && extendsColorRange(cr, colorRanges[i+1]) {
+			i++
+			cr.EndRow = colorRanges[i].EndRow
+		}
 		reqs = append(reqs, &gsheets.Request{
 			RepeatCell: &gsheets.RepeatCellRequest{
 				Range: gridRange(sheetID, cr.StartRow-1, cr.EndRow, cr.StartCol-1, cr.EndCol),
@@ -188,6 +211,24 @@ func buildColorRequests(sheetID int64, colorRanges []ColorRange) []*gsheets.Requ
 	return reqs
 }
 
+// extendsColorRange 는 next 가 cur 바로 아래 행부터 같은 열 구간·같은 색으로 이어지는지 확인한다.
+func extendsColorRange(cur, next ColorRange) bool {
+	return next.StartRow == cur.EndRow+1 &&
+		next.StartCol == cur.StartCol && next.EndCol == cur.EndCol &&
+		sameColor(cur.Color, next.Color)
+}
+
+// sameColor 는 두 색의 RGBA 값이 같은지 비교한다.
+func sameColor(a, b *gsheets.Color) bool {
+	if a == b {
+		return true
+	}
+	if a == nil || b == nil {
+		return false
+	}
+	return a.Red == b.Red && a.Green == b.Green && a.Blue == b.Blue && a.Alpha == b.Alpha
+}
+
 // BuildColorRequests 는 buildColorRequests 의 공개 래퍼다(다른 패키지가 요청을 모아
 // ExecuteBatchRequests 로 1회 전송할 수 있도록). (Python GoogleSheetsClient.build_color_requests)
 func BuildColorRequests(sheetID int64, colorRanges []ColorRange) []*gsheets.Request {
@@ -200,6 +241,79 @@ func BuildNumberFormatRequests(sheetID int64, columnFormats []ColumnFormat, star
 	return buildNumberFormatRequests(sheetID, columnFormats, startRow, endRow)
 }
 
+// CellValue 는 행 값(Go 스칼라)을 셀 값(userEnteredValue)으로 변환한다. 빈 문자열·nil 은 빈 셀(nil).
+// 숫자(float64/int/int64)는 numberValue, bool 은 boolValue, 문자열은 파싱 없이 stringValue.
+// 그 밖의 타입은 숫자인지 문자열인지 알 수 없어(조용히 텍스트로 기록되면 정렬·집계가 깨진다) 에러.
+func CellValue(v interface{}) (*gsheets.ExtendedValue, error) {
+	switch x := v.(type) {
+	case nil:
+		return nil, nil
+	case float64:
+		return &gsheets.ExtendedValue{NumberValue: &x}, nil
+	case int:
+		f := float64(x)
+		return &gsheets.ExtendedValue{NumberValue: &f}, nil
+	case int64:
+		f := float64(x)
+		return &gsheets.ExtendedValue{NumberValue: &f}, nil
+	case bool:
+		return &gsheets.ExtendedValue{BoolValue: &x, ForceSendFields: []string{"BoolValue"}}, nil
+	case string:
+		if x == "" {
+			return nil, nil
+		}
+		return &gsheets.ExtendedValue{StringValue: &x}, nil
+	default:
+		return nil, fmt.Errorf("지원하지 않는 셀 값 타입: %T", v)
+	}
+}
+
+// BuildUpdateCellsRequest 는 (startRow, startCol)(1-based)부터 rows 의 값을 덮어쓰는
+// updateCells 요청을 만든다. 값은 CellValue 로 변환해 파싱 없이 기록하고(fields=userEnteredValue)
+// 서식은 건드리지 않는다. 행 길이는 달라도 되며, 다른 요청과 모아 ExecuteBatchRequests 로
+// 1회 전송할 수 있다. 변환할 수 없는 값이 있으면 그 셀 위치와 함께 에러를 반환한다.
+func BuildUpdateCellsRequest(sheetID int64, startRow, startCol int, rows [][]interface{}) (*gsheets.Request, error) {
+	rowData := make([]*gsheets.RowData, len(rows))
+	for i, row := range rows {
+		cells := make([]*gsheets.CellData, len(row))
+		for j, v := range row {
+			ev, err := CellValue(v)
+			if err != nil {
+				return nil, fmt.Errorf("%d행 %d열: %w", startRow+i, startCol+j, err)
+			}
+			cells[j] = &gsheets.CellData{UserEnteredValue: ev}
+		}
+		rowData[i] = &gsheets.RowData{Values: cells}
+	}
+	return &gsheets.Request{
+		UpdateCells: &gsheets.UpdateCellsRequest{
+			Start: &gsheets.GridCoordinate{
+				SheetId:         sheetID,
+				RowIndex:        int64(startRow - 1),
+				ColumnIndex:     int64(startCol - 1),
+				ForceSendFields: []string{"SheetId", "RowIndex", "ColumnIndex"}, // 0 인덱스도 전송
+			},
+			Rows:   rowData,
+			Fields: "userEnteredValue",
+		},
+	}, nil
+}
+
+// BuildAppendCellsRequest 는 시트의 마지막 데이터 행 다음에 셀 행들(값 + 숫자 포맷)을
+// 덧붙이는 appendCells 요청을 만든다. 필요하면 행이 추가되고, 기존 값은 덮어쓰지 않는다.
+// 셀에 값과 포맷을 함께 실으므로 기록 후 포맷을 따로 적용할 필요가 없고, 여러 시트의
+// 요청을 모아 ExecuteBatchRequests 로 1회 전송할 수 있다.
+func BuildAppendCellsRequest(sheetID int64, rows []*gsheets.RowData) *gsheets.Request {
+	return &gsheets.Request{
+		AppendCells: &gsheets.AppendCellsRequest{
+			SheetId:         sheetID,
+			Rows:            rows,
+			Fields:          "userEnteredValue,userEnteredFormat.numberFormat",
+			ForceSendFields: []string{"SheetId"}, // sheetId 0(첫 시트)도 전송
+		},
+	}
+}
+
 // ── batchUpdate 실행 헬퍼 ──────────────────────────────────
 
 // batchUpdate 는 requests 를 단일 batchUpdate 로 실행하며 재시도를 적용한다.
@@ -305,20 +419,77 @@ func (c *Client) BatchApplyColors(ctx context.Context, sheetName string, colorRa
 
 // ── 시트 관리 ──────────────────────────────────
 
-// CreateSheet 는 새 시트(탭)를 추가하고 ID 캐시를 무효화한다. (Python create_sheet)
-func (c *Client) CreateSheet(ctx context.Context, title string) error {
-	reqs := []*gsheets.Request{{
-		AddSheet: &gsheets.AddSheetRequest{
-			Properties: &gsheets.SheetProperties{Title: title},
+// CreateSheetWithHeader 는 새 시트를 추가하면서 헤더 행 기록 + 행 고정 + 필터 +
+// (옵션) TEXT 포맷 열까지 1회 batchUpdate 로 끝낸다. textFormatCol 은 1-based, <=0 이면 생략.
+// 같은 배치의 후속 요청이 참조할 수 있도록 sheetId 를 미리 정해 AddSheet 에 넘기고,
+// 생성 후에는 캐시를 비우지 않고 새 이름 → sheetId 만 추가한다.
+// (Python create_sheet + update_cells + apply_sheet_formatting)
+func (c *Client) CreateSheetWithHeader(ctx context.Context, title string, headers []string, textFormatCol int) error {
+	sheetID := c.newSheetID()
+	numCols := len(headers)
+
+	cells := make([]*gsheets.CellData, numCols)
+	for i := range headers {
+		h := headers[i]
+		cells[i] = &gsheets.CellData{UserEnteredValue: &gsheets.ExtendedValue{StringValue: &h}}
+	}
+
+	requests := []*gsheets.Request{
+		{
+			AddSheet: &gsheets.AddSheetRequest{
+				Properties: &gsheets.SheetProperties{
+					SheetId: sheetID,
+					Title:   title,
+					GridProperties: &gsheets.GridProperties{
+						FrozenRowCount: 1,
+					},
+				},
+			},
 		},
-	}}
-	if err := c.batchUpdate(ctx, reqs); err != nil {
+		{
+			UpdateCells: &gsheets.UpdateCellsRequest{
+				Range:  gridRange(sheetID, 0, 1, 0, numCols),
+				Rows:   []*gsheets.RowData{{Values: cells}},
+				Fields: "userEnteredValue",
+			},
+		},
+		{
+			SetBasicFilter: &gsheets.SetBasicFilterRequest{
+				Filter: &gsheets.BasicFilter{Range: gridRange(sheetID, 0, -1, 0, numCols)},
+			},
+		},
+	}
+	// 종목코드 등 텍스트로 다뤄야 하는 컬럼을 TEXT 포맷으로 (헤더 제외, 2행~1000행).
+	requests = append(requests, buildTextFormatRequests(sheetID, textFormatCol, 2, 1000)...)
+
+	if err := c.batchUpdate(ctx, requests); err != nil {
 		return fmt.Errorf("시트 '%s' 생성 실패: %w", title, err)
 	}
-	c.InvalidateSheetIDCache()
+	if c.sheetIDCache == nil {
+		c.sheetIDCache = make(map[string]int64)
+	}
+	c.sheetIDCache[title] = sheetID
+	if c.sheetNames != nil {
+		c.sheetNames = append(c.sheetNames, title)
+	}
 	return nil
 }
 
+// newSheetID 는 캐시에 알려진 sheetId 와 겹치지 않는 양수 sheetId 를 고른다.
+// 캐시에 없는 기존 시트와 겹칠 확률은 2^31 분의 시트 수라 무시한다.
+func (c *Client) newSheetID() int64 {
+	used := make(map[int64]bool, len(c.sheetIDCache))
+	for _, id := range c.sheetIDCache {
+		used[id] = true
+	}
+	for {
+		id := int64(rand.Int31n(math.MaxInt32-1) + 1)
+		if !used[id] {
+			return id
+		}
+	}
+}
+
 // DeleteSheet 는 시트(탭)를 삭제하고 ID 캐시를 무효화한다. (Python delete_sheet)
 func (c *Client) DeleteSheet(ctx context.Context, sheetName string) error {
 	sheetID, ok, err := c.GetSheetID(ctx, sheetName)
@@ -338,49 +509,40 @@ func (c *Client) DeleteSheet(ctx context.Context, sheetName string) error {
 	return nil
 }
 
-// ClearBackgroundColors 는 시트 전체의 배경색을 제거한다. (Python clear_background_colors)
-// endRow 기본 1000, endCol 기본 26(Z).
-func (c *Client) ClearBackgroundColors(ctx context.Context, sheetName string, endRow, endCol int) error {
-	sheetID, ok, err := c.GetSheetID(ctx, sheetName)
-	if err != nil {
-		return err
-	}
-	if !ok {
-		return fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
-	}
-	reqs := []*gsheets.Request{{
-		RepeatCell: &gsheets.RepeatCellRequest{
-			Range:  gridRange(sheetID, 0, endRow, 0, endCol),
-			Cell:   &gsheets.CellData{UserEnteredFormat: &gsheets.CellFormat{}},
-			Fields: "userEnteredFormat.backgroundColor",
+// BuildResetSheetRequests 는 시트를 다시 쓰기 전 초기화 요청을 만든다(API 호출 없음):
+// 값 비우기(A~endCol 열, 전체 행) + 배경색·숫자 포맷 초기화(endRow×endCol) + chartIDs 차트 삭제.
+// batchUpdate 안의 요청은 순서대로 적용되므로, 새로 쓸 값·포맷·차트 요청 앞에 두면 한 번에 보낼 수 있다.
+// (Python clear_sheet + clear_background_colors + clear_number_formats + delete_all_charts)
+func BuildResetSheetRequests(sheetID int64, chartIDs []int64, endRow, endCol int) []*gsheets.Request {
+	reqs := []*gsheets.Request{
+		{
+			// rows 없이 fields 만 주면 범위의 해당 필드를 비운다. 끝 행을 생략해 시트 전체 행이 대상.
+			UpdateCells: &gsheets.UpdateCellsRequest{
+				Range:  gridRange(sheetID, 0, -1, 0, endCol),
+				Fields: "userEnteredValue",
+			},
+		},
+		{
+			RepeatCell: &gsheets.RepeatCellRequest{
+				Range:  gridRange(sheetID, 0, endRow, 0, endCol),
+				Cell:   &gsheets.CellData{UserEnteredFormat: &gsheets.CellFormat{}},
+				Fields: "userEnteredFormat.backgroundColor,userEnteredFormat.numberFormat",
+			},
 		},
-	}}
-	if err := c.batchUpdate(ctx, reqs); err != nil {
-		return fmt.Errorf("시트 '%s' 배경색 초기화 실패: %w", sheetName, err)
 	}
-	return nil
+	return append(reqs, buildChartDeleteRequests(chartIDs)...)
 }
 
-// ClearNumberFormats 는 시트 전체의 숫자 포맷을 초기화한다. (Python clear_number_formats)
-func (c *Client) ClearNumberFormats(ctx context.Context, sheetName string, endRow, endCol int) error {
-	sheetID, ok, err := c.GetSheetID(ctx, sheetName)
-	if err != nil {
-		return err
-	}
-	if !ok {
-		return fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
-	}
-	reqs := []*gsheets.Request{{
-		RepeatCell: &gsheets.RepeatCellRequest{
-			Range:  gridRange(sheetID, 0, endRow, 0, endCol),
-			Cell:   &gsheets.CellData{UserEnteredFormat: &gsheets.CellFormat{}},
-			Fields: "userEnteredFormat.numberFormat",
+// BuildAddSheetRequest 는 새 시트 추가 요청과 그 시트에 미리 정한 sheetId 를 반환한다(API 호출 없음).
+// 같은 batchUpdate 의 뒤 요청이 이 sheetId 를 참조할 수 있다. 전송 뒤에는 InvalidateSheetIDCache 로
+// 캐시를 비운다.
+func (c *Client) BuildAddSheetRequest(title string) (int64, *gsheets.Request) {
+	sheetID := c.newSheetID()
+	return sheetID, &gsheets.Request{
+		AddSheet: &gsheets.AddSheetRequest{
+			Properties: &gsheets.SheetProperties{SheetId: sheetID, Title: title},
 		},
-	}}
-	if err := c.batchUpdate(ctx, reqs); err != nil {
-		return fmt.Errorf("시트 '%s' 숫자 포맷 초기화 실패: %w", sheetName, err)
 	}
-	return nil
 }
 
 // FreezeRows 는 시트 상단 N행을 고정한다. (Python freeze_rows) rowCount 기본 1.
@@ -439,23 +601,16 @@ func (c *Client) SetAutoFilter(ctx context.Context, sheetName string, startRow,
 	return nil
 }
 
-// ApplySheetFormattingBatch 는 행고정 + 필터 + 배경색초기화(+옵션 TEXT 포맷)를
-// 1회 batchUpdate 로 적용한다. (Python apply_sheet_formatting_batch)
-// textFormatCol<=0 이면 TEXT 포맷을 적용하지 않는다.
-func (c *Client) ApplySheetFormattingBatch(
-	ctx context.Context, sheetName string,
+// BuildSheetFormattingRequests 는 행고정 + 필터(기존 필터 제거 후 재설정) + 배경색초기화
+// (+옵션 TEXT 포맷) 요청을 만든다. textFormatCol<=0 이면 TEXT 포맷을, clearBgEndCol<=0 이면
+// 배경색 초기화를 넣지 않는다. TEXT 포맷 범위는 clearBgEndRow 까지다.
+// 다른 요청과 모아 ExecuteBatchRequests 로 1회 전송할 수 있다.
+func BuildSheetFormattingRequests(
+	sheetID int64,
 	freezeRowCount, filterStartRow, filterStartCol, filterEndCol int,
 	clearBgEndRow, clearBgEndCol int,
 	textFormatCol int,
-) error {
-	sheetID, ok, err := c.GetSheetID(ctx, sheetName)
-	if err != nil {
-		return err
-	}
-	if !ok {
-		return fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
-	}
-
+) []*gsheets.Request {
 	requests := []*gsheets.Request{
 		{
 			UpdateSheetProperties: &gsheets.UpdateSheetPropertiesRequest{
@@ -477,18 +632,39 @@ func (c *Client) ApplySheetFormattingBatch(
 				},
 			},
 		},
-		{
+	}
+	if clearBgEndCol > 0 {
+		requests = append(requests, &gsheets.Request{
 			RepeatCell: &gsheets.RepeatCellRequest{
 				Range:  gridRange(sheetID, 0, clearBgEndRow, 0, clearBgEndCol),
 				Cell:   &gsheets.CellData{UserEnteredFormat: &gsheets.CellFormat{}},
 				Fields: "userEnteredFormat.backgroundColor",
 			},
-		},
+		})
 	}
 
 	// 종목코드 등 텍스트로 다뤄야 하는 컬럼을 TEXT 포맷으로 (헤더 제외, 2행~).
-	requests = append(requests, buildTextFormatRequests(sheetID, textFormatCol, 2, clearBgEndRow)...)
+	return append(requests, buildTextFormatRequests(sheetID, textFormatCol, 2, clearBgEndRow)...)
+}
 
+// ApplySheetFormattingBatch 는 행고정 + 필터 + 배경색초기화(+옵션 TEXT 포맷)를
+// 1회 batchUpdate 로 적용한다. (Python apply_sheet_formatting_batch)
+// textFormatCol<=0 이면 TEXT 포맷을 적용하지 않는다.
+func (c *Client) ApplySheetFormattingBatch(
+	ctx context.Context, sheetName string,
+	freezeRowCount, filterStartRow, filterStartCol, filterEndCol int,
+	clearBgEndRow, clearBgEndCol int,
+	textFormatCol int,
+) error {
+	sheetID, ok, err := c.GetSheetID(ctx, sheetName)
+	if err != nil {
+		return err
+	}
+	if !ok {
+		return fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
+	}
+	requests := BuildSheetFormattingRequests(sheetID, freezeRowCount, filterStartRow, filterStartCol,
+		filterEndCol, clearBgEndRow, clearBgEndCol, textFormatCol)
 	if err := c.batchUpdate(ctx, requests); err != nil {
 		return fmt.Errorf("시트 포맷팅 일괄 적용 실패 (%s): %w", sheetName, err)
 	}
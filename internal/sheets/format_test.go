@@ -75,6 +75,26 @@ func TestBuildNumberFormatRequests(t *testing.T) {
 	assert.Equal(t, "PERCENT", r1.Cell.UserEnteredFormat.NumberFormat.Type)
 }
 
+func TestBuildNumberFormatRequestsMergesAdjacentColumns(t *testing.T) {
+	formats := []ColumnFormat{
+		{Col: 2, Pattern: "₩#,##0"},
+		{Col: 3, Pattern: "₩#,##0", Type: "NUMBER"}, // 빈 Type 과 같은 NUMBER
+		{Col: 4, Pattern: "₩#,##0"},
+		{Col: 5, Pattern: "0.00%", Type: "PERCENT"},
+		{Col: 7, Pattern: "0.00%", Type: "PERCENT"}, // 열이 끊김
+	}
+	reqs := buildNumberFormatRequests(3, formats, 2, 50)
+	require.Len(t, reqs, 3)
+
+	r0 := reqs[0].RepeatCell
+	assert.Equal(t, int64(1), r0.Range.StartColumnIndex)
+	assert.Equal(t, int64(4), r0.Range.EndColumnIndex)
+	assert.Equal(t, "₩#,##0", r0.Cell.UserEnteredFormat.NumberFormat.Pattern)
+	assert.Equal(t, int64(4), reqs[1].RepeatCell.Range.StartColumnIndex)
+	assert.Equal(t, int64(5), reqs[1].RepeatCell.Range.EndColumnIndex)
+	assert.Equal(t, int64(6), reqs[2].RepeatCell.Range.StartColumnIndex)
+}
+
 func TestBuildNumberFormatRequestsEmpty(t *testing.T) {
 	assert.Empty(t, buildNumberFormatRequests(1, nil, 1, 10))
 }
@@ -107,6 +127,26 @@ func TestBuildColorRequests(t *testing.T) {
 	assert.Equal(t, int64(4), r1.Range.EndColumnIndex)
 }
 
+func TestBuildColorRequestsMergesContiguousRows(t *testing.T) {
+	group := &gsheets.Color{Red: 0.9, Green: 0.9, Blue: 0.9}
+	header := &gsheets.Color{Red: 0.8}
+	ranges := []ColorRange{
+		{StartRow: 1, EndRow: 1, StartCol: 1, EndCol: 5, Color: header},
+		{StartRow: 2, EndRow: 2, StartCol: 1, EndCol: 5, Color: group},
+		{StartRow: 3, EndRow: 3, StartCol: 1, EndCol: 5, Color: &gsheets.Color{Red: 0.9, Green: 0.9, Blue: 0.9}},
+		{StartRow: 4, EndRow: 4, StartCol: 1, EndCol: 3, Color: group}, // 열 구간 다름
+		{StartRow: 6, EndRow: 6, StartCol: 1, EndCol: 3, Color: group}, // 행이 끊김
+	}
+	reqs := buildColorRequests(7, ranges)
+	require.Len(t, reqs, 4)
+
+	merged := reqs[1].RepeatCell.Range
+	assert.Equal(t, int64(1), merged.StartRowIndex)
+	assert.Equal(t, int64(3), merged.EndRowIndex)
+	assert.Equal(t, int64(3), reqs[2].RepeatCell.Range.StartRowIndex)
+	assert.Equal(t, int64(5), reqs[3].RepeatCell.Range.StartRowIndex)
+}
+
 func TestBuildColorRequestsEmpty(t *testing.T) {
 	assert.Empty(t, buildColorRequests(1, nil))
 }
@@ -119,3 +159,70 @@ func TestGridRangeOmitsNegative(t *testing.T) {
 	assert.True(t, contains(gr.ForceSendFields, "StartRowIndex"))
 	assert.True(t, contains(gr.ForceSendFields, "StartColumnIndex"))
 }
+
+func TestCellValue(t *testing.T) {
+	v, err := CellValue(2.5)
+	require.NoError(t, err)
+	assert.Equal(t, 2.5, *v.NumberValue)
+	v, err = CellValue(12)
+	require.NoError(t, err)
+	assert.Equal(t, float64(12), *v.NumberValue)
+	v, err = CellValue(true)
+	require.NoError(t, err)
+	assert.True(t, *v.BoolValue)
+	v, err = CellValue("2024-01")
+	require.NoError(t, err)
+	assert.Equal(t, "2024-01", *v.StringValue, "문자열은 파싱하지 않는다")
+
+	v, err = CellValue("")
+	require.NoError(t, err)
+	assert.Nil(t, v, "빈 문자열은 빈 셀")
+	v, err = CellValue(nil)
+	require.NoError(t, err)
+	assert.Nil(t, v)
+
+	_, err = CellValue(struct{}{})
+	assert.Error(t, err, "알 수 없는 타입은 텍스트로 바꾸지 않는다")
+}
+
+// clearBgEndCol<=0 이면 배경색 초기화만 빠지고 행 고정·필터·TEXT 포맷은 그대로다.
+func TestBuildSheetFormattingRequestsSkipsBackgroundClear(t *testing.T) {
+	withClear := BuildSheetFormattingRequests(3, 1, 1, 1, 12, 1000, 26, 3)
+	withoutClear := BuildSheetFormattingRequests(3, 1, 1, 1, 12, 1000, 0, 3)
+
+	require.Len(t, withoutClear, len(withClear)-1)
+	assert.Equal(t, "userEnteredFormat.backgroundColor", withClear[3].RepeatCell.Fields)
+	for _, r := range withoutClear {
+		if r.RepeatCell != nil {
+			assert.NotEqual(t, "userEnteredFormat.backgroundColor", r.RepeatCell.Fields)
+		}
+	}
+	assert.NotNil(t, withoutClear[0].UpdateSheetProperties)
+	assert.NotNil(t, withoutClear[2].SetBasicFilter)
+}
+
+// updateCells 요청은 1-based 시작 위치를 0-based 좌표로 바꾸고 값을 파싱 없이 싣는다.
+func TestBuildUpdateCellsRequest(t *testing.T) {
+	req, err := BuildUpdateCellsRequest(0, 1, 17, [][]interface{}{
+		{"연월", "매수건수"},
+		{"2024-01", 3, 1500.5, ""},
+	})
+	require.NoError(t, err)
+
+	uc := req.UpdateCells
+	require.NotNil(t, uc)
+	assert.Equal(t, "userEnteredValue", uc.Fields)
+	assert.Equal(t, int64(0), uc.Start.RowIndex)
+	assert.Equal(t, int64(16), uc.Start.ColumnIndex)
+	assert.True(t, contains(uc.Start.ForceSendFields, "RowIndex"), "0 인덱스도 전송")
+	require.Len(t, uc.Rows, 2)
+	assert.Len(t, uc.Rows[0].Values, 2, "행 길이는 그대로")
+	cells := uc.Rows[1].Values
+	assert.Equal(t, "2024-01", *cells[0].UserEnteredValue.StringValue, "연월은 날짜로 해석하지 않는다")
+	assert.Equal(t, float64(3), *cells[1].UserEnteredValue.NumberValue)
+	assert.Equal(t, 1500.5, *cells[2].UserEnteredValue.NumberValue)
+	assert.Nil(t, cells[3].UserEnteredValue, "빈 문자열은 빈 셀")
+
+	_, err = BuildUpdateCellsRequest(0, 5, 1, [][]interface{}{{"a"}, {"b", float32(1)}})
+	assert.ErrorContains(t, err, "6행 2열")
+}
@@ -165,7 +165,7 @@ func TestGridAndMetadataRetryOnRateLimit(t *testing.T) {
 	assert.Equal(t, int32(4), atomic.LoadInt32(&hits), "각 호출이 1회씩 재시도되어야 한다")
 }
 
-// 값 쓰기(ClearValues/UpdateCells/BatchUpdateValues)도 쓰기 쿼터(분당 60)를 공유하므로 재시도 대상이다.
+// 값 쓰기(UpdateCells/BatchUpdateValues)도 쓰기 쿼터(분당 60)를 공유하므로 재시도 대상이다.
 func TestValueWritesRetryOnRateLimit(t *testing.T) {
 	stubRetrySleep(t)
 	var hits int32
@@ -180,9 +180,8 @@ func TestValueWritesRetryOnRateLimit(t *testing.T) {
 	})
 
 	ctx := context.Background()
-	require.NoError(t, c.ClearValues(ctx, "시트!A1:Z"))
 	require.NoError(t, c.UpdateCells(ctx, "시트!A1", [][]interface{}{{"a"}}))
 	require.NoError(t, c.BatchUpdateValues(ctx, map[string][][]interface{}{"시트!A1": {{"a"}}}))
 
-	assert.Equal(t, int32(6), atomic.LoadInt32(&hits))
+	assert.Equal(t, int32(4), atomic.LoadInt32(&hits))
 }
@@ -1,14 +1,15 @@
 package summary
 
 import (
-	"context"
 	"log/slog"
 
 	gsheets "google.golang.org/api/sheets/v4"
+
+	"github.com/kenshin579/auto-trading-journal/internal/sheets"
 )
 
 // 지수 vs 나머지 파이 차트가 읽는 헬퍼 열(0-based). writeIndexWeight 가 Y:Z 에 쓴다 —
-// 옮길 때 index_weight.go 의 범위 문자열도 함께 바꿀 것.
+// 옮길 때 index_weight.go 의 queueValues 시작 열도 함께 바꿀 것.
 const (
 	indexWeightLabelCol = 24 // Y열
 	indexWeightValueCol = 25 // Z열
@@ -122,34 +123,25 @@ func buildPieChartSpec(
 	}
 }
 
-// createCharts 는 대시보드 차트를 생성한다.
+// collectCharts 는 대시보드 차트 추가 요청을 pendingRequests 에 수집한다
+// (포맷/색상 요청과 함께 flushPendingRequests 의 batchUpdate 1회로 전송).
 // trendStart: 섹션 5(월별 성과 추이) 헤더 행 (1-based)
 // trendEnd:   섹션 5 마지막 데이터 행 (1-based)
 // (Python _create_charts, py:872-987)
-func (g *Generator) createCharts(ctx context.Context, trendStart, trendEnd int) error {
-	sheetID, ok, err := g.client.GetSheetID(ctx, DashboardSheet)
-	if err != nil {
-		return err
-	}
-	if !ok {
-		slog.Error("대시보드 시트 ID를 찾을 수 없어 차트 생성 건너뜀")
-		return nil
-	}
+func (g *Generator) collectCharts(trendStart, trendEnd int) {
+	sheetID := g.dashboardSheetID
 
 	// 섹션 5 데이터가 없으면 (헤더만 있으면) 차트 생성 스킵.
 	if trendEnd <= trendStart {
 		slog.Info("월별 성과 추이 데이터 없음, 차트 생성 건너뜀")
-		return nil
+		return
 	}
 
 	// 0-based 인덱스 변환 (헤더 포함).
 	dataStart := trendStart - 1
 	dataEnd := trendEnd
 
-	// 중복 방지를 위해 기존 차트 삭제.
-	if err := g.client.DeleteAllCharts(ctx, DashboardSheet); err != nil {
-		return err
-	}
+	// 기존 차트 삭제는 prepareDashboardSheet 가 같은 배치 맨 앞에 넣었다 — 다시 조회·삭제하지 않는다.
 
 	specs := make([]*gsheets.EmbeddedChart, 0, 6)
 
@@ -227,11 +219,6 @@ func (g *Generator) createCharts(ctx context.Context, trendStart, trendEnd int)
 		))
 	}
 
-	if len(specs) > 0 {
-		if err := g.client.AddCharts(ctx, specs); err != nil {
-			return err
-		}
-		slog.Info("대시보드 차트 생성 완료", "count", len(specs))
-	}
-	return nil
+	g.pendingRequests = append(g.pendingRequests, sheets.BuildAddChartRequests(specs)...)
+	slog.Info("대시보드 차트 요청 수집", "count", len(specs))
 }
@@ -2,12 +2,9 @@ package summary
 
 import (
 	"context"
-	"fmt"
 	"log/slog"
 	"sort"
 
-	gsheets "google.golang.org/api/sheets/v4"
-
 	"github.com/kenshin579/auto-trading-journal/internal/etfclass"
 	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
@@ -176,16 +173,14 @@ func (g *Generator) writeCountrySectorWeight(ctx context.Context, trades []model
 	}
 
 	endRow := startRow + len(rows) - 1
-	rng := fmt.Sprintf("%s!A%d:E%d", DashboardSheet, startRow, endRow)
-	if err := g.client.UpdateCells(ctx, rng, rows); err != nil {
+	if err := g.queueValues(startRow, 1, rows); err != nil { // A~E열
 		return 0, err
 	}
 	if len(pieHelper) > 0 {
 		// 맨 위 설명 헤더 + (섹터, 매수금액). 매수금액(X열)은 통화 포맷.
 		helperRows := append([][]any{{"[차트데이터] 나라별 섹터 비중", "매수금액"}}, pieHelper...)
 		hEnd := startRow + len(helperRows) - 1
-		hRng := fmt.Sprintf("%s!W%d:X%d", DashboardSheet, startRow, hEnd)
-		if err := g.client.UpdateCells(ctx, hRng, helperRows); err != nil {
+		if err := g.queueValues(startRow, 23, helperRows); err != nil { // W~X열
 			return 0, err
 		}
 		g.pendingRequests = append(g.pendingRequests, sheets.BuildNumberFormatRequests(
@@ -209,14 +204,12 @@ func (g *Generator) collectCountrySectorFormats(startRow, endRow int, countryHea
 	g.pendingRequests = append(g.pendingRequests, build(sid, krw, startRow, endRow)...)
 	g.pendingRequests = append(g.pendingRequests, build(sid, pct, startRow, endRow)...)
 
-	headerColor := &gsheets.Color{Red: 0.24, Green: 0.52, Blue: 0.78, ForceSendFields: []string{"Red", "Green", "Blue"}}
-	countryColor := &gsheets.Color{Red: 0.85, Green: 0.92, Blue: 0.98, ForceSendFields: []string{"Red", "Green", "Blue"}}
 	colorRanges := []sheets.ColorRange{
 		{StartRow: startRow, EndRow: startRow, StartCol: 1, EndCol: 5, Color: headerColor},
 	}
 	for _, off := range countryHeaderOffsets {
 		r := startRow + off
-		colorRanges = append(colorRanges, sheets.ColorRange{StartRow: r, EndRow: r, StartCol: 1, EndCol: 5, Color: countryColor})
+		colorRanges = append(colorRanges, sheets.ColorRange{StartRow: r, EndRow: r, StartCol: 1, EndCol: 5, Color: groupColor})
 	}
 	g.pendingRequests = append(g.pendingRequests, sheets.BuildColorRequests(sid, colorRanges)...)
 }
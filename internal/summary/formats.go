@@ -12,16 +12,28 @@ import (
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
 )
 
-// collectHeaderColors 는 대시보드 헤더 행 배경색 요청을 pendingRequests 에 수집한다.
-// (Python _collect_header_colors, py:688-707)
-func (g *Generator) collectHeaderColors(monthlyStart, trendStart, stockStart int) {
-	headerColor := &gsheets.Color{
+// 대시보드 배경색. 섹션마다 같은 값을 새로 만들지 않도록 패키지 수준에서 한 번만 만든다
+// (요청 빌더는 포인터를 읽기만 한다 — 수정하지 말 것).
+var (
+	// headerColor 는 섹션 제목/헤더 행 배경색.
+	headerColor = &gsheets.Color{
 		Red:             0.24,
 		Green:           0.52,
 		Blue:            0.78,
 		ForceSendFields: []string{"Red", "Green", "Blue"},
 	}
+	// groupColor 는 섹션 안 그룹(국가·지수 그룹) 행 배경색.
+	groupColor = &gsheets.Color{
+		Red:             0.85,
+		Green:           0.92,
+		Blue:            0.98,
+		ForceSendFields: []string{"Red", "Green", "Blue"},
+	}
+)
 
+// collectHeaderColors 는 대시보드 헤더 행 배경색 요청을 pendingRequests 에 수집한다.
+// (Python _collect_header_colors, py:688-707)
+func (g *Generator) collectHeaderColors(monthlyStart, trendStart, stockStart int) {
 	type hr struct {
 		row, endCol int
 	}
@@ -115,7 +127,19 @@ func (g *Generator) collectDashboardFormats(monthlyStart, metricsStart, insights
 	}
 }
 
-// flushPendingRequests 는 수집된 포맷/색상 요청을 1회 batchUpdate 로 전송 후 비운다.
+// queueValues 는 대시보드 값 쓰기((startRow, startCol)부터 행들, 1-based)를 updateCells 요청으로
+// pendingRequests 에 모은다. 실제 기록은 포맷/색상/차트와 함께 flushPendingRequests 의 batchUpdate 1회.
+// 값은 파싱 없이 타입 그대로 기록된다(숫자는 숫자, "2024-01" 같은 연월·종목코드는 텍스트).
+func (g *Generator) queueValues(startRow, startCol int, rows [][]any) error {
+	req, err := sheets.BuildUpdateCellsRequest(g.dashboardSheetID, startRow, startCol, rows)
+	if err != nil {
+		return fmt.Errorf("대시보드 값 변환 실패: %w", err)
+	}
+	g.pendingRequests = append(g.pendingRequests, req)
+	return nil
+}
+
+// flushPendingRequests 는 수집된 값/포맷/색상/차트 요청을 1회 batchUpdate 로 전송 후 비운다.
 // (#57 배칭 보존) (Python _flush_pending_requests, py:820-825)
 func (g *Generator) flushPendingRequests(ctx context.Context) error {
 	if len(g.pendingRequests) == 0 {
@@ -124,7 +148,7 @@ func (g *Generator) flushPendingRequests(ctx context.Context) error {
 	if err := g.client.ExecuteBatchRequests(ctx, g.pendingRequests); err != nil {
 		return err
 	}
-	slog.Info("대시보드 포맷/색상 일괄 적용 완료", "requests", len(g.pendingRequests))
+	slog.Info("대시보드 값/포맷/차트 일괄 적용 완료", "requests", len(g.pendingRequests))
 	g.pendingRequests = nil
 	return nil
 }
@@ -173,8 +197,7 @@ func (g *Generator) writeTradeCountData(ctx context.Context, trades []model.Trad
 
 	startRow := 1
 	endRow := startRow + len(rows) - 1
-	rng := fmt.Sprintf("%s!Q%d:U%d", DashboardSheet, startRow, endRow)
-	if err := g.client.UpdateCells(ctx, rng, rows); err != nil {
+	if err := g.queueValues(startRow, 17, rows); err != nil { // Q~U열
 		return err
 	}
 	g.tradeCountDataRange = rowRange{start: startRow, end: endRow, ok: true}
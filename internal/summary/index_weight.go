@@ -7,8 +7,6 @@ import (
 	"sort"
 	"strings"
 
-	gsheets "google.golang.org/api/sheets/v4"
-
 	"github.com/kenshin579/auto-trading-journal/internal/etfclass"
 	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
@@ -327,13 +325,12 @@ func (g *Generator) writeIndexWeight(ctx context.Context, trades []model.Trade,
 	rows, diag := aggregateIndexWeight(trades)
 	values, groupOffsets := indexWeightValues(rows, diag)
 
-	// 쓰기보다 먼저 비운다 — 중간에 실패하고 돌아가면 이전 실행의 범위가 남아
+	// 먼저 비운다 — 헬퍼를 쓰지 않는 경우 이전 실행의 범위가 남아
 	// 엉뚱한 행을 가리키는 차트가 만들어질 수 있다.
 	g.indexWeightPie = rowRange{}
 
 	endRow := startRow + len(values) - 1
-	rng := fmt.Sprintf("%s!A%d:E%d", DashboardSheet, startRow, endRow)
-	if err := g.client.UpdateCells(ctx, rng, values); err != nil {
+	if err := g.queueValues(startRow, 1, values); err != nil { // A~E열
 		return 0, err
 	}
 
@@ -349,8 +346,7 @@ func (g *Generator) writeIndexWeight(ctx context.Context, trades []model.Trade,
 	if helper := indexWeightPieHelper(rows); len(helper) > 1 && heldTotal > 0 {
 		hEnd := startRow + len(helper) - 1
 		// 열을 옮기면 charts.go 의 indexWeightLabelCol/ValueCol 도 함께 바꿀 것.
-		hRng := fmt.Sprintf("%s!Y%d:Z%d", DashboardSheet, startRow, hEnd)
-		if err := g.client.UpdateCells(ctx, hRng, helper); err != nil {
+		if err := g.queueValues(startRow, 25, helper); err != nil { // Y~Z열
 			return 0, err
 		}
 		g.indexWeightPie = rowRange{start: startRow + 1, end: hEnd, ok: true}
@@ -381,8 +377,6 @@ func (g *Generator) collectIndexWeightFormats(startRow, endRow int, groupOffsets
 		g.pendingRequests = append(g.pendingRequests, build(sid, pct, startRow+3, endRow)...)
 	}
 
-	headerColor := &gsheets.Color{Red: 0.24, Green: 0.52, Blue: 0.78, ForceSendFields: []string{"Red", "Green", "Blue"}}
-	groupColor := &gsheets.Color{Red: 0.85, Green: 0.92, Blue: 0.98, ForceSendFields: []string{"Red", "Green", "Blue"}}
 	colorRanges := []sheets.ColorRange{
 		{StartRow: startRow, EndRow: startRow, StartCol: 1, EndCol: 5, Color: headerColor},
 	}
@@ -2,6 +2,8 @@ package summary
 
 import (
 	"context"
+	"encoding/json"
+	"fmt"
 	"net/http"
 	"net/http/httptest"
 	"strings"
@@ -12,39 +14,55 @@ import (
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+	gsheets "google.golang.org/api/sheets/v4"
 )
 
-// writeIndexWeight 는 순수 함수가 아니라 Sheets 를 호출한다. 범위 문자열·시작 행 정렬·
-// 반환 행 번호·실패 경로는 fake 엔드포인트로만 검증할 수 있다(make dry 는 대시보드 갱신을
-// 통째로 건너뛰므로 이 코드를 한 줄도 실행하지 않는다).
-
-// fakeValuesServer 는 Values.Update(PUT /v4/spreadsheets/{id}/values/{range}) 만 흉내내며
-// 요청된 A1 범위를 순서대로 기록한다.
-type fakeValuesServer struct {
-	mu     sync.Mutex
-	ranges []string
-	// failFrom 번째(0-based) 호출부터 400 을 돌려준다. -1 이면 항상 성공.
+// writeIndexWeight 는 값 쓰기를 updateCells 요청으로 pendingRequests 에 모으고, flushPendingRequests 가
+// 포맷 요청과 함께 Sheets 로 보낸다. 범위·시작 행 정렬·반환 행 번호는 모은 요청으로, 전송·실패 경로는
+// fake 엔드포인트로 검증한다(make dry 는 대시보드 갱신을 통째로 건너뛰므로 이 코드를 한 줄도 실행하지 않는다).
+
+// fakeBatchServer 는 Spreadsheets.BatchUpdate(POST /v4/spreadsheets/{id}:batchUpdate)와
+// 메타데이터 조회(GET /v4/spreadsheets/{id})만 흉내내며 받은 batchUpdate 본문을 순서대로 기록한다.
+type fakeBatchServer struct {
+	mu      sync.Mutex
+	batches []*gsheets.BatchUpdateSpreadsheetRequest
+	// calls 는 batchUpdate 호출 수, gets 는 메타데이터 조회 수.
+	calls, gets int
+	// meta 는 메타데이터 조회 응답 본문. 비어 있으면 시트 없음.
+	meta string
+	// failFrom 번째(0-based) batchUpdate 부터 400 을 돌려준다. -1 이면 항상 성공.
 	failFrom int
 }
 
-// newFakeValues 는 항상 성공하는 fake 를 만든다(failFrom 의 zero value 0 은
+// newFakeBatch 는 항상 성공하는 fake 를 만든다(failFrom 의 zero value 0 은
 // "첫 호출부터 실패" 라 기본값으로 부적절하다).
-func newFakeValues() *fakeValuesServer { return &fakeValuesServer{failFrom: -1} }
+func newFakeBatch() *fakeBatchServer { return &fakeBatchServer{failFrom: -1} }
 
-func (f *fakeValuesServer) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+func (f *fakeBatchServer) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	f.mu.Lock()
 	defer f.mu.Unlock()
 
-	idx := strings.Index(r.URL.Path, "/values/")
-	if idx < 0 {
+	w.Header().Set("Content-Type", "application/json")
+	if r.Method == http.MethodGet && !strings.Contains(r.URL.Path, "/values") {
+		f.gets++
+		body := f.meta
+		if body == "" {
+			body = `{"sheets":[]}`
+		}
+		_, _ = w.Write([]byte(body))
+		return
+	}
+
+	n := f.calls
+	f.calls++
+	if !strings.HasSuffix(r.URL.Path, ":batchUpdate") || strings.Contains(r.URL.Path, "/values") {
 		http.Error(w, `{"error":{"code":404,"message":"unexpected path"}}`, http.StatusNotFound)
 		return
 	}
-	// r.URL.Path 는 이미 percent-decoding 된 값이라 "대시보드!A5:E16" 그대로 얻는다.
-	n := len(f.ranges)
-	f.ranges = append(f.ranges, r.URL.Path[idx+len("/values/"):])
+	req := &gsheets.BatchUpdateSpreadsheetRequest{}
+	_ = json.NewDecoder(r.Body).Decode(req)
+	f.batches = append(f.batches, req)
 
-	w.Header().Set("Content-Type", "application/json")
 	// 400 을 쓰는 이유: 500 은 executeWithRetry 의 재시도 대상이라 테스트가 60초 넘게 걸린다
 	// (retrySleep 은 sheets 패키지 내부 변수라 여기서 스텁할 수 없다). 에러 전파 경로는 동일하다.
 	if f.failFrom >= 0 && n >= f.failFrom {
@@ -55,13 +73,32 @@ func (f *fakeValuesServer) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	_, _ = w.Write([]byte(`{}`))
 }
 
-func (f *fakeValuesServer) recorded() []string {
-	f.mu.Lock()
-	defer f.mu.Unlock()
-	return append([]string(nil), f.ranges...)
+// updateCellsRanges 는 요청 중 값 쓰기(updateCells)가 덮는 범위를 A1 표기로 순서대로 반환한다.
+func updateCellsRanges(reqs []*gsheets.Request) []string {
+	var out []string
+	for _, req := range reqs {
+		uc := req.UpdateCells
+		if uc == nil || uc.Start == nil { // Start 가 없으면 범위 비우기(초기화) 요청
+			continue
+		}
+		width := 0
+		for _, r := range uc.Rows {
+			if len(r.Values) > width {
+				width = len(r.Values)
+			}
+		}
+		col := func(i int64) string { return string(rune('A' + i)) }
+		out = append(out, fmt.Sprintf("%s%d:%s%d",
+			col(uc.Start.ColumnIndex), uc.Start.RowIndex+1,
+			col(uc.Start.ColumnIndex+int64(width)-1), uc.Start.RowIndex+int64(len(uc.Rows))))
+	}
+	return out
 }
 
-func newFakeGenerator(t *testing.T, f *fakeValuesServer) *Generator {
+// queuedRanges 는 flush 전까지 모인 값 쓰기의 범위를 순서대로 반환한다.
+func queuedRanges(g *Generator) []string { return updateCellsRanges(g.pendingRequests) }
+
+func newFakeGenerator(t *testing.T, f *fakeBatchServer) *Generator {
 	t.Helper()
 	srv := httptest.NewServer(f)
 	t.Cleanup(srv.Close)
@@ -87,7 +124,7 @@ func indexWeightFixture() []model.Trade {
 
 // 표(A:E)와 파이 헬퍼(Y:Z)가 같은 startRow 에서 시작하고, 범위·반환값·차트 범위가 맞는지.
 func TestWriteIndexWeight_RangesAndReturn(t *testing.T) {
-	f := newFakeValues()
+	f := newFakeBatch()
 	g := newFakeGenerator(t, f)
 
 	const startRow = 5
@@ -96,8 +133,9 @@ func TestWriteIndexWeight_RangesAndReturn(t *testing.T) {
 
 	// 표: 제목행 + 안내행 + 컬럼헤더 + 버킷/그룹 10줄 = 13행 → 5..17
 	// 헬퍼: 설명헤더 + 그룹 소계 2줄 = 3행 → 5..7
-	assert.Equal(t, []string{"대시보드!A5:E17", "대시보드!Y5:Z7"}, f.recorded(),
-		"UpdateCells 2회 — 표(A:E)와 파이 헬퍼(Y:Z)가 같은 행에서 시작한다")
+	assert.Equal(t, []string{"A5:E17", "Y5:Z7"}, queuedRanges(g),
+		"표(A:E)와 파이 헬퍼(Y:Z)가 같은 행에서 시작한다")
+	assert.Zero(t, f.calls, "flush 전에는 보내지 않는다")
 
 	assert.Equal(t, 18, next, "반환값 = startRow + len(values) (다음 섹션의 시작 행)")
 
@@ -117,14 +155,14 @@ func TestWriteIndexWeight_ValueRowCountMatchesRange(t *testing.T) {
 
 // 거래가 없으면 헬퍼가 없으니 Y:Z 쓰기를 생략하고, 차트도 만들지 않는다.
 func TestWriteIndexWeight_NoTradesSkipsHelperWrite(t *testing.T) {
-	f := newFakeValues()
+	f := newFakeBatch()
 	g := newFakeGenerator(t, f)
 
 	next, err := g.writeIndexWeight(context.Background(), nil, 5)
 	require.NoError(t, err)
 
 	// 제목행 + 안내행 + 컬럼헤더만 → 5..7
-	assert.Equal(t, []string{"대시보드!A5:E7"}, f.recorded(), "Y:Z 쓰기는 생략된다")
+	assert.Equal(t, []string{"A5:E7"}, queuedRanges(g), "Y:Z 쓰기는 생략된다")
 	assert.Equal(t, 8, next)
 	assert.False(t, g.indexWeightPie.ok)
 
@@ -135,7 +173,7 @@ func TestWriteIndexWeight_NoTradesSkipsHelperWrite(t *testing.T) {
 // 전량 매도라 보유원금이 전부 0 이면 빈 파이가 그려지므로 차트를 만들지 않는다.
 // (헬퍼 행 자체는 있으므로 len(helper) > 1 만으로는 걸러지지 않는다.)
 func TestWriteIndexWeight_AllSoldSkipsPieChart(t *testing.T) {
-	f := newFakeValues()
+	f := newFakeBatch()
 	g := newFakeGenerator(t, f)
 
 	trades := []model.Trade{
@@ -147,13 +185,13 @@ func TestWriteIndexWeight_AllSoldSkipsPieChart(t *testing.T) {
 	_, err := g.writeIndexWeight(context.Background(), trades, 5)
 	require.NoError(t, err)
 
-	assert.Len(t, f.recorded(), 1, "보유원금이 전부 0 이면 Y:Z 헬퍼를 쓰지 않는다")
+	assert.Len(t, queuedRanges(g), 1, "보유원금이 전부 0 이면 Y:Z 헬퍼를 쓰지 않는다")
 	assert.False(t, g.indexWeightPie.ok)
 }
 
 // 숫자 포맷은 데이터 행(startRow+3)부터 — 제목행/안내행/컬럼헤더에는 걸지 않는다.
 func TestWriteIndexWeight_NumberFormatsStartAtDataRow(t *testing.T) {
-	f := newFakeValues()
+	f := newFakeBatch()
 	g := newFakeGenerator(t, f)
 
 	const startRow = 5
@@ -179,33 +217,35 @@ func TestWriteIndexWeight_NumberFormatsStartAtDataRow(t *testing.T) {
 	}
 }
 
-// 표(A:E) 쓰기 실패는 삼켜지지 않고 전파되며, 이전 실행의 차트 범위도 남지 않는다.
-func TestWriteIndexWeight_PropagatesTableWriteError(t *testing.T) {
-	f := newFakeValues()
-	f.failFrom = 0
+// 모은 값은 포맷 요청과 함께 batchUpdate 1회로 순서대로 보내고, 보낸 뒤 비운다.
+func TestFlushPendingRequests_SendsValuesWithFormatsInOneBatch(t *testing.T) {
+	f := newFakeBatch()
 	g := newFakeGenerator(t, f)
-	g.indexWeightPie = rowRange{start: 1, end: 2, ok: true} // 이전 실행 잔재
-
-	next, err := g.writeIndexWeight(context.Background(), indexWeightFixture(), 5)
 
-	require.Error(t, err)
-	assert.Zero(t, next)
-	assert.False(t, g.indexWeightPie.ok, "표 쓰기가 실패하면 차트 범위를 남기지 않는다")
-	assert.Len(t, f.recorded(), 1, "첫 쓰기에서 멈춘다")
+	_, err := g.writeIndexWeight(context.Background(), indexWeightFixture(), 5)
+	require.NoError(t, err)
+	require.NoError(t, g.flushPendingRequests(context.Background()))
+
+	require.Equal(t, 1, f.calls, "값 + 포맷 요청 1회")
+	reqs := f.batches[0].Requests
+	assert.Equal(t, []string{"A5:E17", "Y5:Z7"}, updateCellsRanges(reqs))
+	assert.Equal(t, int64(7), reqs[0].UpdateCells.Start.SheetId)
+	assert.Equal(t, "userEnteredValue", reqs[0].UpdateCells.Fields, "값만 쓰고 서식은 건드리지 않는다")
+	assert.Positive(t, countNumberFormatRequests(&Generator{pendingRequests: reqs}), "포맷도 같은 배치에")
+	assert.Empty(t, g.pendingRequests)
 }
 
-// 헬퍼(Y:Z) 쓰기만 실패해도 전파된다(표는 이미 써진 뒤라 조용히 넘어가기 쉬운 지점).
-func TestWriteIndexWeight_PropagatesHelperWriteError(t *testing.T) {
-	f := newFakeValues()
-	f.failFrom = 1 // 첫 쓰기(A:E)는 성공, 두 번째(Y:Z)부터 실패
+// 값 쓰기 실패는 삼켜지지 않고 전파된다(GenerateAll 은 에러로 끝난다).
+func TestFlushPendingRequests_PropagatesError(t *testing.T) {
+	f := newFakeBatch()
+	f.failFrom = 0
 	g := newFakeGenerator(t, f)
 
-	next, err := g.writeIndexWeight(context.Background(), indexWeightFixture(), 5)
+	_, err := g.writeIndexWeight(context.Background(), indexWeightFixture(), 5)
+	require.NoError(t, err)
 
-	require.Error(t, err)
-	assert.Zero(t, next)
-	assert.False(t, g.indexWeightPie.ok)
-	assert.Equal(t, []string{"대시보드!A5:E17", "대시보드!Y5:Z7"}, f.recorded())
+	require.Error(t, g.flushPendingRequests(context.Background()))
+	assert.Equal(t, 1, f.calls)
 }
 
 func countNumberFormatRequests(g *Generator) int {
@@ -217,3 +257,66 @@ func countNumberFormatRequests(g *Generator) int {
 	}
 	return n
 }
+
+// dashboardTrades 는 매수·매도가 있는 한 달치 거래(월별 추이·차트가 생기는 최소 입력).
+func dashboardTrades() []model.Trade {
+	trades := indexWeightFixture()
+	for i := range trades {
+		trades[i].Date = "2026-02-13"
+	}
+	return trades
+}
+
+// 대시보드 전체가 메타데이터 조회 1회 + batchUpdate 1회로 끝나고, 초기화(값 비우기·서식 초기화·
+// 기존 차트 삭제)가 같은 배치 맨 앞에 와서 뒤의 값·포맷·차트 요청보다 먼저 적용된다.
+func TestGenerateAll_OneGetAndOneBatch(t *testing.T) {
+	f := newFakeBatch()
+	f.meta = `{"sheets":[{"properties":{"title":"대시보드","sheetId":5},"charts":[{"chartId":11}]}]}`
+	g := newFakeGenerator(t, f)
+
+	require.NoError(t, g.GenerateAll(context.Background(), dashboardTrades()))
+
+	assert.Equal(t, 1, f.gets, "sheetId·차트 ID 를 메타데이터 1회로")
+	require.Equal(t, 1, f.calls, "초기화 + 값 + 포맷 + 차트를 batchUpdate 1회로")
+	reqs := f.batches[0].Requests
+	require.Greater(t, len(reqs), 3)
+	require.NotNil(t, reqs[0].UpdateCells, "값 비우기가 맨 앞")
+	assert.Nil(t, reqs[0].UpdateCells.Rows)
+	assert.Equal(t, int64(5), reqs[0].UpdateCells.Range.SheetId)
+	require.NotNil(t, reqs[1].RepeatCell, "서식 초기화")
+	assert.Equal(t, int64(11), reqs[2].DeleteEmbeddedObject.ObjectId, "기존 차트 삭제")
+
+	var writes, charts int
+	for _, r := range reqs[3:] {
+		assert.Nil(t, r.DeleteEmbeddedObject, "초기화는 앞에만")
+		if r.UpdateCells != nil {
+			writes++
+			assert.Equal(t, int64(5), r.UpdateCells.Start.SheetId)
+		}
+		if r.AddChart != nil {
+			charts++
+		}
+	}
+	assert.Positive(t, writes)
+	assert.Positive(t, charts)
+	assert.Empty(t, g.pendingRequests)
+}
+
+// 대시보드가 없으면 시트 추가가 같은 배치 맨 앞에 오고, 뒤 요청은 미리 정한 그 sheetId 를 쓴다.
+func TestGenerateAll_CreatesDashboardInSameBatch(t *testing.T) {
+	f := newFakeBatch()
+	f.meta = `{"sheets":[{"properties":{"title":"미래에셋증권_IRP","sheetId":0}}]}`
+	g := newFakeGenerator(t, f)
+
+	require.NoError(t, g.GenerateAll(context.Background(), dashboardTrades()))
+
+	assert.Equal(t, 1, f.gets)
+	require.Equal(t, 1, f.calls)
+	reqs := f.batches[0].Requests
+	add := reqs[0].AddSheet
+	require.NotNil(t, add, "시트 추가가 맨 앞")
+	assert.Equal(t, DashboardSheet, add.Properties.Title)
+	assert.NotZero(t, add.Properties.SheetId)
+	require.NotNil(t, reqs[1].UpdateCells)
+	assert.Equal(t, add.Properties.SheetId, reqs[1].UpdateCells.Start.SheetId)
+}
@@ -67,15 +67,35 @@ func aggregateAccountStockCount(trades []model.Trade) []accountStockCount {
 // writeInvestmentMetrics 는 투자 지표 섹션을 작성한다.
 // (Python _write_investment_metrics, py:269-377)
 func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.Trade, startRow int) (int, error) {
-	var buyTrades, sellTrades []model.Trade
+	// 매수/매도 집계(계좌·통화·종목별 매수액, 수익·손실률 합, 종목별 손익)는 한 번의 순회로 모은다.
+	// 매수 거래 목록은 섹터 분류(getSectorMap)와 섹터별 합산에만 쓴다.
+	var buyTrades []model.Trade
 	var totalBuy float64
+	accountBuy := map[string]float64{}
+	currencyBuy := map[string]float64{}
+	stockBuy := map[string]float64{}
+	stockProfit := map[string]float64{}
+	var sellCount int
+	var profitRateSum, lossRateSum float64
+	var profitRateCount, lossRateCount int
 	for _, t := range trades {
 		switch t.TradeType {
 		case "매수":
 			buyTrades = append(buyTrades, t)
 			totalBuy += t.AmountKRW
+			accountBuy[t.Account] += t.AmountKRW
+			currencyBuy[t.Currency] += t.AmountKRW
+			stockBuy[t.StockName] += t.AmountKRW
 		case "매도":
-			sellTrades = append(sellTrades, t)
+			sellCount++
+			stockProfit[t.StockName] += t.ProfitKRW
+			if t.ProfitRate > 0 {
+				profitRateSum += t.ProfitRate
+				profitRateCount++
+			} else if t.ProfitRate < 0 {
+				lossRateSum += t.ProfitRate
+				lossRateCount++
+			}
 		}
 	}
 
@@ -84,10 +104,6 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 
 	// 계좌별 투자비중 (파이 차트용 데이터를 N~O열에 별도 작성).
 	rows = append(rows, []any{"계좌별 투자비중", ""})
-	accountBuy := map[string]float64{}
-	for _, t := range buyTrades {
-		accountBuy[t.Account] += t.AmountKRW
-	}
 	accounts := sortedKeys(accountBuy)
 	var pieData [][]any
 	for _, account := range accounts {
@@ -103,8 +119,7 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 
 	if len(pieData) > 0 {
 		pieEndRow := startRow + len(pieData) - 1
-		rng := fmt.Sprintf("%s!N%d:O%d", DashboardSheet, startRow, pieEndRow)
-		if err := g.client.UpdateCells(ctx, rng, pieData); err != nil {
+		if err := g.queueValues(startRow, 14, pieData); err != nil { // N~O열
 			return 0, err
 		}
 		g.pieDataRange = rowRange{start: startRow, end: pieEndRow, ok: true}
@@ -128,10 +143,6 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 
 	// 통화별 투자비중.
 	rows = append(rows, []any{"통화별 투자비중", ""})
-	currencyBuy := map[string]float64{}
-	for _, t := range buyTrades {
-		currencyBuy[t.Currency] += t.AmountKRW
-	}
 	for _, currency := range sortedKeys(currencyBuy) {
 		pctRows = append(pctRows, len(rows))
 		var ratio float64
@@ -184,19 +195,11 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 	}
 
 	// 상위 5종목 집중도.
-	stockBuy := map[string]float64{}
-	for _, t := range buyTrades {
-		stockBuy[t.StockName] += t.AmountKRW
-	}
-	buyVals := make([]float64, 0, len(stockBuy))
+	top5Vals := topN{n: 5}
 	for _, v := range stockBuy {
-		buyVals = append(buyVals, v)
-	}
-	sort.Sort(sort.Reverse(sort.Float64Slice(buyVals)))
-	var top5sum float64
-	for i := 0; i < len(buyVals) && i < 5; i++ {
-		top5sum += buyVals[i]
+		top5Vals.push(v)
 	}
+	top5sum := top5Vals.sum(5)
 	var top5Ratio float64
 	if totalBuy != 0 {
 		top5Ratio = top5sum / totalBuy
@@ -205,17 +208,6 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 	rows = append(rows, []any{"상위 5종목 집중도", top5Ratio})
 
 	// 평균 수익률 / 평균 손실률.
-	var profitRateSum, lossRateSum float64
-	var profitRateCount, lossRateCount int
-	for _, t := range sellTrades {
-		if t.ProfitRate > 0 {
-			profitRateSum += t.ProfitRate
-			profitRateCount++
-		} else if t.ProfitRate < 0 {
-			lossRateSum += t.ProfitRate
-			lossRateCount++
-		}
-	}
 	var avgProfit, avgLoss float64
 	if profitRateCount > 0 {
 		avgProfit = profitRateSum / float64(profitRateCount) / 100
@@ -236,11 +228,7 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 	rows = append(rows, []any{"손익비", round2(plRatio)})
 
 	// 수익 Top 10 / 손실 Top 10 (종목별 합산).
-	if len(sellTrades) > 0 {
-		stockProfit := map[string]float64{}
-		for _, t := range sellTrades {
-			stockProfit[t.StockName] += t.ProfitKRW
-		}
+	if sellCount > 0 {
 		type sp struct {
 			name   string
 			profit float64
@@ -278,12 +266,10 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 	}
 
 	// 데이터 작성.
-	endRow := startRow + len(rows) - 1
 	// 계좌별 종목수 블록만 C열을 쓴다(나머지 행은 2열 ragged).
-	// 2열 행의 C열이 비워지는 것은 EnsureDashboardSheet 의 A1:Z 선(先)클리어에 의존한다
-	// — 클리어를 없애거나 쓰기 순서를 바꾸면 이전 실행의 C열 값이 남을 수 있다.
-	rng := fmt.Sprintf("%s!A%d:C%d", DashboardSheet, startRow, endRow)
-	if err := g.client.UpdateCells(ctx, rng, rows); err != nil {
+	// 2열 행의 C열이 비워지는 것은 prepareDashboardSheet 가 배치 맨 앞에 넣는 A:Z 값 비우기에 의존한다
+	// — 초기화를 없애거나 그 뒤로 옮기면 이전 실행의 C열 값이 남을 수 있다.
+	if err := g.queueValues(startRow, 1, rows); err != nil { // A~C열
 		return 0, err
 	}
 
@@ -296,24 +282,16 @@ func (g *Generator) writeInvestmentMetrics(ctx context.Context, trades []model.T
 
 // ── 섹션 5: 매매 인사이트 ──────────────────────────────────
 
-// writeTradingInsights 는 매매 인사이트 섹션을 작성한다.
+// writeTradingInsights 는 매매 인사이트 섹션을 작성한다. sellTrades 는 원래 순서의 매도 거래,
+// sortedSells 는 그 date 오름차순 정렬본(GenerateAll 이 한 번 만들어 월별 추이와 공유).
 // (Python _write_trading_insights, py:379-502)
-func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Trade, startRow int) (int, error) {
-	var sellTrades []model.Trade
-	for _, t := range trades {
-		if t.TradeType == "매도" {
-			sellTrades = append(sellTrades, t)
-		}
-	}
-
+func (g *Generator) writeTradingInsights(ctx context.Context, sellTrades, sortedSells []model.Trade, startRow int) (int, error) {
 	rows := [][]any{{"[매매 인사이트]", ""}}
 	var pctRows, krwRows []int
 
 	if len(sellTrades) == 0 {
 		rows = append(rows, []any{"매도 거래 없음", ""})
-		endRow := startRow + len(rows) - 1
-		rng := fmt.Sprintf("%s!A%d:B%d", DashboardSheet, startRow, endRow)
-		if err := g.client.UpdateCells(ctx, rng, rows); err != nil {
+		if err := g.queueValues(startRow, 1, rows); err != nil { // A~B열
 			return 0, err
 		}
 		return startRow + len(rows), nil
@@ -370,7 +348,6 @@ func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Tra
 
 	// --- 5-3. 연속 승/패 기록 ---
 	rows = append(rows, []any{"연속 승/패 기록", ""})
-	sortedSells := sortSellsByDate(sellTrades)
 	maxWins, maxLosses, curWins, curLosses := calcStreaks(sortedSells)
 	rows = append(rows, []any{"  최대 연승", maxWins})
 	rows = append(rows, []any{"  최대 연패", maxLosses})
@@ -382,7 +359,6 @@ func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Tra
 
 	// --- 5-4. 요일별 성과 ---
 	rows = append(rows, []any{"요일별 성과", ""})
-	dayNames := []string{"월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"}
 	dayStats := calcDayOfWeekStats(sortedSells)
 	for weekday := 0; weekday < 7; weekday++ {
 		stats, ok := dayStats[weekday]
@@ -444,24 +420,15 @@ func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Tra
 	for _, t := range sellTrades {
 		stockProfit[t.StockName] += t.ProfitKRW
 	}
-	var positiveVals []float64
+	positiveVals := topN{n: 5}
 	var totalPositive float64
 	for _, v := range stockProfit {
 		if v > 0 {
-			positiveVals = append(positiveVals, v)
+			positiveVals.push(v)
 			totalPositive += v
 		}
 	}
-	sort.Sort(sort.Reverse(sort.Float64Slice(positiveVals)))
-	var top3, top5 float64
-	for i := 0; i < len(positiveVals); i++ {
-		if i < 3 {
-			top3 += positiveVals[i]
-		}
-		if i < 5 {
-			top5 += positiveVals[i]
-		}
-	}
+	top3, top5 := positiveVals.sum(3), positiveVals.sum(5)
 	var top3Ratio, top5Ratio float64
 	if totalPositive != 0 {
 		top3Ratio = top3 / totalPositive
@@ -473,9 +440,7 @@ func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Tra
 	rows = append(rows, []any{"  상위 5종목 수익 비중", top5Ratio})
 
 	// 데이터 작성.
-	endRow := startRow + len(rows) - 1
-	rng := fmt.Sprintf("%s!A%d:B%d", DashboardSheet, startRow, endRow)
-	if err := g.client.UpdateCells(ctx, rng, rows); err != nil {
+	if err := g.queueValues(startRow, 1, rows); err != nil { // A~B열
 		return 0, err
 	}
 
@@ -489,21 +454,15 @@ func (g *Generator) writeTradingInsights(ctx context.Context, trades []model.Tra
 // ── 섹션 6: 월별 성과 추이 ──────────────────────────────────
 
 // writeMonthlyTrend 는 월별 성과 추이 섹션을 작성한다.
+// sortedSells 는 date 오름차순으로 정렬된 매도 거래.
 // (Python _write_monthly_trend, py:504-544)
-func (g *Generator) writeMonthlyTrend(ctx context.Context, trades []model.Trade, startRow int) (int, error) {
+func (g *Generator) writeMonthlyTrend(ctx context.Context, sortedSells []model.Trade, startRow int) (int, error) {
 	headers := []any{
 		"연월", "매도건수", "실현손익(원)", "수익률(%)",
 		"승률(%)", "평균수익률(%)", "평균손실률(%)",
 		"손익비", "Profit Factor", "기대값(원)", "전월대비(%)",
 	}
 
-	var sellTrades []model.Trade
-	for _, t := range trades {
-		if t.TradeType == "매도" {
-			sellTrades = append(sellTrades, t)
-		}
-	}
-	sortedSells := sortSellsByDate(sellTrades)
 	trendData := calcMonthlyTrend(sortedSells)
 
 	rows := make([][]any, 0, len(trendData))
@@ -524,16 +483,14 @@ func (g *Generator) writeMonthlyTrend(ctx context.Context, trades []model.Trade,
 		allRows = append(allRows, headers)
 		allRows = append(allRows, rows...)
 		endRow := startRow + len(rows)
-		rng := fmt.Sprintf("%s!A%d:K%d", DashboardSheet, startRow, endRow)
-		if err := g.client.UpdateCells(ctx, rng, allRows); err != nil {
+		if err := g.queueValues(startRow, 1, allRows); err != nil { // A~K열
 			return 0, err
 		}
 		slog.Info("대시보드 월별 성과 추이 작성", "rows", len(rows))
 		return endRow + 1, nil
 	}
 
-	rng := fmt.Sprintf("%s!A%d:K%d", DashboardSheet, startRow, startRow)
-	if err := g.client.UpdateCells(ctx, rng, [][]any{headers}); err != nil {
+	if err := g.queueValues(startRow, 1, [][]any{headers}); err != nil { // A~K열
 		return 0, err
 	}
 	return startRow + 1, nil
@@ -559,60 +516,53 @@ type monthlyTrendRow struct {
 
 // calcMonthlyTrend 은 정렬된 매도 거래로부터 월별 성과 추이를 계산한다.
 // (Python _calc_monthly_trend, py:547-613)
+//
+// 입력이 날짜순이라 같은 월은 연속 구간을 이루고(월 = 날짜 앞 7자) 구간도 월 오름차순이다.
+// 월별 맵·정렬·거래 복사 없이 구간을 한 번 훑으며 집계한다.
 func calcMonthlyTrend(sortedSells []model.Trade) []monthlyTrendRow {
-	monthGroups := map[string][]model.Trade{}
-	for _, t := range sortedSells {
-		monthGroups[monthOf(t.Date)] = append(monthGroups[monthOf(t.Date)], t)
-	}
-
-	months := make([]string, 0, len(monthGroups))
-	for m := range monthGroups {
-		months = append(months, m)
-	}
-	sort.Strings(months)
-
-	results := make([]monthlyTrendRow, 0, len(months))
+	results := make([]monthlyTrendRow, 0)
 	havePrev := false
 	var prevProfit float64
 
-	for _, month := range months {
-		sells := monthGroups[month]
-		var profitable, losing []model.Trade
-		for _, t := range sells {
-			if t.ProfitKRW > 0 {
-				profitable = append(profitable, t)
-			} else {
-				losing = append(losing, t)
-			}
+	for start := 0; start < len(sortedSells); {
+		month := monthOf(sortedSells[start].Date)
+		end := start + 1
+		for end < len(sortedSells) && monthOf(sortedSells[end].Date) == month {
+			end++
 		}
+		sells := sortedSells[start:end]
+		start = end
 
-		sellCount := len(sells)
+		var profitableCount, losingCount int
 		var totalSellAmount, profitKRW float64
+		var profitRateSum, lossRateSum, grossProfit, grossLoss float64
 		for _, t := range sells {
 			totalSellAmount += t.AmountKRW
 			profitKRW += t.ProfitKRW
+			if t.ProfitKRW > 0 {
+				profitableCount++
+				profitRateSum += t.ProfitRate
+				grossProfit += t.ProfitKRW
+			} else {
+				losingCount++
+				lossRateSum += t.ProfitRate
+				grossLoss += t.ProfitKRW
+			}
 		}
 
+		sellCount := len(sells)
 		var returnRate float64
 		if totalSellAmount != 0 {
 			returnRate = profitKRW / totalSellAmount
 		}
-		winRate := float64(len(profitable)) / float64(sellCount)
+		winRate := float64(profitableCount) / float64(sellCount)
 
 		var avgProfitRate, avgLossRate float64
-		if len(profitable) > 0 {
-			var s float64
-			for _, t := range profitable {
-				s += t.ProfitRate
-			}
-			avgProfitRate = s / float64(len(profitable)) / 100
+		if profitableCount > 0 {
+			avgProfitRate = profitRateSum / float64(profitableCount) / 100
 		}
-		if len(losing) > 0 {
-			var s float64
-			for _, t := range losing {
-				s += t.ProfitRate
-			}
-			avgLossRate = s / float64(len(losing)) / 100
+		if losingCount > 0 {
+			avgLossRate = lossRateSum / float64(losingCount) / 100
 		}
 
 		var plRatio float64
@@ -620,13 +570,6 @@ func calcMonthlyTrend(sortedSells []model.Trade) []monthlyTrendRow {
 			plRatio = math.Abs(avgProfitRate / avgLossRate)
 		}
 
-		var grossProfit, grossLoss float64
-		for _, t := range profitable {
-			grossProfit += t.ProfitKRW
-		}
-		for _, t := range losing {
-			grossLoss += t.ProfitKRW
-		}
 		grossLoss = math.Abs(grossLoss)
 		var profitFactor float64
 		if grossLoss != 0 {
@@ -634,11 +577,11 @@ func calcMonthlyTrend(sortedSells []model.Trade) []monthlyTrendRow {
 		}
 
 		var avgProfitAmount, avgLossAmount float64
-		if len(profitable) > 0 {
-			avgProfitAmount = grossProfit / float64(len(profitable))
+		if profitableCount > 0 {
+			avgProfitAmount = grossProfit / float64(profitableCount)
 		}
-		if len(losing) > 0 {
-			avgLossAmount = grossLoss / float64(len(losing))
+		if losingCount > 0 {
+			avgLossAmount = grossLoss / float64(losingCount)
 		}
 		expectancy := (avgProfitAmount * winRate) - (avgLossAmount * (1 - winRate))
 
@@ -688,6 +631,9 @@ func calcStreaks(sortedSells []model.Trade) (maxWins, maxLosses, curWins, curLos
 	return
 }
 
+// dayNames 는 요일 라벨(월=0 ... 일=6, calcDayOfWeekStats 의 weekday 키와 같은 순서).
+var dayNames = [7]string{"월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"}
+
 // dayStat 은 요일별 (거래건수, 실현손익합, 승률%).
 type dayStat struct {
 	count     int
@@ -902,6 +848,17 @@ func weekdayMondayZero(date string) int {
 	return (int(tm.Weekday()) + 6) % 7
 }
 
+// sellsOf 는 매도 거래만 원래 순서대로 모은다.
+func sellsOf(trades []model.Trade) []model.Trade {
+	var sells []model.Trade
+	for _, t := range trades {
+		if t.TradeType == "매도" {
+			sells = append(sells, t)
+		}
+	}
+	return sells
+}
+
 // sortSellsByDate 는 매도 거래를 date 오름차순으로 안정 정렬한 새 슬라이스를 반환한다.
 // (Python sorted(sell_trades, key=lambda t: t.date))
 func sortSellsByDate(sells []model.Trade) []model.Trade {
@@ -911,6 +868,39 @@ func sortSellsByDate(sells []model.Trade) []model.Trade {
 	return out
 }
 
+// topN 은 값들 중 상위 n 개만 내림차순으로 유지한다. 전체 정렬 없이 O(len·n)
+// 으로 상위 3/5 합계를 구하기 위해 사용한다. (Python heapq.nlargest(n, vals))
+type topN struct {
+	n    int
+	vals []float64
+}
+
+// push 는 v 가 상위 n 개에 들면 내림차순 위치에 삽입하고 최솟값을 밀어낸다.
+func (t *topN) push(v float64) {
+	if len(t.vals) == t.n && v <= t.vals[len(t.vals)-1] {
+		return
+	}
+	i := len(t.vals)
+	if i < t.n {
+		t.vals = append(t.vals, v)
+	} else {
+		i--
+	}
+	for ; i > 0 && t.vals[i-1] < v; i-- {
+		t.vals[i] = t.vals[i-1]
+	}
+	t.vals[i] = v
+}
+
+// sum 은 상위 k 개(k <= n) 값의 합을 큰 값부터 더해 반환한다.
+func (t *topN) sum(k int) float64 {
+	var s float64
+	for i := 0; i < len(t.vals) && i < k; i++ {
+		s += t.vals[i]
+	}
+	return s
+}
+
 // sortedKeys 는 map[string]float64 의 키를 사전식 정렬해 반환한다.
 func sortedKeys(m map[string]float64) []string {
 	keys := make([]string, 0, len(m))
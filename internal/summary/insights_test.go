@@ -2,6 +2,7 @@ package summary
 
 import (
 	"math"
+	"sort"
 	"testing"
 
 	"github.com/kenshin579/auto-trading-journal/internal/model"
@@ -233,6 +234,35 @@ func TestFormatThousands(t *testing.T) {
 	}
 }
 
+// TestTopNMatchesFullSort 는 topN 의 상위 3/5 합계가 전체 내림차순 정렬 후
+// 앞에서부터 더한 값과 같은지 검증한다(중복값·n 미만 입력 포함).
+func TestTopNMatchesFullSort(t *testing.T) {
+	inputs := [][]float64{
+		nil,
+		{7},
+		{3, 1, 2},
+		{5, 9, 1, 9, 3, 7, 7, 2, 8, 0.5},
+		{-1, 4, 4, 4, 4, 4, 4},
+	}
+	for _, in := range inputs {
+		top := topN{n: 5}
+		for _, v := range in {
+			top.push(v)
+		}
+		sorted := append([]float64(nil), in...)
+		sort.Sort(sort.Reverse(sort.Float64Slice(sorted)))
+		for _, k := range []int{3, 5} {
+			var want float64
+			for i := 0; i < len(sorted) && i < k; i++ {
+				want += sorted[i]
+			}
+			if got := top.sum(k); got != want {
+				t.Errorf("topN(%v).sum(%d) = %v, want %v", in, k, got, want)
+			}
+		}
+	}
+}
+
 // tr 는 테스트용 거래를 만든다(계좌별 종목수 집계용).
 func tr(account, tradeType, code, name, currency string, qty float64) model.Trade {
 	return model.Trade{
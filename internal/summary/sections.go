@@ -2,7 +2,6 @@ package summary
 
 import (
 	"context"
-	"fmt"
 	"log/slog"
 	"sort"
 
@@ -50,11 +49,7 @@ func (g *Generator) writePortfolioSummary(ctx context.Context, trades []model.Tr
 		totalReturn, totalCount, winRate,
 	}
 
-	ranges := map[string][][]interface{}{
-		fmt.Sprintf("%s!A%d:G%d", DashboardSheet, startRow, startRow):     {headers},
-		fmt.Sprintf("%s!A%d:G%d", DashboardSheet, startRow+1, startRow+1): {values},
-	}
-	if err := g.client.BatchUpdateValues(ctx, ranges); err != nil {
+	if err := g.queueValues(startRow, 1, [][]any{headers, values}); err != nil { // A~G열
 		return 0, err
 	}
 
@@ -78,18 +73,24 @@ func aggregateMonthly(trades []model.Trade) []monthlyRow {
 		buyCount, sellCount           int
 		buyAmount, sellAmount, profit float64
 	}
-	groups := make(map[key]*agg)
+	// 그룹마다 포인터를 할당하지 않고 키 → 인덱스 맵으로 연속 슬라이스에 누적한다.
+	idx := make(map[key]int)
+	var keys []key
+	var aggs []agg
 	for _, t := range trades {
 		month := t.Date
 		if len(month) >= 7 {
 			month = t.Date[:7]
 		}
 		k := key{month, t.Account}
-		a := groups[k]
-		if a == nil {
-			a = &agg{}
-			groups[k] = a
+		i, ok := idx[k]
+		if !ok {
+			i = len(aggs)
+			idx[k] = i
+			keys = append(keys, k)
+			aggs = append(aggs, agg{})
 		}
+		a := &aggs[i]
 		switch t.TradeType {
 		case "매수":
 			a.buyCount++
@@ -101,10 +102,6 @@ func aggregateMonthly(trades []model.Trade) []monthlyRow {
 		}
 	}
 
-	keys := make([]key, 0, len(groups))
-	for k := range groups {
-		keys = append(keys, k)
-	}
 	sort.Slice(keys, func(i, j int) bool {
 		if keys[i].month != keys[j].month {
 			return keys[i].month < keys[j].month
@@ -114,7 +111,7 @@ func aggregateMonthly(trades []model.Trade) []monthlyRow {
 
 	rows := make([]monthlyRow, 0, len(keys))
 	for _, k := range keys {
-		a := groups[k]
+		a := aggs[idx[k]]
 		var rt float64
 		if a.sellAmount != 0 {
 			rt = a.profit / a.sellAmount
@@ -140,8 +137,7 @@ func (g *Generator) writeMonthlySummary(ctx context.Context, trades []model.Trad
 	rows := aggregateMonthly(trades)
 
 	if len(rows) == 0 {
-		rng := fmt.Sprintf("%s!A%d:H%d", DashboardSheet, startRow, startRow)
-		if err := g.client.BatchUpdateValues(ctx, map[string][][]interface{}{rng: {headers}}); err != nil {
+		if err := g.queueValues(startRow, 1, [][]any{headers}); err != nil { // A~H열
 			return 0, err
 		}
 		return startRow + 1, nil
@@ -158,8 +154,7 @@ func (g *Generator) writeMonthlySummary(ctx context.Context, trades []model.Trad
 		})
 	}
 	endRow := startRow + len(rows)
-	rng := fmt.Sprintf("%s!A%d:H%d", DashboardSheet, startRow, endRow)
-	if err := g.client.BatchUpdateValues(ctx, map[string][][]interface{}{rng: allRows}); err != nil {
+	if err := g.queueValues(startRow, 1, allRows); err != nil { // A~H열
 		return 0, err
 	}
 	slog.Info("대시보드 월별 성과 작성", "rows", len(rows))
@@ -190,14 +185,20 @@ func aggregateStock(trades []model.Trade) []stockRow {
 	type agg struct {
 		buyQty, buyAmount, sellQty, sellAmount, profit float64
 	}
-	groups := make(map[stockKey]*agg)
+	// aggregateMonthly 와 같이 키 → 인덱스 맵 + 연속 슬라이스로 누적한다.
+	idx := make(map[stockKey]int)
+	var keys []stockKey
+	var aggs []agg
 	for _, t := range trades {
 		k := stockKeyOf(t)
-		a := groups[k]
-		if a == nil {
-			a = &agg{}
-			groups[k] = a
+		i, ok := idx[k]
+		if !ok {
+			i = len(aggs)
+			idx[k] = i
+			keys = append(keys, k)
+			aggs = append(aggs, agg{})
 		}
+		a := &aggs[i]
 		switch t.TradeType {
 		case "매수":
 			a.buyQty += t.Quantity
@@ -210,14 +211,10 @@ func aggregateStock(trades []model.Trade) []stockRow {
 	}
 
 	var totalBuyAmount float64
-	for _, a := range groups {
+	for _, a := range aggs {
 		totalBuyAmount += a.buyAmount
 	}
 
-	keys := make([]stockKey, 0, len(groups))
-	for k := range groups {
-		keys = append(keys, k)
-	}
 	sort.Slice(keys, func(i, j int) bool {
 		if keys[i].name != keys[j].name {
 			return keys[i].name < keys[j].name
@@ -233,7 +230,7 @@ func aggregateStock(trades []model.Trade) []stockRow {
 
 	rows := make([]stockRow, 0, len(keys))
 	for _, k := range keys {
-		a := groups[k]
+		a := aggs[idx[k]]
 		var rt, weight float64
 		if a.sellAmount != 0 {
 			rt = a.profit / a.sellAmount
@@ -263,8 +260,7 @@ func (g *Generator) writeStockSummary(ctx context.Context, trades []model.Trade,
 	rows := aggregateStock(trades)
 
 	if len(rows) == 0 {
-		rng := fmt.Sprintf("%s!A%d:K%d", DashboardSheet, startRow, startRow)
-		if err := g.client.BatchUpdateValues(ctx, map[string][][]interface{}{rng: {headers}}); err != nil {
+		if err := g.queueValues(startRow, 1, [][]any{headers}); err != nil { // A~K열
 			return 0, err
 		}
 		return startRow + 1, nil
@@ -282,18 +278,15 @@ func (g *Generator) writeStockSummary(ctx context.Context, trades []model.Trade,
 	}
 	endRow := startRow + len(rows)
 
-	// 종목코드 컬럼(A=1)을 쓰기 전에 TEXT 로 → USER_ENTERED 숫자 변환 방지(정렬·앞0 보존).
-	// (Python apply_number_format_to_columns col=1 '@' TEXT, py:253-257)
-	if err := g.client.ApplyNumberFormatToColumns(
-		ctx, DashboardSheet,
+	// 종목코드 컬럼(A=1)은 TEXT 포맷. 값은 문자열 그대로 기록되므로(앞0 보존) 순서 제약 없이
+	// 다른 포맷 요청과 함께 보낸다. (Python apply_number_format_to_columns col=1 '@' TEXT, py:253-257)
+	g.pendingRequests = append(g.pendingRequests, sheets.BuildNumberFormatRequests(
+		g.dashboardSheetID,
 		[]sheets.ColumnFormat{{Col: 1, Pattern: "@", Type: "TEXT"}},
 		startRow, endRow,
-	); err != nil {
-		return 0, err
-	}
+	)...)
 
-	rng := fmt.Sprintf("%s!A%d:K%d", DashboardSheet, startRow, endRow)
-	if err := g.client.BatchUpdateValues(ctx, map[string][][]interface{}{rng: allRows}); err != nil {
+	if err := g.queueValues(startRow, 1, allRows); err != nil { // A~K열
 		return 0, err
 	}
 	slog.Info("대시보드 종목별 현황 작성", "rows", len(rows))
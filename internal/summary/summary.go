@@ -45,7 +45,7 @@ type Generator struct {
 
 	// 차트/포맷 수집 상태.
 	dashboardSheetID int64
-	pendingRequests  []*gsheets.Request // 포맷/색상 요청 누적 (#57 1회 batchUpdate)
+	pendingRequests  []*gsheets.Request // 값/포맷/색상/차트 요청 누적 (#57 1회 batchUpdate)
 
 	// 차트가 참조할 데이터 범위 (start,end 1-based, ok=true 일 때 유효).
 	pieDataRange        rowRange           // 파이 차트용 데이터 (계좌별 투자비중)
@@ -69,16 +69,11 @@ func New(client *sheets.Client, w *writer.Writer, sc SectorClassifier) *Generato
 // GenerateAll 은 대시보드 시트를 초기화 후 재작성한다. (Python generate_all)
 func (g *Generator) GenerateAll(ctx context.Context, trades []model.Trade) error {
 	g.pendingRequests = nil
-	if err := g.EnsureDashboardSheet(ctx); err != nil {
-		return err
-	}
-
-	// sheet_id 1회 조회 후 캐시.
-	sheetID, _, err := g.client.GetSheetID(ctx, DashboardSheet)
+	// 시트 생성 또는 초기화 요청이 pendingRequests 맨 앞에 들어가고 dashboardSheetID 가 정해진다.
+	created, err := g.prepareDashboardSheet(ctx)
 	if err != nil {
 		return err
 	}
-	g.dashboardSheetID = sheetID
 
 	currentRow := 1
 	if currentRow, err = g.writePortfolioSummary(ctx, trades, currentRow); err != nil {
@@ -100,12 +95,15 @@ func (g *Generator) GenerateAll(ctx context.Context, trades []model.Trade) error
 	}
 	currentRow++ // 빈 행
 	insightsStart := currentRow
-	if currentRow, err = g.writeTradingInsights(ctx, trades, currentRow); err != nil {
+	// 매도 거래 필터와 date 정렬은 매매 인사이트·월별 추이가 함께 쓰므로 한 번만 만든다.
+	sells := sellsOf(trades)
+	sortedSells := sortSellsByDate(sells)
+	if currentRow, err = g.writeTradingInsights(ctx, sells, sortedSells, currentRow); err != nil {
 		return err
 	}
 	currentRow++ // 빈 행
 	trendStart := currentRow
-	if currentRow, err = g.writeMonthlyTrend(ctx, trades, currentRow); err != nil {
+	if currentRow, err = g.writeMonthlyTrend(ctx, sortedSells, currentRow); err != nil {
 		return err
 	}
 	trendEnd := currentRow // 월별 성과 추이 끝(차트/포맷 범위 — 아래 나라별 섹션 삽입 전 보존)
@@ -132,55 +130,44 @@ func (g *Generator) GenerateAll(ctx context.Context, trades []model.Trade) error
 		return err
 	}
 
-	// 수집된 포맷/색상 요청을 1회 batchUpdate 로 전송. (#57) (Python py:79)
+	// 차트는 값 범위를 참조하므로 값·포맷/색상 요청 뒤에 붙여 같은 batchUpdate 로 보낸다.
+	// (Python py:81-85)
+	g.collectCharts(trendStart, trendEnd)
+
+	// 시트 초기화 + 섹션별로 모은 값(updateCells) + 포맷/색상/차트 요청을 1회 batchUpdate 로 전송.
+	// batchUpdate 는 요청을 순서대로 적용하므로 초기화가 먼저 끝난다. (#57) (Python py:79)
 	if err := g.flushPendingRequests(ctx); err != nil {
 		return err
 	}
-
-	// 차트 생성. (Python py:81-85)
-	if err := g.createCharts(ctx, trendStart, trendEnd); err != nil {
-		return err
+	if created {
+		// 배치로 추가한 시트는 ID 캐시에 없으므로 다음 조회 때 다시 받게 한다.
+		g.client.InvalidateSheetIDCache()
 	}
 
 	slog.Info("대시보드 시트 갱신 완료")
 	return nil
 }
 
-// EnsureDashboardSheet 는 대시보드 시트를 확보한다(없으면 생성, 있으면 초기화).
+// prepareDashboardSheet 는 대시보드 시트 확보 요청을 pendingRequests 에 넣는다(없으면 생성,
+// 있으면 초기화). 메타데이터 조회 1회로 sheetId 와 지울 차트 ID 를 함께 받아 dashboardSheetID 를
+// 정하고, 실제 적용은 섹션 쓰기와 함께 flushPendingRequests 에서 한다. 반환값: 새로 만들었는지 여부.
 // (Python _ensure_dashboard_sheet)
-func (g *Generator) EnsureDashboardSheet(ctx context.Context) error {
-	names, err := g.client.ListSheets(ctx)
+func (g *Generator) prepareDashboardSheet(ctx context.Context) (bool, error) {
+	sheetID, chartIDs, exists, err := g.client.GetSheetChartIDs(ctx, DashboardSheet)
 	if err != nil {
-		return err
-	}
-	exists := false
-	for _, n := range names {
-		if n == DashboardSheet {
-			exists = true
-			break
-		}
+		return false, err
 	}
 
 	if !exists {
-		return g.client.CreateSheet(ctx, DashboardSheet)
-	}
-
-	// 데이터 삭제 (values:clear — 별도 엔드포인트). Python clear_sheet(start_row=1) → "A1:Z".
-	if err := g.client.ClearValues(ctx, DashboardSheet+"!A1:Z"); err != nil {
-		return err
+		newID, req := g.client.BuildAddSheetRequest(DashboardSheet)
+		g.dashboardSheetID = newID
+		g.pendingRequests = append(g.pendingRequests, req)
+		return true, nil
 	}
 
-	// 배경색 초기화 (기본 1000행/26열).
-	if err := g.client.ClearBackgroundColors(ctx, DashboardSheet, 1000, 26); err != nil {
-		return err
-	}
-	// 숫자 포맷 초기화.
-	if err := g.client.ClearNumberFormats(ctx, DashboardSheet, 1000, 26); err != nil {
-		return err
-	}
-	// 차트 삭제.
-	if err := g.client.DeleteAllCharts(ctx, DashboardSheet); err != nil {
-		return err
-	}
-	return nil
+	// 데이터 삭제(A:Z 전체 행, Python clear_sheet(start_row=1) → "A1:Z") + 배경색·숫자 포맷
+	// 초기화(기본 1000행/26열) + 차트 삭제.
+	g.dashboardSheetID = sheetID
+	g.pendingRequests = append(g.pendingRequests, sheets.BuildResetSheetRequests(sheetID, chartIDs, 1000, 26)...)
+	return false, nil
 }
@@ -102,8 +102,14 @@ func cacheDir() string {
 
 func fetchZip(url, cacheName string) ([]byte, error) {
 	path := filepath.Join(cacheDir(), cacheName)
-	if fi, err := os.Stat(path); err == nil && time.Since(fi.ModTime()) < cacheTTL {
-		return os.ReadFile(path)
+	// 캐시 파일은 한 번만 연다: 같은 핸들로 TTL 판정(fstat)과 읽기를 하고,
+	// 만료됐으면 열어 둔 채 다운로드 실패 시 폴백으로 읽는다(stat→open 사이 경합 없음).
+	cached, cerr := os.Open(path)
+	if cerr == nil {
+		defer cached.Close()
+		if fi, err := cached.Stat(); err == nil && time.Since(fi.ModTime()) < cacheTTL {
+			return io.ReadAll(cached)
+		}
 	}
 	resp, err := http.Get(url) //nolint:gosec
 	if err == nil {
@@ -117,8 +123,10 @@ func fetchZip(url, cacheName string) ([]byte, error) {
 		}
 	}
 	// Fall back to stale cache if present
-	if b, ferr := os.ReadFile(path); ferr == nil {
-		return b, nil
+	if cerr == nil {
+		if b, ferr := io.ReadAll(cached); ferr == nil {
+			return b, nil
+		}
 	}
 	return nil, err
 }
@@ -2,7 +2,10 @@
 // Python modules/sheet_writer.py 의 Go 포팅.
 package writer
 
-import "github.com/kenshin579/auto-trading-journal/internal/sheets"
+import (
+	"github.com/kenshin579/auto-trading-journal/internal/model"
+	"github.com/kenshin579/auto-trading-journal/internal/sheets"
+)
 
 // DomesticHeaders 는 국내계좌 시트 헤더(12컬럼). (Python DOMESTIC_HEADERS)
 var DomesticHeaders = []string{
@@ -72,6 +75,44 @@ var CurrencyPatterns = map[string]string{
 // CurrencyPatternDefault 는 통화 매핑이 없을 때 기본 패턴. (Python CURRENCY_PATTERN_DEFAULT)
 const CurrencyPatternDefault = "#,##0.00"
 
+// sheetProfile 은 계좌 유형(국내/해외)마다 고정된 시트 구성값이다. 패키지 초기화 때 두 벌만
+// 만들어 두고, 시트 생성·서식·키 조회·삽입 경로가 isForeign 분기를 반복하지 않고 꺼내 쓴다.
+type sheetProfile struct {
+	headers []string
+	codeCol int // 종목코드 열(1-based). 숫자로 보여도 TEXT 로 다룬다.
+
+	// 중복 키 열(0-based)과 키 조회 범위의 끝 열 문자(단가 열).
+	nameCol, qtyCol, priceCol int
+	keyEndCol                 string
+
+	// toRow 는 Trade 를 이 시트의 행(헤더 폭 그대로)으로 변환한다.
+	toRow func(model.Trade) []any
+}
+
+var (
+	domesticProfile = newSheetProfile(false)
+	foreignProfile  = newSheetProfile(true)
+)
+
+func newSheetProfile(isForeign bool) *sheetProfile {
+	p := &sheetProfile{headers: DomesticHeaders, toRow: model.Trade.ToDomesticRow}
+	if isForeign {
+		p.headers, p.toRow = ForeignHeaders, model.Trade.ToForeignRow
+	}
+	p.codeCol = indexOf(p.headers, "종목코드") + 1
+	p.nameCol, p.qtyCol, p.priceCol = keyColsForGrid(isForeign)
+	p.keyEndCol = colLetter(p.priceCol + 1)
+	return p
+}
+
+// profileFor 는 계좌 유형별 시트 구성값을 반환한다.
+func profileFor(isForeign bool) *sheetProfile {
+	if isForeign {
+		return foreignProfile
+	}
+	return domesticProfile
+}
+
 // indexOf 는 문자열 슬라이스에서 값의 0-based 위치를 반환한다(없으면 -1).
 func indexOf(ss []string, v string) int {
 	for i, s := range ss {
@@ -48,22 +48,17 @@ func migrationInserts(oldHeader, newHeader []string) ([]colRun, bool) {
 	return runs, true
 }
 
-// ensureNewFormat 은 기존 시트가 구 포맷이면 신 포맷으로 자동 마이그레이션한다.
-// 신 포맷/빈 시트/매매일지 아님 → no-op. 시트 헤더만 1회 조회한다.
-func (w *Writer) ensureNewFormat(ctx context.Context, sheetName string) error {
-	headerVals, err := w.client.GetValues(ctx, sheetName+"!A1:Q1")
-	if err != nil {
-		return err
-	}
-	headerRow := extractHeaderRow(headerVals)
+// migrateIfOld 는 headerRow 가 구 포맷이면 시트를 신 포맷으로 자동 마이그레이션하고 true 를 반환한다.
+// 신 포맷/빈 시트/매매일지 아님 → no-op(false). 헤더는 호출 측이 이미 읽어 온 것을 쓴다.
+func (w *Writer) migrateIfOld(ctx context.Context, sheetName string, headerRow []string) (bool, error) {
 	switch {
 	case headersEqual(headerRow, OldDomesticHeadersV2),
 		headersEqual(headerRow, OldDomesticHeadersV1):
-		return w.migrateSheet(ctx, sheetName, headerRow, DomesticHeaders)
+		return true, w.migrateSheet(ctx, sheetName, headerRow, DomesticHeaders)
 	case headersEqual(headerRow, OldForeignHeadersV1):
-		return w.migrateSheet(ctx, sheetName, headerRow, ForeignHeaders)
+		return true, w.migrateSheet(ctx, sheetName, headerRow, ForeignHeaders)
 	}
-	return nil
+	return false, nil
 }
 
 // migrateSheet 은 구 포맷 시트를 신 포맷으로 자동 변환한다.
@@ -83,7 +78,7 @@ func (w *Writer) migrateSheet(ctx context.Context, sheetName string, oldHeader,
 	if err := w.client.UpdateCells(ctx, sheetName+"!A1", [][]interface{}{toAnyRow(newHeader)}); err != nil {
 		return fmt.Errorf("writer: 시트 %s 헤더 갱신: %w", sheetName, err)
 	}
-	w.invalidateCache()
+	// 열 삽입은 시트 목록·ID 를 바꾸지 않으므로 캐시는 그대로 둔다.
 	slog.Info("시트 자동 마이그레이션 완료(섹터/산업 열 삽입)", "sheet", sheetName,
 		"old_cols", len(oldHeader), "new_cols", len(newHeader))
 	return nil
@@ -24,22 +24,24 @@ const tradeGridRange = "A1:Q10000"
 //   - 구 포맷 헤더 → 자동 마이그레이션 후 재조회
 //   - 그 외 → 스킵(매매일지 시트 아님)
 //
-// 읽기 쿼터(분당 60회)를 아끼기 위해 **시트당 그리드 조회 1회**만 사용한다
-// (헤더는 조회 결과의 1행에서 얻는다).
+// 읽기 쿼터(분당 60회)를 아끼기 위해 **모든 시트의 그리드를 조회 1회**로 읽는다
+// (헤더는 각 그리드의 1행에서 얻는다).
 //
 // 조회 실패는 스킵하지 않고 **에러로 전파**한다. 일부 시트만 실패한 채 진행하면
 // 호출측(대시보드)이 부분 데이터로 시트를 통째로 재작성해 기존 내용을 잃는다.
 //
 // NFD/NFC 유니코드 중복 시트는 하나만 읽는다.
+//
+// 헤더 판별/마이그레이션/변환은 조회가 끝난 뒤 시트 순서대로 처리한다.
 func (w *Writer) ReadAllTrades(ctx context.Context) ([]model.Trade, error) {
 	names, err := w.client.ListSheets(ctx)
 	if err != nil {
 		return nil, err
 	}
 
-	allTrades := make([]model.Trade, 0)
-	seen := make(map[string]bool)
-
+	targets := make([]string, 0, len(names))
+	normalizedNames := make([]string, 0, len(names))
+	seen := make(map[string]bool, len(names))
 	for _, sheetName := range names {
 		// NFD/NFC 유니코드 중복 시트 방지.
 		normalized := norm.NFC.String(sheetName)
@@ -48,11 +50,19 @@ func (w *Writer) ReadAllTrades(ctx context.Context) ([]model.Trade, error) {
 			continue
 		}
 		seen[normalized] = true
+		targets = append(targets, sheetName)
+		normalizedNames = append(normalizedNames, normalized)
+	}
 
-		grid, err := w.client.GetRawGridData(ctx, sheetName, tradeGridRange)
-		if err != nil {
-			return nil, fmt.Errorf("시트 '%s' 읽기 실패: %w", sheetName, err)
-		}
+	grids, err := w.client.GetRawGridDataMulti(ctx, targets, tradeGridRange)
+	if err != nil {
+		return nil, fmt.Errorf("매매일지 시트 읽기 실패: %w", err)
+	}
+
+	allTrades := make([]model.Trade, 0)
+	for i, sheetName := range targets {
+		normalized := normalizedNames[i]
+		grid := grids[i]
 		headerRow := headerFromGrid(grid)
 		if len(headerRow) == 0 {
 			continue
@@ -111,6 +121,8 @@ func tradesFromGrid(grid *gsheets.GridData, isForeign bool, account string) []mo
 	}
 
 	trades := make([]model.Trade, 0, len(grid.RowData)-1)
+	// tradeFromRow 는 행을 보관하지 않으므로 gridRow 하나를 모든 행이 공유한다.
+	g := &gridRow{}
 	for _, row := range grid.RowData[1:] { // 1행(헤더) 제외
 		values := row.Values
 		if len(values) < minCols {
@@ -120,10 +132,8 @@ func tradesFromGrid(grid *gsheets.GridData, isForeign bool, account string) []mo
 		if dateVal == "" {
 			continue
 		}
-		// 그리드 셀을 plain row 로 변환: col0=날짜(formattedValue), 나머지=effectiveValue.
-		plain := gridRowToPlain(values, dateVal)
-		tr := rowToTrade(plain, isForeign, account)
-		trades = append(trades, tr)
+		g.values, g.date = values, dateVal
+		trades = append(trades, tradeFromRow(g, isForeign, account))
 	}
 	return trades
 }
@@ -148,18 +158,75 @@ func headerFromGrid(grid *gsheets.GridData) []string {
 	return out
 }
 
-// gridRowToPlain 은 그리드 셀 리스트를 []interface{} 로 변환한다.
-// col0 은 dateVal(formattedValue), 나머지는 effectiveValue(string/float64/nil).
-func gridRowToPlain(values []*gsheets.CellData, dateVal string) []interface{} {
-	plain := make([]interface{}, len(values))
-	for i, cell := range values {
-		if i == 0 {
-			plain[i] = dateVal
-			continue
+// tradeRow 는 tradeFromRow 가 열 값을 꺼내는 방식이다.
+// plain 행([]interface{})과 그리드 셀 행이 같은 변환 규칙(getNum/getStr/getCode)을 공유한다.
+type tradeRow interface {
+	num(i int) float64
+	str(i int) string
+	code(i int) string
+}
+
+// plainRow 는 string/float64/nil 값으로 된 행이다(테스트·Values API).
+type plainRow []interface{}
+
+func (r plainRow) num(i int) float64 { return getNum(r, i) }
+func (r plainRow) str(i int) string  { return getStr(r, i) }
+func (r plainRow) code(i int) string { return getCode(r, i) }
+
+// gridRow 는 그리드 셀을 []interface{} 로 옮기지 않고 그대로 읽는 행이다.
+// 숫자 셀마다 interface 박싱(할당)이 생기지 않는다. col0 은 date(formattedValue),
+// 나머지는 effectiveValue 를 plainRow 와 같은 규칙으로 해석한다.
+type gridRow struct {
+	values []*gsheets.CellData
+	date   string
+}
+
+func (g *gridRow) effective(i int) *gsheets.ExtendedValue {
+	if i < 0 || i >= len(g.values) || g.values[i] == nil {
+		return nil
+	}
+	return g.values[i].EffectiveValue
+}
+
+func (g *gridRow) num(i int) float64 {
+	ev := g.effective(i)
+	switch {
+	case ev == nil:
+		return 0
+	case ev.StringValue != nil:
+		if f, err := strconv.ParseFloat(strings.ReplaceAll(*ev.StringValue, ",", ""), 64); err == nil {
+			return f
 		}
-		plain[i] = cellEffective(cell)
+		return 0
+	case ev.NumberValue != nil:
+		return *ev.NumberValue
+	default:
+		return 0
+	}
+}
+
+func (g *gridRow) str(i int) string {
+	if i == 0 {
+		return g.date
+	}
+	if ev := g.effective(i); ev != nil && ev.StringValue != nil {
+		return *ev.StringValue
+	}
+	return ""
+}
+
+func (g *gridRow) code(i int) string {
+	ev := g.effective(i)
+	switch {
+	case ev == nil:
+		return ""
+	case ev.StringValue != nil:
+		return *ev.StringValue
+	case ev.NumberValue != nil:
+		return normalizeNum(*ev.NumberValue)
+	default:
+		return ""
 	}
-	return plain
 }
 
 // rowToTrade 는 시트 행 데이터를 Trade 객체로 변환한다(ToDomesticRow/ToForeignRow 의 역변환).
@@ -167,52 +234,57 @@ func gridRowToPlain(values []*gsheets.CellData, dateVal string) []interface{} {
 //
 // 저장된 수익률은 소수(0.0714)이므로 *100 하여 ProfitRate(7.14)로 복원한다.
 func rowToTrade(row []interface{}, isForeign bool, account string) model.Trade {
-	date := getStr(row, 0)
+	return tradeFromRow(plainRow(row), isForeign, account)
+}
+
+// tradeFromRow 는 rowToTrade 의 본체로, 열 값은 tradeRow 로 꺼낸다.
+func tradeFromRow(row tradeRow, isForeign bool, account string) model.Trade {
+	date := row.str(0)
 	if isForeign {
 		// 해외 17컬럼: 0일자 1구분 2통화 3종목코드 4종목명 5섹터 6산업 7수량 8단가
 		//              9금액(외화) 10환율 11금액(원화) 12수수료 13세금 14손익(외화) 15손익(원화) 16수익률
 		return model.Trade{
 			Date:         date,
-			TradeType:    getStr(row, 1),
-			Currency:     getStr(row, 2),
-			StockCode:    getCode(row, 3),
-			StockName:    getStr(row, 4),
-			Sector:       getStr(row, 5),
-			Industry:     getStr(row, 6),
-			Quantity:     getNum(row, 7),
-			Price:        getNum(row, 8),
-			Amount:       getNum(row, 9),
-			ExchangeRate: getNum(row, 10),
-			AmountKRW:    getNum(row, 11),
-			Fee:          getNum(row, 12),
-			Tax:          getNum(row, 13),
-			Profit:       getNum(row, 14),
-			ProfitKRW:    getNum(row, 15),
-			ProfitRate:   getNum(row, 16) * 100,
+			TradeType:    row.str(1),
+			Currency:     row.str(2),
+			StockCode:    row.code(3),
+			StockName:    row.str(4),
+			Sector:       row.str(5),
+			Industry:     row.str(6),
+			Quantity:     row.num(7),
+			Price:        row.num(8),
+			Amount:       row.num(9),
+			ExchangeRate: row.num(10),
+			AmountKRW:    row.num(11),
+			Fee:          row.num(12),
+			Tax:          row.num(13),
+			Profit:       row.num(14),
+			ProfitKRW:    row.num(15),
+			ProfitRate:   row.num(16) * 100,
 			Account:      account,
 		}
 	}
 	// 국내 12컬럼: 0일자 1구분 2종목코드 3종목명 4섹터 5산업 6수량 7단가 8금액 9수수료 10손익 11수익률
-	amount := getNum(row, 8)
-	profit := getNum(row, 10)
+	amount := row.num(8)
+	profit := row.num(10)
 	return model.Trade{
 		Date:         date,
-		TradeType:    getStr(row, 1),
-		StockCode:    getCode(row, 2),
-		StockName:    getStr(row, 3),
-		Sector:       getStr(row, 4),
-		Industry:     getStr(row, 5),
-		Quantity:     getNum(row, 6),
-		Price:        getNum(row, 7),
+		TradeType:    row.str(1),
+		StockCode:    row.code(2),
+		StockName:    row.str(3),
+		Sector:       row.str(4),
+		Industry:     row.str(5),
+		Quantity:     row.num(6),
+		Price:        row.num(7),
 		Amount:       amount,
 		Currency:     "KRW",
 		ExchangeRate: 1.0,
 		AmountKRW:    amount,
-		Fee:          getNum(row, 9),
+		Fee:          row.num(9),
 		Tax:          0.0,
 		Profit:       profit,
 		ProfitKRW:    profit,
-		ProfitRate:   getNum(row, 11) * 100,
+		ProfitRate:   row.num(11) * 100,
 		Account:      account,
 	}
 }
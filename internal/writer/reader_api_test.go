@@ -5,9 +5,11 @@ import (
 	"encoding/json"
 	"net/http"
 	"net/http/httptest"
+	"strings"
 	"sync"
 	"testing"
 
+	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -17,15 +19,23 @@ import (
 // fakeSheets 는 Sheets API 를 흉내내며 어떤 경로가 몇 번 호출됐는지 기록한다.
 type fakeSheets struct {
 	mu sync.Mutex
-	// gridCalls: ranges 파라미터가 있는 Spreadsheets.Get (그리드 조회) 횟수
+	// gridCalls: ranges 파라미터가 있는 Spreadsheets.Get (그리드 조회) 횟수(범위 수와 무관)
 	gridCalls int
 	// metaCalls: ranges 없는 Spreadsheets.Get (메타데이터/시트목록) 횟수
 	metaCalls int
-	// valuesCalls: Values.Get (values 엔드포인트) 횟수
+	// valuesCalls: Values.Get / Values.BatchGet (values 엔드포인트) 횟수
 	valuesCalls int
+	// batchUpdates: Spreadsheets.BatchUpdate 로 받아 성공 처리한 요청 본문(순서대로)
+	batchUpdates []*gsheets.BatchUpdateSpreadsheetRequest
+	// batchAttempts: 실패 응답을 포함한 Spreadsheets.BatchUpdate 호출 수
+	batchAttempts int
+	// batchFail 이 true 를 반환하면 그 batchUpdate 는 400 으로 실패한다(아무것도 적용 안 됨).
+	batchFail func(req *gsheets.BatchUpdateSpreadsheetRequest) bool
 
 	sheetNames []string
 	gridBody   func(sheetName string) (int, string)
+	// valuesBody 는 Values 엔드포인트 응답 본문. nil 이면 빈 값.
+	valuesBody func(r *http.Request) string
 }
 
 func (f *fakeSheets) ServeHTTP(w http.ResponseWriter, r *http.Request) {
@@ -33,9 +43,30 @@ func (f *fakeSheets) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	defer f.mu.Unlock()
 	w.Header().Set("Content-Type", "application/json")
 
-	if idx := indexOfSubstr(r.URL.Path, "/values/"); idx >= 0 {
+	if idx := indexOfSubstr(r.URL.Path, "/values"); idx >= 0 {
 		f.valuesCalls++
-		_, _ = w.Write([]byte(`{"values":[]}`))
+		body := `{"values":[]}`
+		if strings.HasSuffix(r.URL.Path, ":batchGet") {
+			body = `{"valueRanges":[]}`
+		}
+		if f.valuesBody != nil {
+			body = f.valuesBody(r)
+		}
+		_, _ = w.Write([]byte(body))
+		return
+	}
+
+	if strings.HasSuffix(r.URL.Path, ":batchUpdate") {
+		req := &gsheets.BatchUpdateSpreadsheetRequest{}
+		_ = json.NewDecoder(r.Body).Decode(req)
+		f.batchAttempts++
+		if f.batchFail != nil && f.batchFail(req) {
+			w.WriteHeader(http.StatusBadRequest)
+			_, _ = w.Write([]byte(`{"error":{"code":400,"message":"invalid sheetId"}}`))
+			return
+		}
+		f.batchUpdates = append(f.batchUpdates, req)
+		_, _ = w.Write([]byte(`{}`))
 		return
 	}
 
@@ -53,14 +84,30 @@ func (f *fakeSheets) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// 그리드 조회: 범위마다 gridBody 를 받아 시트 제목을 붙여 한 응답으로 합친다.
+	// 어느 범위든 실패 응답이면 요청 전체가 그 응답으로 실패한다.
 	f.gridCalls++
-	sheetName := ranges[0]
-	if i := indexOfSubstr(sheetName, "!"); i >= 0 {
-		sheetName = sheetName[:i]
+	merged := &gsheets.Spreadsheet{}
+	for _, rng := range ranges {
+		sheetName := rng
+		if i := indexOfSubstr(sheetName, "!"); i >= 0 {
+			sheetName = sheetName[:i]
+		}
+		status, body := f.gridBody(sheetName)
+		if status != http.StatusOK {
+			w.WriteHeader(status)
+			_, _ = w.Write([]byte(body))
+			return
+		}
+		ss := &gsheets.Spreadsheet{}
+		_ = json.Unmarshal([]byte(body), ss)
+		for _, sh := range ss.Sheets {
+			sh.Properties = &gsheets.SheetProperties{Title: sheetName}
+			merged.Sheets = append(merged.Sheets, sh)
+		}
 	}
-	status, body := f.gridBody(sheetName)
-	w.WriteHeader(status)
-	_, _ = w.Write([]byte(body))
+	b, _ := json.Marshal(merged)
+	_, _ = w.Write(b)
 }
 
 func indexOfSubstr(s, sub string) int {
@@ -108,9 +155,9 @@ func domesticRow() []string {
 		"10", "75000", "750000", "1500", "50000", "0.0714"}
 }
 
-// ReadAllTrades 는 시트당 그리드 1회만 읽어야 한다(헤더 전용 Values.Get 을 따로 호출하지 않는다).
-// 읽기 쿼터(분당 60)를 아끼기 위한 핵심 불변식.
-func TestReadAllTradesReadsOneRequestPerSheet(t *testing.T) {
+// ReadAllTrades 는 모든 시트의 그리드를 조회 1회로 읽어야 한다(헤더 전용 Values.Get 도
+// 시트별 그리드 조회도 따로 하지 않는다). 읽기 쿼터(분당 60)를 아끼기 위한 핵심 불변식.
+func TestReadAllTradesReadsAllSheetsInOneRequest(t *testing.T) {
 	f := &fakeSheets{
 		sheetNames: []string{"대시보드", "미래에셋증권_IRP", "미래에셋증권_ISA"},
 		gridBody: func(sheetName string) (int, string) {
@@ -127,7 +174,7 @@ func TestReadAllTradesReadsOneRequestPerSheet(t *testing.T) {
 
 	assert.Len(t, trades, 4, "매매일지 시트 2개 × 2행")
 	assert.Equal(t, 0, f.valuesCalls, "헤더 전용 Values.Get 은 더 이상 호출되지 않아야 한다")
-	assert.Equal(t, 3, f.gridCalls, "시트당 그리드 조회 1회")
+	assert.Equal(t, 1, f.gridCalls, "전체 시트 그리드 조회 1회")
 	assert.Equal(t, 1, f.metaCalls, "시트 목록 조회 1회")
 }
 
@@ -147,7 +194,8 @@ func TestReadAllTradesFailsFastOnReadError(t *testing.T) {
 	trades, err := w.ReadAllTrades(context.Background())
 
 	require.Error(t, err, "한 시트라도 읽기에 실패하면 에러여야 한다")
-	assert.Contains(t, err.Error(), "미래에셋증권_ISA")
+	assert.Contains(t, err.Error(), "boom")
+	assert.Contains(t, err.Error(), "미래에셋증권_ISA", "에러에 조회한 시트 이름이 포함되어야 한다")
 	assert.Nil(t, trades)
 }
 
@@ -166,3 +214,359 @@ func TestReadAllTradesTrimsTrailingEmptyHeaderCells(t *testing.T) {
 	require.NoError(t, err)
 	assert.Len(t, trades, 1)
 }
+
+// 일괄 조회 결과는 시트 목록 순서대로 이어 붙어야 한다.
+func TestReadAllTradesKeepsSheetOrder(t *testing.T) {
+	names := []string{"A_국내", "B_국내", "C_국내", "D_국내", "E_국내",
+		"F_국내", "G_국내", "H_국내", "I_국내", "J_국내"}
+	f := &fakeSheets{
+		sheetNames: names,
+		gridBody: func(string) (int, string) {
+			return http.StatusOK, gridJSON(DomesticHeaders, [][]string{domesticRow()})
+		},
+	}
+	w := newFakeWriter(t, f)
+
+	trades, err := w.ReadAllTrades(context.Background())
+	require.NoError(t, err)
+	require.Len(t, trades, len(names))
+	for i, tr := range trades {
+		assert.Equal(t, names[i], tr.Account)
+	}
+	assert.Equal(t, 1, f.gridCalls)
+}
+
+// GetExistingKeys 는 GridData 대신 Values API(서식 없는 값) 1회로 키를 만든다.
+// 숫자 셀(float64)과 문자열 셀 모두 Trade.DuplicateKey() 와 같은 키로 정규화돼야 한다.
+func TestGetExistingKeysUsesUnformattedValues(t *testing.T) {
+	var path, query string
+	f := &fakeSheets{
+		sheetNames: []string{"미래에셋증권_IRP"},
+		valuesBody: func(r *http.Request) string {
+			path, query = r.URL.Path, r.URL.RawQuery
+			return `{"values":[` +
+				`["2026-02-13","매도","005930","삼성전자","전기·전자","반도체",10,75000,750000],` +
+				`["2026-02-14","매수","005930","삼성전자","전기·전자","반도체","1,000","74,500.5"],` +
+				`["","매수","005930","삼성전자"]]}`
+		},
+	}
+	w := newFakeWriter(t, f)
+
+	keys, err := w.GetExistingKeys(context.Background(), "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+
+	assert.Len(t, keys, 2)
+	assert.True(t, keys[model.DupKey{Date: "2026-02-13", TradeType: "매도", StockName: "삼성전자", Quantity: 10, Price: 75000}])
+	assert.True(t, keys[model.DupKey{Date: "2026-02-14", TradeType: "매수", StockName: "삼성전자", Quantity: 1000, Price: 74500.5}])
+	assert.Equal(t, 1, f.valuesCalls)
+	assert.Equal(t, 0, f.gridCalls, "GridData 를 읽지 않는다")
+	assert.Contains(t, path, "A2:H10000", "키 열(단가 H열)까지만 읽는다")
+	assert.Contains(t, query, "valueRenderOption=UNFORMATTED_VALUE")
+	assert.Contains(t, query, "dateTimeRenderOption=FORMATTED_STRING")
+}
+
+// 시트 존재 확인은 캐시된 이름 집합으로 하며, 목록은 한 번만 조회한다.
+func TestHasSheetUsesCachedSet(t *testing.T) {
+	f := &fakeSheets{sheetNames: []string{"대시보드", "미래에셋증권_IRP"}}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+
+	ok, err := w.hasSheet(ctx, "미래에셋증권_IRP")
+	require.NoError(t, err)
+	assert.True(t, ok)
+
+	ok, err = w.hasSheet(ctx, "미래에셋증권_ISA")
+	require.NoError(t, err)
+	assert.False(t, ok)
+	assert.Equal(t, 1, f.metaCalls, "시트 목록 조회 1회")
+
+	w.invalidateCache()
+	_, err = w.hasSheet(ctx, "대시보드")
+	require.NoError(t, err)
+	assert.Equal(t, 2, f.metaCalls, "무효화 후 재조회")
+}
+
+// QueueTrades 는 요청만 모으고, Flush 가 여러 시트의 값 + 숫자 포맷을
+// appendCells 요청들로 batchUpdate 1회에 보낸다. 마지막 행 탐색·별도 포맷 적용 왕복이 없어야 한다.
+func TestQueueTradesFlushesOnceAcrossSheets(t *testing.T) {
+	f := &fakeSheets{sheetNames: []string{"미래에셋증권_IRP", "한국투자증권_해외"}}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+	trades := []model.Trade{
+		{Date: "2026-02-13", TradeType: "매수", Currency: "USD", StockCode: "AAPL", StockName: "애플",
+			Quantity: 1, Price: 230.5, Account: "한국투자증권_해외"},
+		{Date: "2026-02-14", TradeType: "매수", Currency: "JPY", StockCode: "7203", StockName: "도요타",
+			Quantity: 100, Price: 2800, Account: "한국투자증권_해외"},
+	}
+
+	n, err := w.QueueTrades(ctx, "한국투자증권_해외", trades, true)
+	require.NoError(t, err)
+	assert.Equal(t, 2, n)
+	n, err = w.QueueTrades(ctx, "미래에셋증권_IRP", []model.Trade{
+		{Date: "2026-02-13", TradeType: "매수", StockName: "삼성전자", Quantity: 10, Price: 75000, Account: "미래에셋증권_IRP"},
+	}, false)
+	require.NoError(t, err)
+	assert.Equal(t, 1, n)
+	assert.Empty(t, f.batchUpdates, "Flush 전에는 전송하지 않는다")
+
+	require.NoError(t, w.Flush(ctx))
+	assert.Equal(t, 0, f.valuesCalls, "Values API 를 쓰지 않는다")
+	assert.Equal(t, 0, f.gridCalls, "마지막 행 탐색 없음")
+	require.Len(t, f.batchUpdates, 1, "모든 시트의 값 + 포맷을 batchUpdate 1회로")
+	require.Len(t, f.batchUpdates[0].Requests, 2)
+	assert.Equal(t, int64(0), f.batchUpdates[0].Requests[1].AppendCells.SheetId)
+
+	// 비운 뒤 다시 Flush 해도 전송하지 않는다.
+	require.NoError(t, w.Flush(ctx))
+	assert.Len(t, f.batchUpdates, 1)
+
+	ac := f.batchUpdates[0].Requests[0].AppendCells
+	require.NotNil(t, ac)
+	assert.Equal(t, int64(1), ac.SheetId)
+	require.Len(t, ac.Rows, 2)
+	usd, jpy := ac.Rows[0].Values, ac.Rows[1].Values
+	require.Len(t, usd, len(ForeignHeaders))
+
+	// 일자: 날짜 시리얼 넘버 + DATE 포맷.
+	assert.Equal(t, float64(46066), *usd[0].UserEnteredValue.NumberValue)
+	assert.Equal(t, "DATE", usd[0].UserEnteredFormat.NumberFormat.Type)
+	// 종목코드: 숫자처럼 보여도 문자열 + TEXT.
+	assert.Equal(t, "7203", *jpy[3].UserEnteredValue.StringValue)
+	assert.Equal(t, "TEXT", jpy[3].UserEnteredFormat.NumberFormat.Type)
+	// 단가(I열): 통화별 외화 포맷.
+	assert.Equal(t, 230.5, *usd[8].UserEnteredValue.NumberValue)
+	assert.Equal(t, "$#,##0.00", usd[8].UserEnteredFormat.NumberFormat.Pattern)
+	assert.Equal(t, "¥#,##0", jpy[8].UserEnteredFormat.NumberFormat.Pattern)
+	// 빈 섹터는 빈 셀.
+	assert.Nil(t, usd[5].UserEnteredValue)
+}
+
+// 일괄 전송이 한 시트의 잘못된 요청으로 실패하면 시트별로 다시 보내, 다른 시트의 삽입은
+// 기록되고 실패한 시트만 에러로 보고된다(그 시트의 키 캐시는 버린다).
+func TestFlushFallsBackToPerSheetBatches(t *testing.T) {
+	f := &fakeSheets{
+		sheetNames: []string{"미래에셋증권_IRP", "미래에셋증권_ISA", "키움증권_일반"},
+		// sheetId 1(미래에셋증권_ISA)의 요청이 들어 있는 batchUpdate 는 실패한다.
+		batchFail: func(req *gsheets.BatchUpdateSpreadsheetRequest) bool {
+			for _, r := range req.Requests {
+				if r.AppendCells != nil && r.AppendCells.SheetId == 1 {
+					return true
+				}
+			}
+			return false
+		},
+	}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+	queue := func(sheet string) {
+		w.cacheKeys(sheet, map[model.DupKey]bool{})
+		_, err := w.QueueTrades(ctx, sheet, []model.Trade{
+			{Date: "2026-02-13", TradeType: "매수", StockName: "삼성전자", Quantity: 10, Price: 75000},
+		}, false)
+		require.NoError(t, err)
+	}
+	queue("미래에셋증권_IRP")
+	queue("미래에셋증권_ISA")
+	queue("키움증권_일반")
+
+	err := w.Flush(ctx)
+
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "미래에셋증권_ISA")
+	assert.NotContains(t, err.Error(), "미래에셋증권_IRP")
+	assert.Equal(t, 4, f.batchAttempts, "일괄 1회 실패 + 시트별 3회")
+	require.Len(t, f.batchUpdates, 2, "실패한 시트를 뺀 두 시트는 기록된다")
+	assert.Equal(t, int64(0), f.batchUpdates[0].Requests[0].AppendCells.SheetId)
+	assert.Equal(t, int64(2), f.batchUpdates[1].Requests[0].AppendCells.SheetId)
+	assert.NotContains(t, w.keysCache, "미래에셋증권_ISA", "기록 실패한 시트의 키 캐시는 버린다")
+	assert.Contains(t, w.keysCache, "미래에셋증권_IRP")
+
+	// 대기열은 비워져 다시 보내지 않는다.
+	require.NoError(t, w.Flush(ctx))
+	assert.Equal(t, 4, f.batchAttempts)
+}
+
+// 새 시트는 생성·헤더·행 고정·필터·TEXT 포맷을 batchUpdate 1회로 만들고,
+// 키를 읽지 않으며 시트 목록/ID 를 다시 조회하지 않고 바로 삽입 대기열에 넣을 수 있어야 한다.
+func TestPrepareSheetCreatesInOneBatch(t *testing.T) {
+	f := &fakeSheets{sheetNames: []string{"대시보드"}}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+
+	created, keys, err := w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	assert.True(t, created)
+	assert.Empty(t, keys)
+	assert.Equal(t, 0, f.valuesCalls, "헤더도 같은 batchUpdate 로 기록, 키 조회 없음")
+	require.Len(t, f.batchUpdates, 1)
+
+	reqs := f.batchUpdates[0].Requests
+	require.NotNil(t, reqs[0].AddSheet)
+	sid := reqs[0].AddSheet.Properties.SheetId
+	assert.NotZero(t, sid)
+	assert.Equal(t, "미래에셋증권_IRP", reqs[0].AddSheet.Properties.Title)
+	assert.Equal(t, int64(1), reqs[0].AddSheet.Properties.GridProperties.FrozenRowCount)
+	require.NotNil(t, reqs[1].UpdateCells)
+	assert.Equal(t, sid, reqs[1].UpdateCells.Range.SheetId)
+	assert.Len(t, reqs[1].UpdateCells.Rows[0].Values, len(DomesticHeaders))
+	require.NotNil(t, reqs[2].SetBasicFilter)
+	assert.Equal(t, sid, reqs[2].SetBasicFilter.Filter.Range.SheetId)
+
+	ok, err := w.hasSheet(ctx, "미래에셋증권_IRP")
+	require.NoError(t, err)
+	assert.True(t, ok)
+	_, err = w.QueueTrades(ctx, "미래에셋증권_IRP", []model.Trade{
+		{Date: "2026-02-13", TradeType: "매수", StockName: "삼성전자", Quantity: 10, Price: 75000},
+	}, false)
+	require.NoError(t, err)
+	assert.Equal(t, 1, f.metaCalls, "생성 후 목록/ID 재조회 없음")
+}
+
+// 기존 시트는 헤더와 키 열을 values.batchGet 1회로 함께 읽고, 서식 정리는
+// 삽입 요청과 함께 Flush 의 batchUpdate 1회로 보낸다.
+func TestPrepareSheetExistingReadsOnceAndQueuesFormatting(t *testing.T) {
+	var query string
+	f := &fakeSheets{
+		sheetNames: []string{"대시보드", "미래에셋증권_IRP"},
+		valuesBody: func(r *http.Request) string {
+			query = r.URL.RawQuery
+			header, _ := json.Marshal(DomesticHeaders)
+			return `{"valueRanges":[{"values":[` + string(header) + `]},{"values":[` +
+				`["2026-02-13","매도","005930","삼성전자","전기·전자","반도체",10,75000]]}]}`
+		},
+	}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+
+	created, keys, err := w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	assert.False(t, created)
+	assert.Len(t, keys, 1)
+	assert.True(t, keys[model.DupKey{Date: "2026-02-13", TradeType: "매도", StockName: "삼성전자", Quantity: 10, Price: 75000}])
+	assert.Equal(t, 1, f.valuesCalls, "헤더 + 키를 batchGet 1회로")
+	assert.Contains(t, query, "A1%3AQ1")
+	assert.Contains(t, query, "A2%3AH10000")
+	assert.Empty(t, f.batchUpdates, "서식 정리는 Flush 전에는 전송하지 않는다")
+
+	_, err = w.QueueTrades(ctx, "미래에셋증권_IRP", []model.Trade{
+		{Date: "2026-02-14", TradeType: "매수", StockName: "삼성전자", Quantity: 10, Price: 74000},
+	}, false)
+	require.NoError(t, err)
+	require.NoError(t, w.Flush(ctx))
+
+	require.Len(t, f.batchUpdates, 1, "서식 정리 + 삽입을 batchUpdate 1회로")
+	reqs := f.batchUpdates[0].Requests
+	require.NotNil(t, reqs[0].UpdateSheetProperties)
+	assert.Equal(t, int64(1), reqs[0].UpdateSheetProperties.Properties.SheetId)
+	require.NotNil(t, reqs[len(reqs)-1].AppendCells, "삽입은 서식 정리 뒤에")
+	assert.Equal(t, 1, countBackgroundClears(reqs), "데이터 행이 있으면 배경색을 초기화한다")
+	assert.Equal(t, 1, f.metaCalls)
+}
+
+// countBackgroundClears 는 배경색 초기화(RepeatCell backgroundColor, A~Z 열) 요청 수를 센다.
+func countBackgroundClears(reqs []*gsheets.Request) int {
+	n := 0
+	for _, r := range reqs {
+		if rc := r.RepeatCell; rc != nil && rc.Fields == "userEnteredFormat.backgroundColor" &&
+			rc.Range.EndColumnIndex == 26 {
+			n++
+		}
+	}
+	return n
+}
+
+// 헤더만 있는 기존 시트는 지울 배경색이 없으므로 배경색 초기화 요청을 보내지 않는다.
+// 행 고정·필터 등 나머지 서식 정리는 그대로 대기열에 들어간다.
+func TestPrepareSheetHeaderOnlySkipsBackgroundClear(t *testing.T) {
+	f := &fakeSheets{
+		sheetNames: []string{"미래에셋증권_IRP"},
+		valuesBody: func(r *http.Request) string {
+			header, _ := json.Marshal(DomesticHeaders)
+			return `{"valueRanges":[{"values":[` + string(header) + `]},{"values":[]}]}`
+		},
+	}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+
+	_, _, err := w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	require.NoError(t, w.Flush(ctx))
+
+	require.Len(t, f.batchUpdates, 1)
+	reqs := f.batchUpdates[0].Requests
+	require.NotNil(t, reqs[0].UpdateSheetProperties, "행 고정은 그대로")
+	assert.Zero(t, countBackgroundClears(reqs))
+}
+
+// PrefetchSheets 는 기존 시트들의 헤더·키 열을 batchGet 1회로 읽고, PrepareSheet 는
+// 시트마다 다시 읽지 않는다. 없는 시트는 조회 대상에서 빠진다.
+func TestPrefetchSheetsReadsAllSheetsOnce(t *testing.T) {
+	var ranges []string
+	f := &fakeSheets{
+		sheetNames: []string{"미래에셋증권_IRP", "한국투자증권_해외"},
+		valuesBody: func(r *http.Request) string {
+			ranges = r.URL.Query()["ranges"]
+			domestic, _ := json.Marshal(DomesticHeaders)
+			foreign, _ := json.Marshal(ForeignHeaders)
+			return `{"valueRanges":[` +
+				`{"values":[` + string(domestic) + `]},` +
+				`{"values":[["2026-02-13","매도","005930","삼성전자","","",10,75000]]},` +
+				`{"values":[` + string(foreign) + `]},` +
+				`{"values":[]}]}`
+		},
+	}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+
+	require.NoError(t, w.PrefetchSheets(ctx, map[string]bool{
+		"미래에셋증권_IRP": false, "한국투자증권_해외": true, "키움증권_ISA": false,
+	}))
+	assert.Equal(t, 1, f.valuesCalls)
+	assert.Equal(t, []string{
+		"미래에셋증권_IRP!A1:Q1", "미래에셋증권_IRP!A2:H10000",
+		"한국투자증권_해외!A1:Q1", "한국투자증권_해외!A2:I10000",
+	}, ranges)
+
+	_, keys, err := w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	assert.True(t, keys[model.DupKey{Date: "2026-02-13", TradeType: "매도", StockName: "삼성전자", Quantity: 10, Price: 75000}])
+	_, keys, err = w.PrepareSheet(ctx, "한국투자증권_해외", true)
+	require.NoError(t, err)
+	assert.Empty(t, keys)
+	assert.Equal(t, 1, f.valuesCalls, "PrepareSheet 는 미리 읽은 값을 쓴다")
+}
+
+// 같은 시트를 다시 준비하면 읽지 않고, 앞서 대기열에 넣은(아직 기록 전인) 거래도 중복으로 거른다.
+func TestPrepareSheetReusesKeysIncludingQueued(t *testing.T) {
+	f := &fakeSheets{
+		sheetNames: []string{"미래에셋증권_IRP"},
+		valuesBody: func(r *http.Request) string {
+			header, _ := json.Marshal(DomesticHeaders)
+			return `{"valueRanges":[{"values":[` + string(header) + `]},{"values":[]}]}`
+		},
+	}
+	w := newFakeWriter(t, f)
+	ctx := context.Background()
+	trade := model.Trade{Date: "2026-02-13", TradeType: "매수", StockName: "삼성전자", Quantity: 10, Price: 75000}
+
+	_, keys, err := w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	assert.Empty(t, keys)
+	_, err = w.QueueTrades(ctx, "미래에셋증권_IRP", []model.Trade{trade}, false)
+	require.NoError(t, err)
+
+	_, keys, err = w.PrepareSheet(ctx, "미래에셋증권_IRP", false)
+	require.NoError(t, err)
+	assert.True(t, keys[trade.DuplicateKey()], "대기열 거래도 중복 키에 포함")
+	assert.Equal(t, 1, f.valuesCalls, "두 번째 준비는 읽지 않는다")
+
+	require.NoError(t, w.Flush(ctx))
+	require.Len(t, f.batchUpdates, 1)
+	formatting := 0
+	for _, r := range f.batchUpdates[0].Requests {
+		if r.UpdateSheetProperties != nil {
+			formatting++
+		}
+	}
+	assert.Equal(t, 1, formatting, "서식 정리는 시트당 한 번만 대기열에")
+}
@@ -3,7 +3,9 @@ package writer
 import (
 	"testing"
 
+	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/stretchr/testify/assert"
+	gsheets "google.golang.org/api/sheets/v4"
 )
 
 func TestRowToTradeDomestic_12cols(t *testing.T) {
@@ -51,6 +53,35 @@ func TestRowToTradeForeign_17cols(t *testing.T) {
 	assert.InDelta(t, 3.71, tr.ProfitRate, 0.01)
 }
 
+// 그리드 셀을 직접 읽는 tradesFromGrid 는 같은 값의 plain 행을 rowToTrade 한 결과와 같아야 한다.
+// 숫자 셀·숫자로 저장된 종목코드·쉼표 문자열·빈 셀을 섞는다.
+func TestTradesFromGridMatchesRowToTrade(t *testing.T) {
+	plain := []interface{}{"2026-02-13", "매도", float64(5930), "삼성전자", "전기·전자", nil,
+		float64(10), "75,000", float64(750000), float64(1500), float64(50000), float64(0.0714)}
+
+	cells := make([]*gsheets.CellData, len(plain))
+	for i, v := range plain {
+		cell := &gsheets.CellData{EffectiveValue: &gsheets.ExtendedValue{}}
+		switch x := v.(type) {
+		case string:
+			cell.EffectiveValue.StringValue = &x
+			cell.FormattedValue = x
+		case float64:
+			cell.EffectiveValue.NumberValue = &x
+		case nil:
+			cell.EffectiveValue = nil
+		}
+		cells[i] = cell
+	}
+	header := &gsheets.RowData{}
+	grid := &gsheets.GridData{RowData: []*gsheets.RowData{header, {Values: cells}}}
+
+	trades := tradesFromGrid(grid, false, "acct")
+	assert.Equal(t, []model.Trade{rowToTrade(plain, false, "acct")}, trades)
+	assert.Equal(t, "5930", trades[0].StockCode)
+	assert.Equal(t, 75000.0, trades[0].Price)
+}
+
 // 종목코드가 숫자로 저장된 경우(TEXT 포맷 이전 행) 정수 문자열로 복원.
 func TestGetCodeFromNumber(t *testing.T) {
 	row := []interface{}{"", "", float64(461270)}
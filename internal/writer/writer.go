@@ -7,6 +7,7 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"time"
 
 	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/kenshin579/auto-trading-journal/internal/sheets"
@@ -16,7 +17,42 @@ import (
 // Writer 는 Google Sheets 시트 생성/삽입/포맷을 담당한다. (Python SheetWriter)
 type Writer struct {
 	client     *sheets.Client
-	sheetCache []string // 시트 목록 캐시. nil 이면 미초기화.
+	sheetCache []string        // 시트 목록 캐시. nil 이면 미초기화.
+	sheetSet   map[string]bool // sheetCache 의 이름 집합(존재 확인용).
+
+	// pending 은 시트별로 모은 PrepareSheet 의 서식 정리와 QueueTrades 의 appendCells 요청
+	// (대기열에 처음 들어온 순서). Flush 가 모든 시트 분량을 batchUpdate 1회로 전송한다.
+	pending []*sheetBatch
+
+	// prefetched 는 PrefetchSheets 로 미리 읽은 시트별 헤더·키 열. PrepareSheet 가 꺼내 쓴다.
+	prefetched map[string]sheetValues
+	// keysCache 는 시트별 중복 키(시트에 있는 것 + 대기열에 넣은 것). PrepareSheet 가 채우고
+	// QueueTrades 가 갱신해, 같은 시트를 다시 준비할 때 읽기 없이 아직 기록 전인 거래까지 거른다.
+	keysCache map[string]map[model.DupKey]bool
+}
+
+// sheetBatch 는 한 시트의 대기 중인 요청과 그중 삽입할 거래 수.
+type sheetBatch struct {
+	sheet    string
+	requests []*gsheets.Request
+	trades   int
+}
+
+// batchFor 는 시트의 대기열 묶음을 반환한다(없으면 새로 만들어 순서대로 추가).
+func (w *Writer) batchFor(sheetName string) *sheetBatch {
+	for _, b := range w.pending {
+		if b.sheet == sheetName {
+			return b
+		}
+	}
+	b := &sheetBatch{sheet: sheetName}
+	w.pending = append(w.pending, b)
+	return b
+}
+
+// sheetValues 는 PrepareSheet 가 쓰는 시트 헤더 행(A1:Q1)과 키 열(keyRange) 값.
+type sheetValues struct {
+	header, keyRows [][]interface{}
 }
 
 // New 는 Writer 를 생성한다. (Python SheetWriter.__init__)
@@ -32,75 +68,191 @@ func (w *Writer) getSheets(ctx context.Context) ([]string, error) {
 			return nil, err
 		}
 		w.sheetCache = names
+		w.sheetSet = make(map[string]bool, len(names))
+		for _, n := range names {
+			w.sheetSet[n] = true
+		}
 	}
 	return w.sheetCache, nil
 }
 
-// invalidateCache 는 시트 목록 캐시를 무효화한다. (Python _invalidate_cache)
+// hasSheet 는 시트 존재 여부를 캐시된 이름 집합에서 확인한다.
+func (w *Writer) hasSheet(ctx context.Context, sheetName string) (bool, error) {
+	if _, err := w.getSheets(ctx); err != nil {
+		return false, err
+	}
+	return w.sheetSet[sheetName], nil
+}
+
+// invalidateCache 는 시트 목록 캐시를 무효화한다(클라이언트의 목록·ID 캐시 포함).
+// (Python _invalidate_cache)
 func (w *Writer) invalidateCache() {
 	w.sheetCache = nil
+	w.sheetSet = nil
+	w.client.InvalidateSheetIDCache()
 }
 
-// EnsureSheetExists 는 시트가 없으면 생성하고 헤더를 삽입하며 freeze + filter 를 적용한다.
-// 새로 생성했으면 true 를 반환한다. (Python ensure_sheet_exists)
-func (w *Writer) EnsureSheetExists(ctx context.Context, sheetName string, isForeign bool) (bool, error) {
-	names, err := w.getSheets(ctx)
+// PrepareSheet 는 거래 삽입 전 시트를 준비하고 중복 체크용 기존 키 셋을 반환한다.
+// (Python ensure_sheet_exists + get_existing_keys)
+//
+//   - 새 시트: 생성 + 헤더 + 행 고정 + 필터 + 종목코드 TEXT 포맷을 batchUpdate 1회로 만든다.
+//     데이터가 없으므로 키는 읽지 않고 빈 셋을 반환한다(created=true).
+//   - 기존 시트: 헤더와 키 열을 values.batchGet 1회로 함께 읽는다. 구 포맷이면 마이그레이션
+//     후 키만 다시 읽는다. 서식 정리(freeze + filter + 배경색 초기화)는 바로 보내지 않고
+//     대기열에 넣어 Flush 에서 삽입 요청과 함께 보낸다.
+//   - 이번 실행에서 이미 준비한 시트: 읽지 않고 keysCache(대기열 거래 포함)를 반환한다.
+//
+// 반환된 키 셋은 내부 캐시이므로 호출측은 읽기만 한다.
+func (w *Writer) PrepareSheet(ctx context.Context, sheetName string, isForeign bool) (bool, map[model.DupKey]bool, error) {
+	if keys, ok := w.keysCache[sheetName]; ok {
+		// 서식 정리도 이미 대기열에 들어 있다.
+		return false, keys, nil
+	}
+	exists, err := w.hasSheet(ctx, sheetName)
 	if err != nil {
-		return false, err
+		return false, nil, err
 	}
-	for _, n := range names {
-		if n == sheetName {
-			// 구 포맷이면 신 포맷으로 자동 마이그레이션(섹터/산업 열 삽입) 후 진행.
-			if err := w.ensureNewFormat(ctx, sheetName); err != nil {
-				return false, err
-			}
-			if err := w.ApplySheetFormatting(ctx, sheetName, isForeign); err != nil {
-				return false, err
-			}
-			return false, nil
+	if !exists {
+		if err := w.createSheet(ctx, sheetName, isForeign); err != nil {
+			return false, nil, err
 		}
+		return true, w.cacheKeys(sheetName, map[model.DupKey]bool{}), nil
 	}
 
-	headers := DomesticHeaders
-	if isForeign {
-		headers = ForeignHeaders
+	vals, err := w.readSheetValues(ctx, sheetName, isForeign)
+	if err != nil {
+		return false, nil, err
 	}
-	if err := w.client.CreateSheet(ctx, sheetName); err != nil {
-		return false, err
+	// 구 포맷이면 신 포맷으로 자동 마이그레이션(섹터/산업 열 삽입) 후 진행.
+	migrated, err := w.migrateIfOld(ctx, sheetName, extractHeaderRow(vals.header))
+	if err != nil {
+		return false, nil, err
 	}
-	if err := w.client.UpdateCells(ctx, sheetName+"!A1", [][]interface{}{toAnyRow(headers)}); err != nil {
-		return false, err
+	var keys map[model.DupKey]bool
+	if migrated {
+		// 열이 밀렸으므로 키 열을 다시 읽는다.
+		if keys, err = w.GetExistingKeys(ctx, sheetName, isForeign); err != nil {
+			return false, nil, err
+		}
+	} else {
+		keys = keysFromValues(vals.keyRows, isForeign)
+		slog.Info("기존 키 로드", "sheet", sheetName, "count", len(keys))
 	}
-	w.invalidateCache()
-	slog.Info("시트 생성 및 헤더 삽입 완료", "sheet", sheetName)
 
-	if err := w.ApplySheetFormatting(ctx, sheetName, isForeign); err != nil {
-		return false, err
+	// 헤더만 있는 시트는 지울 데이터 행 배경색이 없으므로 초기화를 건너뛴다.
+	if err := w.queueSheetFormatting(ctx, sheetName, isForeign, len(vals.keyRows) > 0); err != nil {
+		return false, nil, err
 	}
-	return true, nil
+	return false, w.cacheKeys(sheetName, keys), nil
 }
 
-// ApplySheetFormatting 은 시트에 freeze + filter + 배경색 초기화(+종목코드 TEXT 포맷)를
-// 1회 batchUpdate 로 적용한다. (Python apply_sheet_formatting)
-func (w *Writer) ApplySheetFormatting(ctx context.Context, sheetName string, isForeign bool) error {
-	headers := DomesticHeaders
-	if isForeign {
-		headers = ForeignHeaders
+// cacheKeys 는 시트의 중복 키 셋을 keysCache 에 저장하고 그대로 반환한다.
+func (w *Writer) cacheKeys(sheetName string, keys map[model.DupKey]bool) map[model.DupKey]bool {
+	if w.keysCache == nil {
+		w.keysCache = make(map[string]map[model.DupKey]bool)
+	}
+	w.keysCache[sheetName] = keys
+	return keys
+}
+
+// PrefetchSheets 는 이번 실행에서 다룰 기존 시트들의 헤더·키 열을 values.batchGet 1회로
+// 미리 읽어 둔다. 이후 PrepareSheet 는 시트마다 왕복하지 않고 이 결과를 쓴다.
+// isForeignBySheet 는 시트명 → 해외 계좌 여부. 아직 없는 시트는 건너뛴다.
+func (w *Writer) PrefetchSheets(ctx context.Context, isForeignBySheet map[string]bool) error {
+	names := make([]string, 0, len(isForeignBySheet))
+	for name := range isForeignBySheet {
+		exists, err := w.hasSheet(ctx, name)
+		if err != nil {
+			return err
+		}
+		if exists {
+			names = append(names, name)
+		}
+	}
+	if len(names) == 0 {
+		return nil
+	}
+	sort.Strings(names)
+
+	ranges := make([]string, 0, 2*len(names))
+	for _, name := range names {
+		ranges = append(ranges, name+"!A1:Q1", keyRange(name, isForeignBySheet[name]))
+	}
+	vals, err := w.client.BatchGetUnformattedValues(ctx, ranges)
+	if err != nil {
+		return err
+	}
+	w.prefetched = make(map[string]sheetValues, len(names))
+	for i, name := range names {
+		w.prefetched[name] = sheetValues{header: vals[2*i], keyRows: vals[2*i+1]}
+	}
+	slog.Info("시트 헤더·기존 키 일괄 조회", "sheets", len(names))
+	return nil
+}
+
+// readSheetValues 는 시트의 헤더 행과 키 열 값을 반환한다. PrefetchSheets 결과가 있으면
+// 꺼내 쓰고(이후 같은 시트는 keysCache 를 쓰므로 버린다), 없으면 values.batchGet 1회로 읽는다.
+func (w *Writer) readSheetValues(ctx context.Context, sheetName string, isForeign bool) (sheetValues, error) {
+	if v, ok := w.prefetched[sheetName]; ok {
+		delete(w.prefetched, sheetName)
+		return v, nil
+	}
+	vals, err := w.client.BatchGetUnformattedValues(ctx, []string{
+		sheetName + "!A1:Q1",
+		keyRange(sheetName, isForeign),
+	})
+	if err != nil {
+		return sheetValues{}, err
+	}
+	return sheetValues{header: vals[0], keyRows: vals[1]}, nil
+}
+
+// createSheet 는 새 시트를 생성·헤더·행 고정·필터·종목코드 TEXT 포맷까지 batchUpdate 1회로 만든다.
+// 새 시트라 배경색 초기화는 필요 없다.
+func (w *Writer) createSheet(ctx context.Context, sheetName string, isForeign bool) error {
+	profile := profileFor(isForeign)
+	if err := w.client.CreateSheetWithHeader(ctx, sheetName, profile.headers, profile.codeCol); err != nil {
+		return err
+	}
+	// 목록을 다시 받지 않도록 캐시에 바로 추가한다.
+	w.sheetCache = append(w.sheetCache, sheetName)
+	w.sheetSet[sheetName] = true
+	slog.Info("시트 생성 및 헤더 삽입 완료", "sheet", sheetName)
+	return nil
+}
+
+// queueSheetFormatting 은 시트의 freeze + filter + 배경색 초기화(+종목코드 TEXT 포맷) 요청을
+// 대기열에 넣는다. 실제 적용은 Flush 에서 삽입 요청과 함께 batchUpdate 1회로.
+// hasDataRows 가 false(헤더만 있음)면 배경색 초기화 요청은 넣지 않는다.
+// (Python apply_sheet_formatting)
+func (w *Writer) queueSheetFormatting(ctx context.Context, sheetName string, isForeign, hasDataRows bool) error {
+	sheetID, ok, err := w.client.GetSheetID(ctx, sheetName)
+	if err != nil {
+		return err
+	}
+	if !ok {
+		return fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
 	}
-	numCols := len(headers)
 	// 종목코드는 숫자로 보여도 텍스트(정렬 통일·앞0 보존)로 다룬다.
-	codeCol := indexOf(headers, "종목코드") + 1
+	profile := profileFor(isForeign)
+	numCols, codeCol := len(profile.headers), profile.codeCol
 	// Python clear_background_colors 기본값(end_row=1000, end_col=26)을 명시 전달.
-	return w.client.ApplySheetFormattingBatch(
-		ctx, sheetName,
-		1,       // freezeRowCount
-		1,       // filterStartRow
-		1,       // filterStartCol
-		numCols, // filterEndCol
-		1000,    // clearBgEndRow
-		26,      // clearBgEndCol
-		codeCol, // textFormatCol
-	)
+	clearBgEndCol := 26
+	if !hasDataRows {
+		clearBgEndCol = 0
+	}
+	b := w.batchFor(sheetName)
+	b.requests = append(b.requests, sheets.BuildSheetFormattingRequests(
+		sheetID,
+		1,             // freezeRowCount
+		1,             // filterStartRow
+		1,             // filterStartCol
+		numCols,       // filterEndCol
+		1000,          // clearBgEndRow
+		clearBgEndCol, // 헤더만 있으면 0(초기화 생략)
+		codeCol,       // textFormatCol
+	)...)
+	return nil
 }
 
 // toAnyRow 는 []string 을 []interface{} 행으로 변환한다.
@@ -114,8 +266,7 @@ func toAnyRow(ss []string) []interface{} {
 
 // ── 순수 헬퍼 ──────────────────────────────────────────────
 
-// normalizeNum 은 숫자를 duplicate_key()의 _num_str() 형식과 일치하도록 정규화한다.
-// 정수면 소수점 제거(2.0 → "2"). (Python _normalize_num 의 숫자 경로 = model.numStr)
+// normalizeNum 은 숫자를 문자열로 정규화한다. 정수면 소수점 제거(2.0 → "2"). (Python _num_str)
 func normalizeNum(v float64) string {
 	if v == float64(int64(v)) {
 		return strconv.FormatInt(int64(v), 10)
@@ -123,55 +274,43 @@ func normalizeNum(v float64) string {
 	return strconv.FormatFloat(v, 'g', -1, 64)
 }
 
-// normalizeCellValue 는 그리드 셀 값(숫자 또는 문자열)을 정규화한다. (Python _normalize_num)
-// - nil → ""
-// - 숫자(float64): normalizeNum 와 동일
-// - 문자열: 천단위 쉼표 제거 ("28,230" → "28230")
-func normalizeCellValue(v interface{}) string {
+// keyNum 은 수량/단가 셀 값을 중복 키용 float64 로 바꾼다. (Python _normalize_num)
+// - 숫자(float64): 그대로
+// - 문자열: 천단위 쉼표 제거 후 파싱 ("28,230" → 28230)
+// 숫자로 읽을 수 없는 값(빈 셀 등)은 false — 어떤 거래 키와도 같을 수 없어 키에서 뺀다.
+func keyNum(v interface{}) (float64, bool) {
 	switch x := v.(type) {
-	case nil:
-		return ""
 	case float64:
-		return normalizeNum(x)
+		return x, true
 	case string:
-		return strings.ReplaceAll(x, ",", "")
+		if strings.IndexByte(x, ',') >= 0 {
+			x = strings.ReplaceAll(x, ",", "")
+		}
+		f, err := strconv.ParseFloat(x, 64)
+		return f, err == nil
 	default:
-		return strings.ReplaceAll(fmt.Sprintf("%v", x), ",", "")
+		return 0, false
 	}
 }
 
-// groupConsecutiveRows 는 행 번호 리스트를 연속 구간 [start,end] 으로 묶는다.
-// (Python _group_consecutive_rows)
-func groupConsecutiveRows(rows []int) [][2]int {
-	if len(rows) == 0 {
-		return nil
-	}
-	sorted := make([]int, len(rows))
-	copy(sorted, rows)
-	sort.Ints(sorted)
-	var ranges [][2]int
-	start, end := sorted[0], sorted[0]
-	for _, r := range sorted[1:] {
-		if r == end+1 {
-			end = r
-		} else {
-			ranges = append(ranges, [2]int{start, end})
-			start, end = r, r
-		}
-	}
-	ranges = append(ranges, [2]int{start, end})
-	return ranges
-}
+// colLetters 는 단일 문자 컬럼(A~Z) 조회표. 부분 문자열은 할당 없이 공유된다.
+const colLetters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 // colLetter 는 컬럼 번호를 문자로 변환한다 (1=A, 26=Z, 27=AA). (Python _col_letter)
+// 매매일지는 최대 17열이라 대부분 조회표에서 바로 반환한다.
 func colLetter(colNum int) string {
-	result := ""
+	if colNum >= 1 && colNum <= 26 {
+		return colLetters[colNum-1 : colNum]
+	}
+	var buf [8]byte
+	i := len(buf)
 	for colNum > 0 {
 		colNum--
-		result = string(rune('A'+colNum%26)) + result
+		i--
+		buf[i] = colLetters[colNum%26]
 		colNum /= 26
 	}
-	return result
+	return string(buf[i:])
 }
 
 // ── 그리드 셀 추출 헬퍼 ──────────────────────────────────────
@@ -192,15 +331,6 @@ func cellEffective(cell *gsheets.CellData) interface{} {
 	return nil
 }
 
-// cellHasValue 는 셀의 effectiveValue 에 number/string/bool 중 하나가 있는지 판정한다.
-func cellHasValue(cell *gsheets.CellData) bool {
-	if cell == nil || cell.EffectiveValue == nil {
-		return false
-	}
-	ev := cell.EffectiveValue
-	return ev.NumberValue != nil || ev.StringValue != nil || ev.BoolValue != nil
-}
-
 // ── 중복 필터 ──────────────────────────────────────────────
 
 // keyColsForGrid 는 (종목명, 수량, 단가) 컬럼 인덱스를 반환한다(섹터/산업 삽입 후).
@@ -211,49 +341,63 @@ func keyColsForGrid(isForeign bool) (nameCol, qtyCol, priceCol int) {
 	return 3, 6, 7
 }
 
+// keyRange 는 중복 키를 만드는 데 필요한 열 범위(2행~)를 A1 표기로 반환한다.
+// 키 열은 단가 열(국내 H, 해외 I)까지라 그 뒤 열(금액·손익 등)은 받지 않는다.
+func keyRange(sheetName string, isForeign bool) string {
+	return sheetName + "!A2:" + profileFor(isForeign).keyEndCol + "10000"
+}
+
 // GetExistingKeys 는 기존 데이터에서 중복 체크용 키 셋을 반환한다.
 // 키: (일자, 구분, 종목명, 수량, 단가). (Python get_existing_keys)
 //
-// 날짜는 formattedValue(시리얼 넘버 방지), 숫자는 effectiveValue(원본 정밀도)를 사용해
+// 셀마다 CellData 객체가 오는 GridData 대신 Values API 로 스칼라 값만 받는다.
+// 날짜는 표시 문자열(시리얼 넘버 방지), 숫자는 서식 없는 원본 값(원본 정밀도)이라
 // model.Trade.DuplicateKey() 와 비교 가능하도록 정규화한다.
 func (w *Writer) GetExistingKeys(ctx context.Context, sheetName string, isForeign bool) (map[model.DupKey]bool, error) {
-	keys := make(map[model.DupKey]bool)
-	grid, err := w.client.GetRawGridData(ctx, sheetName, "A2:Q10000")
+	rows, err := w.client.GetUnformattedValues(ctx, keyRange(sheetName, isForeign))
 	if err != nil {
 		// Python 은 예외를 잡아 빈 셋을 반환. 동등하게 soft 처리.
 		slog.Error("기존 키 로드 실패", "sheet", sheetName, "err", err)
-		return keys, nil
-	}
-	if grid == nil {
-		return keys, nil
+		return map[model.DupKey]bool{}, nil
 	}
+	keys := keysFromValues(rows, isForeign)
+	slog.Info("기존 키 로드", "sheet", sheetName, "count", len(keys))
+	return keys, nil
+}
+
+// keysFromValues 는 keyRange 로 읽은 행들(Values API 스칼라)에서 중복 키 셋을 만든다.
+// 일자가 비었거나 단가 열까지 채워지지 않았거나 수량/단가가 숫자가 아닌 행은 건너뛴다.
+func keysFromValues(rows [][]interface{}, isForeign bool) map[model.DupKey]bool {
+	p := profileFor(isForeign)
+	nameCol, qtyCol, priceCol := p.nameCol, p.qtyCol, p.priceCol
+	// 행당 키 1개라 행 수로 미리 잡아 삽입 중 재해시를 피한다.
+	keys := make(map[model.DupKey]bool, len(rows))
 
-	nameCol, qtyCol, priceCol := keyColsForGrid(isForeign)
-	for _, row := range grid.RowData {
-		values := row.Values
-		if len(values) <= priceCol {
+	for _, row := range rows {
+		if len(row) <= priceCol {
 			continue
 		}
-		// 날짜(col 0): formattedValue 사용.
-		dateVal := values[0].FormattedValue
+		dateVal := stringFromCell(row[0])
 		if dateVal == "" {
 			continue
 		}
-		tradeType := stringFromCell(cellEffective(values[1]))
-		stockName := stringFromCell(cellEffective(values[nameCol]))
-		key := model.DupKey{
-			dateVal, tradeType, stockName,
-			normalizeCellValue(cellEffective(values[qtyCol])),
-			normalizeCellValue(cellEffective(values[priceCol])),
+		qty, ok := keyNum(row[qtyCol])
+		if !ok {
+			continue
 		}
-		keys[key] = true
+		price, ok := keyNum(row[priceCol])
+		if !ok {
+			continue
+		}
+		keys[model.DupKey{
+			Date: dateVal, TradeType: stringFromCell(row[1]), StockName: stringFromCell(row[nameCol]),
+			Quantity: qty, Price: price,
+		}] = true
 	}
-
-	slog.Info("기존 키 로드", "sheet", sheetName, "count", len(keys))
-	return keys, nil
+	return keys
 }
 
-// stringFromCell 은 effectiveValue interface{} 를 문자열로 변환한다(nil → "").
+// stringFromCell 은 셀 값(effectiveValue 또는 Values API 스칼라)을 문자열로 변환한다(nil → "").
 // (Python str(_get_cell_value(...) or ""))
 func stringFromCell(v interface{}) string {
 	switch x := v.(type) {
@@ -268,148 +412,205 @@ func stringFromCell(v interface{}) string {
 	}
 }
 
-// FindLastRow 는 시트의 마지막 데이터 행 + 1(다음 삽입 위치)을 반환한다.
-// (Python find_last_row)
-func (w *Writer) FindLastRow(ctx context.Context, sheetName string) (int, error) {
-	rowCount := 10000
-	meta, err := w.client.GetSpreadsheetMetadata(ctx)
-	if err == nil && meta != nil {
-		for _, s := range meta.Sheets {
-			if s.Properties != nil && s.Properties.Title == sheetName {
-				if s.Properties.GridProperties != nil && s.Properties.GridProperties.RowCount > 0 {
-					rowCount = int(s.Properties.GridProperties.RowCount)
-				}
-				break
-			}
-		}
-	}
+// ── 삽입 ──────────────────────────────────────────────────
 
-	grid, err := w.client.GetRawGridData(ctx, sheetName, fmt.Sprintf("A1:A%d", rowCount))
+// QueueTrades 는 거래 데이터를 숫자 포맷과 함께 시트 끝에 덧붙이는 요청을 만들어
+// 대기열에 넣고, 대기열에 넣은 거래 수를 반환한다. 실제 기록은 Flush 에서
+// 모든 시트의 요청을 batchUpdate 1회로 보낸다. (Python insert_trades / batch_insert_trades)
+//
+// 셀마다 값과 포맷을 함께 실어 보내므로 삽입 위치(시작 행)를 미리 알 필요가 없고, 해외
+// 계좌의 통화별 외화 포맷도 행 단위로 바로 들어간다.
+func (w *Writer) QueueTrades(ctx context.Context, sheetName string, trades []model.Trade, isForeign bool) (int, error) {
+	if len(trades) == 0 {
+		return 0, nil
+	}
+	sheetID, ok, err := w.client.GetSheetID(ctx, sheetName)
 	if err != nil {
-		slog.Error("마지막 행 탐색 실패", "sheet", sheetName, "err", err)
-		return 2, nil
+		return 0, err
 	}
-	if grid == nil {
-		return 2, nil
+	if !ok {
+		return 0, fmt.Errorf("시트 '%s'를 찾을 수 없습니다", sheetName)
 	}
 
-	lastRow := 1
-	emptyCount := 0
-	for i, row := range grid.RowData {
-		isEmpty := true
-		for _, cell := range row.Values {
-			if cellHasValue(cell) {
-				isEmpty = false
-				break
-			}
+	profile := profileFor(isForeign)
+	numCols := len(profile.headers)
+
+	rows := make([]*gsheets.RowData, 0, len(trades))
+	for _, trade := range trades {
+		rd, err := rowData(profile.toRow(trade), numberFormatsFor(isForeign, trade.Currency), numCols)
+		if err != nil {
+			return 0, fmt.Errorf("시트 '%s' 거래 행 변환 실패: %w", sheetName, err)
 		}
-		if isEmpty {
-			emptyCount++
-			if emptyCount >= 100 {
-				break
-			}
-		} else {
-			lastRow = i + 1
-			emptyCount = 0
+		rows = append(rows, rd)
+	}
+
+	b := w.batchFor(sheetName)
+	b.requests = append(b.requests, sheets.BuildAppendCellsRequest(sheetID, rows))
+	b.trades += len(trades)
+	if keys := w.keysCache[sheetName]; keys != nil {
+		for _, trade := range trades {
+			keys[trade.DuplicateKey()] = true
 		}
 	}
-	return lastRow + 1, nil
+	return len(trades), nil
 }
 
-// ── 삽입 ──────────────────────────────────────────────────
-
-// InsertTrades 는 거래 데이터를 시트에 삽입하고 숫자 포맷을 적용한다.
-// 삽입된 거래 수를 반환한다. (Python insert_trades)
-func (w *Writer) InsertTrades(ctx context.Context, sheetName string, trades []model.Trade, isForeign bool) (int, error) {
-	if len(trades) == 0 {
-		return 0, nil
+// Flush 는 PrepareSheet·QueueTrades 로 모은 모든 시트의 서식 정리·삽입 요청을
+// batchUpdate 1회로 전송하고 대기열을 비운다. 대기 중인 요청이 없으면 아무것도 하지 않는다.
+//
+// batchUpdate 는 전부 적용되거나 전부 버려지므로, 일괄 전송이 실패하면 시트별 batchUpdate 로
+// 다시 보내 한 시트의 잘못된 요청이 다른 시트의 삽입까지 버리지 않게 한다. 실패한 시트는
+// 로그를 남기고 키 캐시를 버린 뒤(다음 준비 때 다시 읽음) 건너뛰며, 그 목록을 에러로 반환한다.
+func (w *Writer) Flush(ctx context.Context) error {
+	if len(w.pending) == 0 {
+		return nil
 	}
+	batches := w.pending
+	w.pending = nil
 
-	startRow, err := w.FindLastRow(ctx, sheetName)
-	if err != nil {
-		return 0, err
+	var all []*gsheets.Request
+	total := 0
+	for _, b := range batches {
+		all = append(all, b.requests...)
+		total += b.trades
 	}
-	numCols := len(DomesticHeaders)
-	if isForeign {
-		numCols = len(ForeignHeaders)
+	err := w.client.ExecuteBatchRequests(ctx, all)
+	if err == nil {
+		slog.Info("시트 삽입 완료", "sheets", len(batches), "requests", len(all), "count", total)
+		return nil
 	}
 
-	// 데이터 행 준비 (컬럼 수 맞춤).
-	rowsData := make([][]interface{}, 0, len(trades))
-	for _, trade := range trades {
-		var row []interface{}
-		if isForeign {
-			row = trade.ToForeignRow()
-		} else {
-			row = trade.ToDomesticRow()
-		}
-		if len(row) > numCols {
-			row = row[:numCols]
-		} else if len(row) < numCols {
-			for len(row) < numCols {
-				row = append(row, "")
+	var failed []string
+	if len(batches) == 1 {
+		// 시트가 하나면 일괄 전송 실패가 곧 그 시트의 실패다.
+		w.dropSheet(batches[0], err)
+		failed = append(failed, batches[0].sheet)
+	} else {
+		slog.Warn("시트 일괄 삽입 실패, 시트별로 다시 전송", "sheets", len(batches), "err", err)
+		for _, b := range batches {
+			if err := w.client.ExecuteBatchRequests(ctx, b.requests); err != nil {
+				w.dropSheet(b, err)
+				failed = append(failed, b.sheet)
+				continue
 			}
+			slog.Info("시트 삽입 완료", "sheet", b.sheet, "count", b.trades)
 		}
-		rowsData = append(rowsData, row)
 	}
-
-	endRow := startRow + len(trades) - 1
-	rangeStr := fmt.Sprintf("%s!A%d:%s%d", sheetName, startRow, colLetter(numCols), endRow)
-
-	if err := w.client.BatchUpdateValues(ctx, map[string][][]interface{}{rangeStr: rowsData}); err != nil {
-		slog.Error("시트 데이터 삽입 실패", "sheet", sheetName, "err", err)
-		return 0, fmt.Errorf("시트 '%s' 데이터 삽입 실패: %w", sheetName, err)
+	if len(failed) > 0 {
+		return fmt.Errorf("시트 데이터 삽입 실패: %s", strings.Join(failed, ", "))
 	}
+	return nil
+}
 
-	slog.Info("시트 삽입 완료", "sheet", sheetName, "count", len(trades),
-		"start_row", startRow, "end_row", endRow)
+// dropSheet 는 기록에 실패한 시트를 로그로 남기고, 대기열 키가 시트에 기록되지 않았으므로
+// 그 시트의 키 캐시를 버린다.
+func (w *Writer) dropSheet(b *sheetBatch, err error) {
+	delete(w.keysCache, b.sheet)
+	slog.Error("시트 데이터 삽입 실패", "sheet", b.sheet, "count", b.trades, "err", err)
+}
 
-	if err := w.applyNumberFormats(ctx, sheetName, startRow, endRow, isForeign, trades); err != nil {
-		return 0, err
-	}
+// 열별 숫자 포맷은 계좌 유형(해외는 통화)마다 고정이라 패키지 초기화 때 한 번만 만들어
+// 모든 행·요청이 공유한다(읽기 전용).
+var (
+	domesticNumberFormats = columnNumberFormats(false, "", len(DomesticHeaders))
+	foreignNumberFormats  = buildForeignNumberFormats()
+)
 
-	return len(trades), nil
+// buildForeignNumberFormats 는 CurrencyPatterns 의 통화별 해외 열 포맷을 만든다.
+// 키 "" 는 매핑 없는 통화용(기본 패턴).
+func buildForeignNumberFormats() map[string][]*gsheets.NumberFormat {
+	m := make(map[string][]*gsheets.NumberFormat, len(CurrencyPatterns)+1)
+	for currency := range CurrencyPatterns {
+		m[currency] = columnNumberFormats(true, currency, len(ForeignHeaders))
+	}
+	m[""] = columnNumberFormats(true, "", len(ForeignHeaders))
+	return m
 }
 
-// applyNumberFormats 는 컬럼별 숫자 포맷을 적용한다. (Python _apply_number_formats)
-func (w *Writer) applyNumberFormats(ctx context.Context, sheetName string, startRow, endRow int, isForeign bool, trades []model.Trade) error {
+// numberFormatsFor 는 미리 만든 열별 숫자 포맷을 반환한다. 매핑 없는 통화는 기본 패턴.
+func numberFormatsFor(isForeign bool, currency string) []*gsheets.NumberFormat {
 	if !isForeign {
-		return w.client.ApplyNumberFormatToColumns(ctx, sheetName, DomesticFormats, startRow, endRow)
+		return domesticNumberFormats
 	}
-
-	// 해외: 통화 무관 컬럼 일괄 적용.
-	if err := w.client.ApplyNumberFormatToColumns(ctx, sheetName, ForeignFormatsCommon, startRow, endRow); err != nil {
-		return err
+	if formats, ok := foreignNumberFormats[currency]; ok {
+		return formats
 	}
+	return foreignNumberFormats[""]
+}
 
-	// 해외: 통화별 외화 컬럼 행 단위 적용.
-	if len(trades) == 0 {
-		return nil
+// columnNumberFormats 는 0-based 열별 숫자 포맷을 만든다(nil = 포맷 없음).
+// 일자는 DATE(USER_ENTERED 로 "2026-02-13" 을 넣었을 때와 같은 yyyy-mm-dd), 종목코드는
+// TEXT, 나머지는 DomesticFormats / ForeignFormatsCommon + 통화별 외화 포맷.
+// (Python _apply_number_formats)
+func columnNumberFormats(isForeign bool, currency string, numCols int) []*gsheets.NumberFormat {
+	formats := make([]*gsheets.NumberFormat, numCols)
+	formats[0] = &gsheets.NumberFormat{Type: "DATE", Pattern: "yyyy-mm-dd"}
+
+	headers, common := DomesticHeaders, DomesticFormats
+	if isForeign {
+		headers, common = ForeignHeaders, ForeignFormatsCommon
+	}
+	if codeCol := indexOf(headers, "종목코드"); codeCol >= 0 {
+		formats[codeCol] = &gsheets.NumberFormat{Type: "TEXT", Pattern: "@"}
 	}
-	currencyRows := make(map[string][]int)
-	order := make([]string, 0)
-	for i, trade := range trades {
-		if _, ok := currencyRows[trade.Currency]; !ok {
-			order = append(order, trade.Currency)
+	for _, f := range common {
+		typ := f.Type
+		if typ == "" {
+			typ = "NUMBER"
 		}
-		currencyRows[trade.Currency] = append(currencyRows[trade.Currency], startRow+i)
+		formats[f.Col-1] = &gsheets.NumberFormat{Type: typ, Pattern: f.Pattern}
 	}
-
-	for _, currency := range order {
+	if isForeign {
 		pattern, ok := CurrencyPatterns[currency]
 		if !ok {
 			pattern = CurrencyPatternDefault
 		}
-		formats := make([]sheets.ColumnFormat, 0, len(ForeignCurrencyCols))
 		for _, col := range ForeignCurrencyCols {
-			formats = append(formats, sheets.ColumnFormat{Col: col, Pattern: pattern})
+			formats[col-1] = &gsheets.NumberFormat{Type: "NUMBER", Pattern: pattern}
 		}
-		// 연속 행 구간을 묶어 API 호출 최소화.
-		for _, rg := range groupConsecutiveRows(currencyRows[currency]) {
-			if err := w.client.ApplyNumberFormatToColumns(ctx, sheetName, formats, rg[0], rg[1]); err != nil {
-				return err
+	}
+	return formats
+}
+
+// sheetsEpoch 는 스프레드시트 날짜 시리얼 넘버의 기준일(0)이다.
+var sheetsEpoch = time.Date(1899, 12, 30, 0, 0, 0, 0, time.UTC)
+
+// rowData 는 시트 행 값을 numCols 열의 셀(값 + 숫자 포맷)로 변환한다(초과분 버림, 부족분 빈 셀).
+// 일자(col 0)는 USER_ENTERED 입력과 같은 결과가 되도록 날짜 시리얼 넘버로 넣는다.
+// Trade.ToDomesticRow/ToForeignRow 는 헤더 폭 그대로라 보정은 실제로 일어나지 않는다.
+// 셀은 행마다 배열 하나로 잡아 셀 단위 할당을 피한다. 셀 값으로 바꿀 수 없는 타입이면 에러.
+func rowData(row []interface{}, formats []*gsheets.NumberFormat, numCols int) (*gsheets.RowData, error) {
+	backing := make([]gsheets.CellData, numCols)
+	cells := make([]*gsheets.CellData, numCols)
+	for i := range cells {
+		cell := &backing[i]
+		if formats[i] != nil {
+			cell.UserEnteredFormat = &gsheets.CellFormat{NumberFormat: formats[i]}
+		}
+		if i < len(row) {
+			v, err := extendedValue(row[i], i == 0)
+			if err != nil {
+				return nil, fmt.Errorf("%d열: %w", i+1, err)
 			}
+			cell.UserEnteredValue = v
 		}
+		cells[i] = cell
 	}
-	return nil
+	return &gsheets.RowData{Values: cells}, nil
+}
+
+// extendedValue 는 행 값을 셀 값으로 변환한다(sheets.CellValue).
+// isDate 면 "2006-01-02" 문자열을 날짜 시리얼 넘버로 바꾼다. 그 밖의 일자 문자열은 일부러
+// 입력 그대로 텍스트로 둔다: 중복 키는 일자를 표시 문자열로 읽어 Trade.Date 와 비교하는데,
+// 다른 표기("2026.02.13" 등)를 날짜로 바꿔 yyyy-mm-dd 로 표시하면 다음 실행에서 키가 어긋나
+// 같은 거래가 다시 삽입된다. 텍스트로 두면 읽은 값이 Trade.Date 와 같아 중복 판정이 유지된다.
+func extendedValue(v interface{}, isDate bool) (*gsheets.ExtendedValue, error) {
+	if s, ok := v.(string); ok && isDate && s != "" {
+		if d, err := time.Parse("2006-01-02", s); err == nil {
+			serial := d.Sub(sheetsEpoch).Hours() / 24
+			return &gsheets.ExtendedValue{NumberValue: &serial}, nil
+		}
+		slog.Warn("일자가 yyyy-mm-dd 형식이 아니어서 텍스트로 기록", "date", s)
+	}
+	return sheets.CellValue(v)
 }
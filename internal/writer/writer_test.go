@@ -2,9 +2,12 @@ package writer
 
 import (
 	"testing"
+	"time"
 
 	"github.com/kenshin579/auto-trading-journal/internal/model"
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	gsheets "google.golang.org/api/sheets/v4"
 )
 
 func TestColLetter(t *testing.T) {
@@ -13,30 +16,122 @@ func TestColLetter(t *testing.T) {
 	assert.Equal(t, "AA", colLetter(27))
 	assert.Equal(t, "O", colLetter(15))
 	assert.Equal(t, "J", colLetter(10))
+	assert.Equal(t, "AZ", colLetter(52))
+	assert.Equal(t, "BA", colLetter(53))
+	assert.Equal(t, "ZZ", colLetter(702))
+	assert.Equal(t, "AAA", colLetter(703))
+	assert.Equal(t, "", colLetter(0))
 }
 
-func TestGroupConsecutiveRows(t *testing.T) {
-	assert.Equal(t, [][2]int{{2, 4}, {6, 6}}, groupConsecutiveRows([]int{2, 3, 4, 6}))
-	assert.Nil(t, groupConsecutiveRows(nil))
-	assert.Equal(t, [][2]int{{5, 5}}, groupConsecutiveRows([]int{5}))
-	// 정렬되지 않은 입력도 처리.
-	assert.Equal(t, [][2]int{{2, 4}, {7, 8}}, groupConsecutiveRows([]int{4, 2, 3, 8, 7}))
+func TestColumnNumberFormats(t *testing.T) {
+	dom := columnNumberFormats(false, "", len(DomesticHeaders))
+	require.Len(t, dom, 12)
+	assert.Equal(t, "DATE", dom[0].Type)
+	assert.Equal(t, "TEXT", dom[2].Type) // C: 종목코드
+	assert.Nil(t, dom[3])                // D: 종목명(포맷 없음)
+	assert.Equal(t, "₩#,##0", dom[7].Pattern)
+	assert.Equal(t, "PERCENT", dom[11].Type)
+
+	// 미지원 통화는 기본 외화 패턴.
+	fgn := columnNumberFormats(true, "XYZ", len(ForeignHeaders))
+	require.Len(t, fgn, 17)
+	assert.Equal(t, "TEXT", fgn[3].Type) // D: 종목코드
+	assert.Equal(t, CurrencyPatternDefault, fgn[8].Pattern)
+	assert.Equal(t, "#,##0.00", fgn[10].Pattern) // K: 환율(공통)
+}
+
+func TestNumberFormatsForSharesPrebuilt(t *testing.T) {
+	assert.Same(t, &domesticNumberFormats[0], &numberFormatsFor(false, "USD")[0], "국내는 통화 무관")
+	usd := numberFormatsFor(true, "USD")
+	assert.Same(t, &usd[0], &numberFormatsFor(true, "USD")[0], "호출마다 새로 만들지 않는다")
+	assert.Equal(t, "$#,##0.00", usd[8].Pattern)
+	// 매핑 없는 통화는 기본 패턴.
+	assert.Equal(t, CurrencyPatternDefault, numberFormatsFor(true, "XYZ")[8].Pattern)
+}
+
+// 시트 행 변환은 헤더 폭 그대로여야 rowData 의 보정(패딩·절삭)이 일어나지 않는다.
+func TestTradeRowsMatchHeaderWidth(t *testing.T) {
+	var tr model.Trade
+	assert.Len(t, tr.ToDomesticRow(), len(DomesticHeaders))
+	assert.Len(t, tr.ToForeignRow(), len(ForeignHeaders))
+}
+
+func TestRowDataPadsAndTruncates(t *testing.T) {
+	formats := make([]*gsheets.NumberFormat, 3)
+	short, err := rowData([]interface{}{"2026-02-13", 1.0}, formats, 3)
+	require.NoError(t, err)
+	require.Len(t, short.Values, 3)
+	assert.Nil(t, short.Values[2].UserEnteredValue, "부족분은 빈 셀")
+
+	long, err := rowData([]interface{}{"x", "y", "z", "초과"}, formats, 3)
+	require.NoError(t, err)
+	assert.Len(t, long.Values, 3, "초과분 버림")
+	// 날짜가 아닌 첫 열 값은 문자열 그대로.
+	assert.Equal(t, "x", *long.Values[0].UserEnteredValue.StringValue)
+}
+
+func TestExtendedValue(t *testing.T) {
+	// yyyy-mm-dd 일자는 날짜 시리얼 넘버.
+	v, err := extendedValue("2026-02-13", true)
+	require.NoError(t, err)
+	assert.Equal(t, float64(46066), *v.NumberValue)
+
+	// 다른 표기의 일자는 일부러 텍스트 그대로 둔다(읽은 값이 Trade.Date 와 같아야 중복 판정이 유지됨).
+	v, err = extendedValue("2026.02.13", true)
+	require.NoError(t, err)
+	require.NotNil(t, v.StringValue)
+	assert.Equal(t, "2026.02.13", *v.StringValue)
+	assert.Nil(t, v.NumberValue)
+
+	// 정수·bool 도 숫자/논리값으로.
+	v, err = extendedValue(3, false)
+	require.NoError(t, err)
+	assert.Equal(t, float64(3), *v.NumberValue)
+	v, err = extendedValue(int64(7), false)
+	require.NoError(t, err)
+	assert.Equal(t, float64(7), *v.NumberValue)
+	v, err = extendedValue(false, false)
+	require.NoError(t, err)
+	assert.False(t, *v.BoolValue)
+
+	// 숫자 같은 문자열도 파싱하지 않는다(종목코드 앞 0 보존).
+	v, err = extendedValue("005930", false)
+	require.NoError(t, err)
+	assert.Equal(t, "005930", *v.StringValue)
+
+	// 알 수 없는 타입은 조용히 텍스트로 바꾸지 않고 에러.
+	_, err = extendedValue(time.Now(), false)
+	assert.Error(t, err)
+	_, err = rowData([]interface{}{"2026-02-13", float32(1)}, make([]*gsheets.NumberFormat, 2), 2)
+	assert.ErrorContains(t, err, "2열")
 }
 
 func TestNormalizeNum(t *testing.T) {
-	// model.numStr 와 동일해야 중복 비교가 일치한다.
+	// Python _num_str 와 같이 정수면 소수점을 뺀다.
 	assert.Equal(t, "10", normalizeNum(10))
 	assert.Equal(t, "10.5", normalizeNum(10.5))
 	assert.Equal(t, "70000", normalizeNum(70000))
 	assert.Equal(t, "0", normalizeNum(0))
 }
 
-func TestNormalizeCellValue(t *testing.T) {
-	assert.Equal(t, "", normalizeCellValue(nil))
-	assert.Equal(t, "10", normalizeCellValue(float64(10)))
-	assert.Equal(t, "10.5", normalizeCellValue(float64(10.5)))
-	assert.Equal(t, "28230", normalizeCellValue("28,230"))
-	assert.Equal(t, "75000", normalizeCellValue("75000"))
+func TestKeyNum(t *testing.T) {
+	for _, tc := range []struct {
+		in   interface{}
+		want float64
+	}{
+		{float64(10), 10},
+		{float64(10.5), 10.5},
+		{"28,230", 28230},
+		{"75000", 75000},
+	} {
+		got, ok := keyNum(tc.in)
+		assert.True(t, ok, "%v", tc.in)
+		assert.Equal(t, tc.want, got, "%v", tc.in)
+	}
+	for _, in := range []interface{}{nil, "", "abc", true} {
+		_, ok := keyNum(in)
+		assert.False(t, ok, "%v 는 숫자가 아님", in)
+	}
 }
 
 func TestKeyColsForGrid(t *testing.T) {
@@ -46,6 +141,19 @@ func TestKeyColsForGrid(t *testing.T) {
 	assert.Equal(t, [3]int{4, 7, 8}, [3]int{n, q, p})
 }
 
+func TestSheetProfiles(t *testing.T) {
+	dom, fgn := profileFor(false), profileFor(true)
+	assert.Equal(t, 3, dom.codeCol) // C: 종목코드
+	assert.Equal(t, 4, fgn.codeCol) // D: 종목코드
+	assert.Equal(t, "H", dom.keyEndCol)
+	assert.Equal(t, "I", fgn.keyEndCol)
+	assert.Equal(t, "미래에셋증권_IRP!A2:H10000", keyRange("미래에셋증권_IRP", false))
+
+	var tr model.Trade
+	assert.Len(t, dom.toRow(tr), len(dom.headers))
+	assert.Len(t, fgn.toRow(tr), len(fgn.headers))
+}
+
 // TestKeyAgreement 는 그리드 셀에서 추출한 정규화 키가 model.Trade.DuplicateKey() 와
 // 동일한지 확인한다(중복 필터 동작의 핵심).
 func TestKeyAgreement(t *testing.T) {
@@ -56,16 +164,14 @@ func TestKeyAgreement(t *testing.T) {
 	dk := tr.DuplicateKey()
 
 	// 그리드에서 수량/단가가 숫자로 저장된 경우.
-	keyFromNum := model.DupKey{
-		"2026-02-13", "매도", "삼성전자",
-		normalizeCellValue(float64(10)), normalizeCellValue(float64(75000)),
-	}
-	assert.Equal(t, dk, keyFromNum)
+	keys := keysFromValues([][]interface{}{
+		{"2026-02-13", "매도", "005930", "삼성전자", "", "", float64(10), float64(75000)},
+	}, false)
+	assert.True(t, keys[dk])
 
 	// 그리드에서 단가가 "75,000" 문자열로 저장된 경우도 일치해야 한다.
-	keyFromStr := model.DupKey{
-		"2026-02-13", "매도", "삼성전자",
-		normalizeCellValue("10"), normalizeCellValue("75,000"),
-	}
-	assert.Equal(t, dk, keyFromStr)
+	keys = keysFromValues([][]interface{}{
+		{"2026-02-13", "매도", "005930", "삼성전자", "", "", "10", "75,000"},
+	}, false)
+	assert.True(t, keys[dk])
 }